@@ -1,11 +1,16 @@
 import uuid
-import asyncio
-from fastapi import APIRouter, Depends, Body, Request, HTTPException
+from fastapi import APIRouter, Depends, Request, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
 from app.Infrastructure.Database import getdb
 from app.Services.BotManagerService import BotManager
+from app.Services.BotManagerService.Errors import (
+    BotManagerError,
+    BotRunnerError,
+    BotTokenRequired
+)
+from app.Services.BotManagerService.Remote import RemoteBotManager
 from app.Services.BotManagerService.TelegramBotConfigService import \
     TelegramBotConfigService
 
@@ -21,6 +26,17 @@ class BotConfigUpdate(BaseModel):
     image_url: str | None = None
 
 
+def http_error(error: BotManagerError) -> HTTPException:
+    """
+    Ошибки управления ботами в HTTP-ответы.
+    """
+    if isinstance(error, BotTokenRequired):
+        return HTTPException(status_code=422, detail=str(error))
+    if isinstance(error, BotRunnerError):
+        return HTTPException(status_code=error.status, detail=error.detail)
+    return HTTPException(status_code=503, detail=str(error))
+
+
 @config_router.get("/stats")
 async def get_bots_stats(request: Request):
     """
@@ -29,30 +45,11 @@ async def get_bots_stats(request: Request):
     ВАЖНО: Этот эндпоинт должен быть ДО /{school_id},
     иначе FastAPI попытается интерпретировать 'stats' как UUID.
     """
-    bot_manager: BotManager = request.app.state.bot_manager
-
-    running_bots = []
-    stopped_bots = []
-
-    for school_id, bot_data in bot_manager.running_bots.items():
-        bot_info = {
-            "school_id": school_id,
-            "bot_name": bot_data.get("config", {}).get("bot_name", "Unknown"),
-            "is_running": not bot_data["task"].done()
-        }
-
-        if bot_info["is_running"]:
-            running_bots.append(bot_info)
-        else:
-            stopped_bots.append(bot_info)
-
-    return {
-        "total_bots": len(bot_manager.running_bots),
-        "running_count": len(running_bots),
-        "stopped_count": len(stopped_bots),
-        "running_bots": running_bots,
-        "stopped_bots": stopped_bots
-    }
+    bot_manager: BotManager | RemoteBotManager = request.app.state.bot_manager
+    try:
+        return await bot_manager.stats()
+    except BotManagerError as e:
+        raise http_error(e) from e
 
 
 @config_router.get("/{school_id}")
@@ -78,28 +75,25 @@ async def update_bot_config(
     """
     Обновляет настройки бота и *перезапускает* его.
     """
-    # 1. Обновляем данные в БД
-    service = TelegramBotConfigService(db)
-    updated_config_model = await service.UpdateOrCreate(
-        school_id,
-        settings.model_dump(exclude_unset=True)
-    )
-
-    # 2. Получаем Менеджер Ботов
-    bot_manager: BotManager = request.app.state.bot_manager
-
-    # 3. Конвертируем модель в dict для менеджера
-    config_dict = {
-        "school_id": str(updated_config_model.school_id),
-        "is_enabled": updated_config_model.is_enabled,
-        "bot_name": updated_config_model.bot_name,
-        "bot_token": updated_config_model.bot_token,
-        "welcome_message": updated_config_model.welcome_message,
-        "image_url": updated_config_model.image_url,
-    }
-
-    # 4. ВАЖНО: Ждем завершения перезапуска (убрали asyncio.create_task!)
-    restart_result = await bot_manager.restart_bot(config_dict)
+    try:
+        # 1. Обновляем данные в БД (включить бота без токена нельзя)
+        service = TelegramBotConfigService(db)
+        updated_config_model = await service.UpdateOrCreate(
+            school_id,
+            settings.model_dump(exclude_unset=True)
+        )
+
+        # 2. Получаем Менеджер Ботов (локальный или bot-runner)
+        bot_manager: BotManager | RemoteBotManager = request.app.state.bot_manager
+
+        # 3. Конвертируем модель в dict для менеджера
+        config_dict = TelegramBotConfigService.ToDict(updated_config_model)
+
+        # 4. ВАЖНО: Ждем завершения перезапуска (убрали asyncio.create_task!)
+        #    При шардировании чужого бота перезапустит его шард
+        restart_result = await bot_manager.apply_config(config_dict)
+    except BotManagerError as e:
+        raise http_error(e) from e
 
     return {
         "config": updated_config_model,
@@ -113,17 +107,8 @@ async def get_bot_status(
         request: Request
 ):
     """Проверяет, запущен ли бот"""
-    bot_manager: BotManager = request.app.state.bot_manager
-    school_id_str = str(school_id)
-
-    if school_id_str not in bot_manager.running_bots:
-        return {"status": "stopped", "school_id": school_id_str}
-
-    bot_data = bot_manager.running_bots[school_id_str]
-    is_running = not bot_data["task"].done()
-
-    return {
-        "status": "running" if is_running else "stopped",
-        "school_id": school_id_str,
-        "bot_name": bot_data.get("config", {}).get("bot_name")
-    }
+    bot_manager: BotManager | RemoteBotManager = request.app.state.bot_manager
+    try:
+        return await bot_manager.status(str(school_id))
+    except BotManagerError as e:
+        raise http_error(e) from e
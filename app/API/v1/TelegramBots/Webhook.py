@@ -0,0 +1,39 @@
+import uuid
+
+from fastapi import APIRouter, Body, Header, HTTPException, Request
+
+from app.Services.BotManagerService import BotManager
+from app.Services.BotManagerService.Errors import BotManagerError
+from app.Services.BotManagerService.Remote import RemoteBotManager
+from .Config import http_error
+
+webhook_router = APIRouter(prefix="/Webhook")
+
+
+@webhook_router.post("/{school_id}")
+async def telegram_webhook(
+        school_id: uuid.UUID,
+        request: Request,
+        update: dict = Body(...),
+        secret_token: str | None = Header(
+            None, alias="X-Telegram-Bot-Api-Secret-Token")
+):
+    """
+    Принимает апдейты Telegram для бота школы (режим BOT_UPDATES_MODE=webhook).
+
+    Апдейт обрабатывается в фоне: Telegram сразу получает 200 OK и не
+    повторяет доставку из-за медленного хэндлера.
+    """
+    bot_manager: BotManager | RemoteBotManager = request.app.state.bot_manager
+
+    try:
+        status = await bot_manager.feed_webhook_update(
+            str(school_id), secret_token, update)
+    except BotManagerError as e:
+        raise http_error(e) from e
+
+    if status == "not_found":
+        raise HTTPException(status_code=404, detail="Bot is not running")
+    if status == "forbidden":
+        raise HTTPException(status_code=403, detail="Invalid secret token")
+    return {"ok": True}
@@ -3,4 +3,7 @@ from fastapi import APIRouter
 bots_router = APIRouter(prefix="/Bots", tags=["Telegram Bots"])
 
 from .Config import config_router
-bots_router.include_router(config_router)
\ No newline at end of file
+bots_router.include_router(config_router)
+
+from .Webhook import webhook_router
+bots_router.include_router(webhook_router)
@@ -0,0 +1,40 @@
+import logging
+import os
+
+from dotenv import load_dotenv
+from redis.asyncio import Redis
+
+load_dotenv()
+
+# Пустой REDIS_URL - Redis не используется (один процесс, без шардирования ботов)
+REDIS_URL = os.getenv("REDIS_URL", "")
+
+
+class RedisClient:
+    """
+    Общее подключение к Redis на процесс.
+    """
+
+    def __init__(self, url: str = REDIS_URL):
+        self.url = url
+        self.redis: Redis | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.url)
+
+    async def connect(self) -> Redis:
+        if self.redis is None:
+            self.redis = Redis.from_url(self.url, decode_responses=True)
+            await self.redis.ping()
+            logging.info("✅ Подключение к Redis установлено")
+        return self.redis
+
+    async def disconnect(self):
+        if self.redis is not None:
+            await self.redis.aclose()
+            self.redis = None
+            logging.info("👋 Подключение к Redis закрыто")
+
+
+redis_client = RedisClient()
@@ -0,0 +1,31 @@
+class BotManagerError(Exception):
+    """
+    Ошибка управления ботами. HTTP-ответы из них делает слой API.
+    """
+
+
+class BotTokenRequired(BotManagerError):
+    """
+    Бота пытаются включить без токена.
+    """
+
+    def __init__(self, school_id):
+        super().__init__(f"bot_token is required to enable the bot of {school_id}")
+        self.school_id = str(school_id)
+
+
+class BotRunnerError(BotManagerError):
+    """
+    bot-runner ответил ошибкой (status и detail - из его ответа).
+    """
+
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+class BotRunnerUnavailable(BotManagerError):
+    """
+    bot-runner не отвечает по каналу управления.
+    """
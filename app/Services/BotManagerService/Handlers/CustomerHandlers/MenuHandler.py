@@ -1,26 +1,19 @@
-import os
 from datetime import datetime, timedelta
 
 from aiogram import Router
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
 from aiohttp import web
-from dotenv import load_dotenv
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.Services.BotManagerService.Platform import get_platform_client
 from app.Services.BotManagerService.Templates.CustomerMarkup import \
     CustomerMarkup
 from app.Services.BotManagerService.Templates.TeacherMarkup import \
     TeacherMarkup
-from app.Services.LeeearnService.PlatformClient import PlatformClient
 from app.Services.ModelServices.CustomerService import get_customer_by_user_id
 from app.Services.ModelServices.UserService import get_user_by_telegram_id
 
-load_dotenv()
-PLATFORM_API_URL = os.getenv("PLATFORM_API_URL")
-MAIN_PLATFORMA_API_ID = os.getenv("MAIN_PLATFORMA_API_ID")
-MAIN_PLATFORMA_API_ACCESS_TOKEN = os.getenv("MAIN_PLATFORMA_API_ACCESS_TOKEN")
-
 default_photo_url = "https://staticstorage.leeearn.ai/apps/student_bot/student_management_bot.png"
 
 
@@ -56,74 +49,41 @@ def customer_menu_handler() -> Router:
         Возвращает текущий урок (если он идёт прямо сейчас) или None.
         Учитывает сдвиг +2 часа между локальным временем и временем из платформы.
         """
-        client = PlatformClient(
-            PLATFORM_API_URL,
-            MAIN_PLATFORMA_API_ID,
-            MAIN_PLATFORMA_API_ACCESS_TOKEN
-        )
-        client.debug_logs = True
+        client = get_platform_client()
         branch = client.GetBranch(branch_id)
 
-        response = await branch.Customers.GetScheduleItemList(
-            customer_id=customer_id
-        )
-
-        all_data = response.json()
-        schedule_items = all_data.get('data', {}).get('data', [])
-
         # Текущее локальное время (с учётом сдвига)
         now = datetime.now()
         now = datetime(2025, 11, 6, 16, 10, 0)
 
-        for item in schedule_items:
-            item_date_str = item.get('date')
-            end_date_str = item.get('endDate')
-
-            if not item_date_str or not end_date_str:
-                continue
-
-            try:
-                start_dt = datetime.fromisoformat(item_date_str)
-                end_dt = datetime.fromisoformat(end_date_str)
-
-                # Добавляем +2 часа для выравнивания с нашим временем
-                start_dt += timedelta(hours=2)
-                end_dt += timedelta(hours=2)
-
-                # Проверяем, попадает ли текущее время в этот диапазон
-                if start_dt <= now <= end_dt:
-                    lesson_name = item.get('lesson', {}).get('name',
-                                                             'Без назви')
-
-                    return {
-                        "group": item.get("group", None).get("id", None),
-                        "lesson_id": item.get('id'),
-                        'lesson_name': lesson_name,
-                        'start_time': start_dt.strftime('%H:%M'),
-                        'end_time': end_dt.strftime('%H:%M'),
-                    }
-
-            except Exception as e:
-                if "year 0 is out of range" in str(e):
-                    print(
-                        f"Пропущено занятие (id: {item.get('id')}) с невалидной датой.")
-                else:
-                    print(
-                        f"Ошибка обработки занятия (id: {item.get('id')}): {e}")
+        # Запрашиваем только вчера/сегодня (урок мог начаться до полуночи)
+        schedule = await branch.Customers.GetScheduleIndex(
+            customer_id,
+            date_from=now.date() - timedelta(days=1),
+            date_to=now.date() + timedelta(days=1)
+        )
 
+        item = schedule.current_at(now)
         # Если ни один урок сейчас не идёт
-        return None
+        if item is None:
+            return None
+
+        # Название урока из прогретого справочника, без запроса к платформе
+        lesson_name = client.reference.name("lessons", branch_id, item.lesson_id,
+                                            default=item.lesson_name)
+        return {
+            "group": item.group_id,
+            "lesson_id": item.id,
+            'lesson_name': lesson_name,
+            'start_time': item.start_local.strftime('%H:%M'),
+            'end_time': item.end_local.strftime('%H:%M'),
+        }
 
     @customer_menu_router.callback_query(lambda c: c.data == "lesson_link")
     async def lesson_link(callback: CallbackQuery,
                           state: FSMContext,
                           db: AsyncSession):
-        client = PlatformClient(
-            PLATFORM_API_URL,
-            MAIN_PLATFORMA_API_ID,
-            MAIN_PLATFORMA_API_ACCESS_TOKEN
-        )
-        client.debug_logs = True
+        client = get_platform_client()
 
         user = await get_user_by_telegram_id(db, callback.from_user.id,
                                              with_roles=True)
@@ -141,12 +101,9 @@ def customer_menu_handler() -> Router:
 
         await callback.answer()
         group_id = lesson.get('group')
-        response = await branch.Groups.GetDetails(
-            group_id=group_id
-        )
-        group_data = response.json()
-        teacher_id = group_data.get(
-            'data', None).get('teacherList', None).get('$values')[0].get('teacherUserId')
+        # Детали группы из справочника, платформа только при промахе
+        group = await client.reference.details("groups", user.branch_id, group_id)
+        teacher_id = group['teacherList'][0].get('teacherUserId')
         contacts_response = await branch.Teachers.GetContacts(teacher_id)
         contacts = {contact["name"]: contact["value"] for contact in contacts_response.json().get('data', [])}
 
@@ -1,6 +1,4 @@
-import os
 import time
-from collections import defaultdict
 from datetime import datetime, timedelta
 
 from aiogram import Router, F
@@ -9,18 +7,21 @@ from aiogram.fsm.state import StatesGroup, State
 from aiogram.types import CallbackQuery, Message
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.Services.BotManagerService.Platform import get_platform_client
+from app.Services.LeeearnService.PlatformClient import ScheduleIndex
+from app.Services.LeeearnService.PlatformClient.slots import (
+    MINUTES_PER_DAY,
+    Intervals,
+    busy_intervals,
+    day_number,
+    parse_clock,
+    weekly_hours
+)
 from app.Services.BotManagerService.Templates.TeacherMarkup import TeacherMarkup
 from app.Services.BotManagerService.Templates.Text import Text
-from app.Services.LeeearnService.PlatformClient import PlatformClient
-from dotenv import load_dotenv
 
 from app.Services.ModelServices.UserService import get_user_by_telegram_id
 
-load_dotenv()
-PLATFORM_API_URL = os.getenv("PLATFORM_API_URL")
-MAIN_PLATFORMA_API_ID = os.getenv("MAIN_PLATFORMA_API_ID")
-MAIN_PLATFORMA_API_ACCESS_TOKEN = os.getenv("MAIN_PLATFORMA_API_ACCESS_TOKEN")
-
 
 def create_teacher_router_lessons() -> Router:
     teacher_router_lessons = Router()
@@ -49,6 +50,12 @@ def create_teacher_router_lessons() -> Router:
             reply_markup=await TeacherMarkup.move_lesson_acceptation()
         )
 
+    def upcoming_window():
+        """Поточний час і межа тижня вперед для списку уроків."""
+        now = datetime.now()
+        now = datetime(2025, 10, 10, 16, 10, 0)
+        return now, now + timedelta(days=7)
+
     async def get_upcoming_lessons(branch_id: str, teacher_id: str):
         """
         Возвращает два списка:
@@ -56,71 +63,30 @@ def create_teacher_router_lessons() -> Router:
           2️⃣ lesson_days — уникальные даты (дни), на которые есть уроки.
         Учитывает сдвиг +2 часа.
         """
-        client = PlatformClient(
-            PLATFORM_API_URL,
-            MAIN_PLATFORMA_API_ID,
-            MAIN_PLATFORMA_API_ACCESS_TOKEN
-        )
-        client.debug_logs = True
+        client = get_platform_client()
         branch = client.GetBranch(branch_id)
 
-        response = await branch.Teachers.GetScheduleItemList(
-            teacher_id=teacher_id
-        )
-
-        all_data = response.json()
-        schedule_items = all_data.get('data', {}).get('data', [])
-
-        now = datetime.now()
-        now = datetime(2025, 10, 10, 16, 10, 0)
-        one_week_ahead = now + timedelta(days=7)
-
-        upcoming_lessons = []
-        lesson_days = set()  # тимчасово зберігаємо унікальні дати
+        now, one_week_ahead = upcoming_window()
 
-        for item in schedule_items:
-            item_date_str = item.get('date')
-            end_date_str = item.get('endDate')
-
-            if not item_date_str or not end_date_str:
-                continue
-
-            try:
-                start_dt = datetime.fromisoformat(item_date_str)
-                end_dt = datetime.fromisoformat(end_date_str)
-
-                # Додаємо +2 години (враховуємо різницю з платформою)
-                start_dt += timedelta(hours=2)
-                end_dt += timedelta(hours=2)
-
-                # Фільтруємо: урок має бути в майбутньому і не далі ніж через 7 днів
-                if start_dt > now and start_dt <= one_week_ahead:
-                    lesson_name = item.get('lesson', {}).get('name',
-                                                             'Без назви')
-
-                    upcoming_lessons.append({
-                        "lesson_id": item.get('id'),
-                        'lesson_name': lesson_name,
-                        'start_time': start_dt.strftime('%Y-%m-%d %H:%M'),
-                        'end_time': end_dt.strftime('%Y-%m-%d %H:%M')
-                    })
-
-                    # Зберігаємо дату (лише день)
-                    lesson_days.add(start_dt.date())
-
-            except Exception as e:
-                if "year 0 is out of range" in str(e):
-                    print(
-                        f"Пропущено занятие (id: {item.get('id')}) с невалидной датой.")
-                else:
-                    print(
-                        f"Ошибка обработки занятия (id: {item.get('id')}): {e}")
+        # З платформи запитуються лише дні цього тижня; індекс кешується
+        # на клієнті й оновлюється за TTL
+        schedule = await branch.Teachers.GetScheduleIndex(
+            teacher_id,
+            date_from=now.date(),
+            date_to=one_week_ahead.date() + timedelta(days=1)
+        )
 
-        # Сортуємо за часом початку
-        upcoming_lessons.sort(key=lambda x: x['start_time'])
+        # Уроки, що починаються протягом тижня (час уже з урахуванням +2 годин)
+        upcoming_lessons = [{
+            "lesson_id": item.id,
+            'lesson_name': item.lesson_name,
+            'start_time': item.start_local.strftime('%Y-%m-%d %H:%M'),
+            'end_time': item.end_local.strftime('%Y-%m-%d %H:%M')
+        } for item in schedule.between(now, one_week_ahead)]
 
-        # Перетворюємо множину у список і сортуємо по даті
-        lesson_days = sorted([d.strftime('%Y-%m-%d') for d in lesson_days])
+        # Унікальні дати (лише день), відсортовані
+        lesson_days = [d.strftime('%Y-%m-%d')
+                       for d in schedule.days(now, one_week_ahead)]
 
         return upcoming_lessons, lesson_days
 
@@ -163,101 +129,46 @@ def create_teacher_router_lessons() -> Router:
                     reply_markup=await TeacherMarkup.choose_lesson(lessons_for_date)
                 )
 
-    def parse_schedule_input(schedule_input):
-        schedule = defaultdict(list)
-        for entry in schedule_input:
-            day = entry["day"]
-            from_time = entry["from"][:5]
-            to_time = entry["to"][:5]
-            schedule[day].append((from_time, to_time))
-        return schedule
-
     def get_upcoming_dates_with_slots(schedule_input, max_count=7):
         today = datetime.today().date()
         today = datetime(2025, 10, 10, 16, 10, 0).date()
-        schedule = parse_schedule_input(schedule_input)
-        result = []
-
-        current_date = today
-        while len(result) < max_count:
-            weekday = current_date.weekday()
-            if weekday in schedule:
-                result.append({
-                    "date": current_date.strftime("%Y-%m-%d"),
-                    "slots": schedule[weekday]
-                })
-            current_date += timedelta(days=1)
-
-            # Stop early if пройшли всі доступні дні в розкладі (макс 14 днів вперед)
-            if (
-                    current_date - today).days > 30:  # failsafe: не зациклюватись вічно
-                break
-
-        return result
-
-    def parse_datetime(dt_str: str) -> datetime:
-        """Парсить дату з рядка у datetime."""
-        return datetime.strptime(dt_str, "%Y-%m-%dT%H:%M:%S")
+
+        # Робочі години на 31 день вперед (failsafe: не зациклюватись вічно)
+        working_hours = weekly_hours(schedule_input, today, 31).by_day()
+
+        return [{
+            "date": day.strftime("%Y-%m-%d"),
+            "slots": slots
+        } for day, slots in list(working_hours.items())[:max_count]]
 
     def remove_occupied_slots(slots_by_date: list[dict],
-                              upcoming_lessons: list[dict]) -> list[dict]:
-        updated_slots = []
-
-        for day_entry in slots_by_date:
-            date_str = day_entry["date"]
-            slots = day_entry["slots"]
-            date_obj = datetime.strptime(date_str,
-                                         "%Y-%m-%d").date()  # <--- саме .date()
-
-            # Залишаємо лише уроки цього дня, але з урахуванням +2 годин
-            day_lessons = []
-            for lesson in upcoming_lessons:
-                lesson_start = parse_datetime(lesson["date"]) + timedelta(
-                    hours=2)
-                if lesson_start.date() == date_obj:
-                    lesson_end_raw = parse_datetime(lesson["endDate"])
-                    if lesson_end_raw.year == 1:
-                        raise ValueError("Invalid endDate")
-                    lesson_end = lesson_end_raw + timedelta(hours=2)
-
-                    day_lessons.append((lesson_start, lesson_end,
-                                        lesson))  # додали і lesson для тривалості
-
-            for lesson_start, lesson_end, lesson in day_lessons:
-                # Якщо немає endDate, fallback на minutesEstimated
-                if not lesson_end:
-                    minutes = lesson["lesson"].get("minutesEstimated", 30)
-                    lesson_end = lesson_start + timedelta(minutes=minutes)
-
-                new_slots = []
-                for free_from, free_to in slots:
-                    slot_start = datetime.combine(date_obj,
-                                                  datetime.strptime(free_from,
-                                                                    "%H:%M").time())
-                    slot_end = datetime.combine(date_obj,
-                                                datetime.strptime(free_to,
-                                                                  "%H:%M").time())
-
-                    # Якщо немає перетину — залишаємо як є
-                    if lesson_end <= slot_start or lesson_start >= slot_end:
-                        new_slots.append((free_from, free_to))
-                    else:
-                        # Відрізаємо заняту частину
-                        if lesson_start > slot_start:
-                            new_slots.append((slot_start.strftime("%H:%M"),
-                                              lesson_start.strftime("%H:%M")))
-                        if lesson_end < slot_end:
-                            new_slots.append((lesson_end.strftime("%H:%M"),
-                                              slot_end.strftime("%H:%M")))
-
-                slots = new_slots
-
-            updated_slots.append({
-                "date": date_str,
-                "slots": slots
-            })
-
-        return updated_slots
+                              schedule: ScheduleIndex) -> list[dict]:
+        if not slots_by_date:
+            return []
+
+        dates = [datetime.strptime(day_entry["date"], "%Y-%m-%d").date()
+                 for day_entry in slots_by_date]
+
+        # Вільні слоти як інтервали у хвилинах (час уже з урахуванням +2 годин)
+        working = Intervals.from_pairs(
+            (day_number(date_obj) * MINUTES_PER_DAY + parse_clock(free_from),
+             day_number(date_obj) * MINUTES_PER_DAY + parse_clock(free_to))
+            for date_obj, day_entry in zip(dates, slots_by_date)
+            for free_from, free_to in day_entry["slots"]
+        )
+
+        # Уроки цих днів, включно з тими, що почались напередодні ввечері
+        first_day = datetime.combine(min(dates), datetime.min.time())
+        last_day = datetime.combine(max(dates), datetime.min.time())
+        lessons = schedule.between(first_day - timedelta(days=1),
+                                   last_day + timedelta(days=1))
+
+        free_by_day = working.subtract(busy_intervals(lessons)).by_day()
+
+        return [{
+            "date": day_entry["date"],
+            "slots": free_by_day.get(date_obj, [])
+        } for date_obj, day_entry in zip(dates, slots_by_date)]
 
     @teacher_router_lessons.callback_query(F.data.startswith("choose_lesson:"))
     async def choose_lesson(callback: CallbackQuery, state: FSMContext,
@@ -266,31 +177,23 @@ def create_teacher_router_lessons() -> Router:
                                              with_roles=True)
         lesson_id = callback.data.split(":")[1]
         await state.update_data(user_id=user.id, lesson_id=lesson_id)
-        client = PlatformClient(
-            PLATFORM_API_URL,
-            MAIN_PLATFORMA_API_ID,
-            MAIN_PLATFORMA_API_ACCESS_TOKEN
-        )
-        client.debug_logs = True
+        client = get_platform_client()
         branch = client.GetBranch(user.branch_id)
 
-        lessons_items = await branch.Teachers.GetScheduleItemList(
-            teacher_id=user.id
+        # Урок обирали зі списку на тиждень вперед — той самий індекс
+        now, one_week_ahead = upcoming_window()
+        upcoming = await branch.Teachers.GetScheduleIndex(
+            user.id,
+            date_from=now.date(),
+            date_to=one_week_ahead.date() + timedelta(days=1)
         )
-        all_data = lessons_items.json()
-        schedule_items = all_data.get('data', {}).get('data', [])
-        schedule_item = None
-
-        for item in schedule_items:
-            if item.get("id") == lesson_id:
-                schedule_item = item
-                group_id = schedule_item.get('group').get('id')
-
-            if schedule_item:
-                break
+        schedule_item = upcoming.by_id(lesson_id)
 
         if not schedule_item:
             await callback.answer("❌ Уроку не знайдено.")
+            return
+
+        group_id = schedule_item.group_id
 
         today = datetime.utcnow().date()
         two_weeks_later = today + timedelta(weeks=2)
@@ -302,15 +205,24 @@ def create_teacher_router_lessons() -> Router:
                 "to": two_weeks_later.strftime("%Y-%m-%d")
             }
         )
-        teacher_work_days = response.json().get(
-            "data").get("regularScheduleInputRequests").get("$values", None)
+        teacher_work_days = response.data().get(
+            "regularScheduleInputRequests", [])
         if len(teacher_work_days) == 0:
             await callback.answer("❌ Не встановлений графік.")
             return
 
         teacher_dirty_slots = get_upcoming_dates_with_slots(teacher_work_days)
+
+        # Зайняті уроки лише за дні зі слотами (плюс попередній вечір)
+        slot_days = [datetime.strptime(day_entry["date"], "%Y-%m-%d").date()
+                     for day_entry in teacher_dirty_slots] or [now.date()]
+        schedule = await branch.Teachers.GetScheduleIndex(
+            user.id,
+            date_from=min(slot_days) - timedelta(days=1),
+            date_to=max(slot_days) + timedelta(days=1)
+        )
         cleaned_teacher_slots = remove_occupied_slots(teacher_dirty_slots,
-                                                      schedule_items)
+                                                      schedule)
 
         await callback.message.edit_caption(
             caption="Оберіть дату на яку бажаєте перенести урок:",
@@ -358,12 +270,7 @@ def create_teacher_router_lessons() -> Router:
 
         user = await get_user_by_telegram_id(db, message.from_user.id,
                                              with_roles=True)
-        client = PlatformClient(
-            PLATFORM_API_URL,
-            MAIN_PLATFORMA_API_ID,
-            MAIN_PLATFORMA_API_ACCESS_TOKEN
-        )
-        client.debug_logs = True
+        client = get_platform_client()
         branch = client.GetBranch(user.branch_id)
         try:
             response = await branch.GroupSchedule.Move(
@@ -424,64 +331,35 @@ def create_teacher_router_lessons() -> Router:
         Возвращает текущий урок (если он идёт прямо сейчас) или None.
         Учитывает сдвиг +2 часа между локальным временем и временем из платформы.
         """
-        client = PlatformClient(
-            PLATFORM_API_URL,
-            MAIN_PLATFORMA_API_ID,
-            MAIN_PLATFORMA_API_ACCESS_TOKEN
-        )
-        client.debug_logs = True
+        client = get_platform_client()
         branch = client.GetBranch(branch_id)
 
-        response = await branch.Teachers.GetScheduleItemList(
-            teacher_id=teacher_id
-        )
-
-        all_data = response.json()
-        schedule_items = all_data.get('data', {}).get('data', [])
-
         # Текущее локальное время (с учётом сдвига)
         now = datetime.now()
         now = datetime(2025, 10, 30, 16, 10, 0)
 
-        for item in schedule_items:
-            item_date_str = item.get('date')
-            end_date_str = item.get('endDate')
-
-            if not item_date_str or not end_date_str:
-                continue
-
-            try:
-                start_dt = datetime.fromisoformat(item_date_str)
-                end_dt = datetime.fromisoformat(end_date_str)
-
-                # Добавляем +2 часа для выравнивания с нашим временем
-                start_dt += timedelta(hours=2)
-                end_dt += timedelta(hours=2)
-
-                # Проверяем, попадает ли текущее время в этот диапазон
-                if start_dt <= now <= end_dt:
-                    lesson_name = item.get('lesson', {}).get('name',
-                                                             'Без назви')
-
-                    print(item)
-                    return {
-                        "group": item.get("group", None).get("id", None),
-                        "lesson_id": item.get('id'),
-                        'lesson_name': lesson_name,
-                        'start_time': start_dt.strftime('%H:%M'),
-                        'end_time': end_dt.strftime('%H:%M'),
-                    }
-
-            except Exception as e:
-                if "year 0 is out of range" in str(e):
-                    print(
-                        f"Пропущено занятие (id: {item.get('id')}) с невалидной датой.")
-                else:
-                    print(
-                        f"Ошибка обработки занятия (id: {item.get('id')}): {e}")
+        # Запрашиваем только вчера/сегодня (урок мог начаться до полуночи)
+        schedule = await branch.Teachers.GetScheduleIndex(
+            teacher_id,
+            date_from=now.date() - timedelta(days=1),
+            date_to=now.date() + timedelta(days=1)
+        )
 
+        item = schedule.current_at(now)
         # Если ни один урок сейчас не идёт
-        return None
+        if item is None:
+            return None
+
+        # Название урока из прогретого справочника, без запроса к платформе
+        lesson_name = client.reference.name("lessons", branch_id, item.lesson_id,
+                                            default=item.lesson_name)
+        return {
+            "group": item.group_id,
+            "lesson_id": item.id,
+            'lesson_name': lesson_name,
+            'start_time': item.start_local.strftime('%H:%M'),
+            'end_time': item.end_local.strftime('%H:%M'),
+        }
 
     @teacher_router_lessons.callback_query(
         lambda c: c.data == "lesson_confirm_students")
@@ -501,20 +379,15 @@ def create_teacher_router_lessons() -> Router:
             )
             return
 
-        client = PlatformClient(
-            PLATFORM_API_URL,
-            MAIN_PLATFORMA_API_ID,
-            MAIN_PLATFORMA_API_ACCESS_TOKEN
-        )
-        client.debug_logs = True
-        branch = client.GetBranch(user.branch_id)
+        client = get_platform_client()
         if lesson and lesson.get('group') and lesson.get('lesson_id'):
-            lesson_students = (await branch.GroupSchedule.GetDetails(
-                group_id=lesson.get('group'),
-                data=lesson.get('lesson_id')
-            )).json()
+            # Ученики урока из справочника; отметка присутствия его сбрасывает
+            lesson_students = await client.reference.details(
+                "group_lessons", user.branch_id, lesson.get('lesson_id'),
+                groupId=lesson.get('group')
+            )
             students = []
-            for student in lesson_students["data"]["studentList"]["$values"]:
+            for student in lesson_students["studentList"]:
                 if student["managerConfirmed"] is False:
                     students.append({student["studentUser"]["displayName"]:
                                          student["studentUserId"]})
@@ -543,12 +416,7 @@ def create_teacher_router_lessons() -> Router:
                                              with_roles=True)
         data = callback.data.split(":")[1]
 
-        client = PlatformClient(
-            PLATFORM_API_URL,
-            MAIN_PLATFORMA_API_ID,
-            MAIN_PLATFORMA_API_ACCESS_TOKEN
-        )
-        client.debug_logs = True
+        client = get_platform_client()
         branch = client.GetBranch(user.branch_id)
 
         lesson = await get_current_lesson(
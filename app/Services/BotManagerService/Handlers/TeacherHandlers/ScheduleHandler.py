@@ -1,5 +1,4 @@
-import os
-from datetime import timedelta, datetime
+from datetime import datetime, timedelta
 
 from aiogram import Router, F
 from aiogram.fsm.context import FSMContext
@@ -7,16 +6,10 @@ from aiogram.types import CallbackQuery
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.Services import get_now
+from app.Services.BotManagerService.Platform import get_platform_client
 from app.Services.BotManagerService.Templates.TeacherMarkup import TeacherMarkup
 from app.Services.BotManagerService.Templates.Text import Text
-from app.Services.LeeearnService.PlatformClient import PlatformClient
-from dotenv import load_dotenv
 
-
-load_dotenv()
-PLATFORM_API_URL = os.getenv("PLATFORM_API_URL")
-MAIN_PLATFORMA_API_ID = os.getenv("MAIN_PLATFORMA_API_ID")
-MAIN_PLATFORMA_API_ACCESS_TOKEN = os.getenv("MAIN_PLATFORMA_API_ACCESS_TOKEN")
 COMPANY_BRANCH_ID = "0938cb91-f780-401a-b18c-f88f34f3fa80"
 
 
@@ -64,54 +57,21 @@ def create_teacher_router_schedule() -> Router:
 
 
 async def get_schedule(target_date: str):
-    client = PlatformClient(
-        PLATFORM_API_URL,
-        MAIN_PLATFORMA_API_ID,
-        MAIN_PLATFORMA_API_ACCESS_TOKEN
-    )
-    client.debug_logs = True
+    client = get_platform_client()
     branch = client.GetBranch(COMPANY_BRANCH_ID)
 
-    response = await branch.Teachers.GetScheduleItemList(
-        teacher_id="61cbda1b-844b-4d6b-86b8-3fe8687628ee"
-    )
-
-    all_data = response.json()
-
-    schedule_items = all_data.get('data', {}).get('data', [])
-
-    formatted_schedule = []
-
-    for item in schedule_items:
-        item_date_str = item.get('date')
+    # День считается по местному времени (+2 часа), как и выводимое время
+    day = datetime.strptime(target_date, '%Y-%m-%d').date()
 
-        if item_date_str and item_date_str.startswith(target_date):
-
-            try:
-                lesson_name = item.get('lesson', {}).get('name', 'Без назви')
-                start_dt = datetime.fromisoformat(item_date_str)
-                start_dt_adjusted = start_dt + timedelta(hours=2)
-                start_time_formatted = start_dt_adjusted.strftime('%H:%M')
-
-                end_time_formatted = "--:--"  # <-- Заглушка по умолчанию
-                end_date_str = item.get('endDate')
-
-                if end_date_str:
-                    try:
-                        end_dt = datetime.fromisoformat(end_date_str)
-                        end_dt_adjusted = end_dt + timedelta(hours=2)
-                        end_time_formatted = end_dt_adjusted.strftime('%H:%M')
-                    except ValueError:
-                        pass
-
-                formatted_schedule.append({
-                    'lesson_name': lesson_name,
-                    'start_time': start_time_formatted,
-                    'end_time': end_time_formatted
-                })
-
-            except Exception as e:
-                print(
-                    f"Ошибка обработки занятия (id: {item.get('id')}). Невалидная start_date: {e}")
+    # С платформы запрашивается только этот день
+    schedule = await branch.Teachers.GetScheduleIndex(
+        "61cbda1b-844b-4d6b-86b8-3fe8687628ee",
+        date_from=day,
+        date_to=day + timedelta(days=1)
+    )
 
-    return formatted_schedule
+    return [{
+        'lesson_name': item.lesson_name,
+        'start_time': item.start_local.strftime('%H:%M'),
+        'end_time': item.end_local.strftime('%H:%M')
+    } for item in schedule.by_day(day)]
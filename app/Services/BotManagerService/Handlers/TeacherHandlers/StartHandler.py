@@ -10,6 +10,7 @@ from app.Objects.BranchRoleModel import BranchRole
 from app.Objects.UserModel import User
 from app.Services.BotManagerService.Images import default_teacher_image, \
     default_coordinator_image, default_student_image
+from app.Services.BotManagerService.Platform import school_branch_id
 
 from app.Services.BotManagerService.Templates.CustomerMarkup import \
     CustomerMarkup
@@ -43,7 +44,7 @@ async def start(
 
     await state.clear()
 
-    branch_id = uuid.UUID(config.get("school_id"))
+    branch_id = school_branch_id(config.get("school_id"))
 
 
     if config.get("image_url", None):
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import os
+
+from dotenv import load_dotenv
+
+from app.Infrastructure.Database import async_session
+from app.Infrastructure.Redis import redis_client
+
+from . import BotManager
+from .Platform import get_platform_client, school_branch_ids
+from .Sharding import BotShardCoordinator
+from .TelegramBotConfigService import TelegramBotConfigService
+
+load_dotenv()
+# Сколько секунд старт ждёт прогрева справочников платформы
+REFERENCE_WARMUP_TIMEOUT = float(os.getenv("REFERENCE_WARMUP_TIMEOUT", "20"))
+
+
+async def warm_reference(reference, school_ids: list[str]):
+    """
+    Прогрев справочников филиалов этих школ не должен задерживать или ронять
+    старт приложения.
+    """
+    try:
+        loaded = await asyncio.wait_for(reference.warm(school_branch_ids(school_ids)),
+                                        timeout=REFERENCE_WARMUP_TIMEOUT)
+        logging.info(f"📚 Справочники загружены: {loaded}, {reference.stats()}")
+    except asyncio.TimeoutError:
+        logging.warning("⚠️ Прогрев справочников не уложился в таймаут, "
+                        "догрузятся при следующем фоновом обновлении.")
+
+
+async def load_enabled_configs() -> list[dict]:
+    """
+    Конфиги всех включенных ботов из БД.
+    """
+    async with async_session() as session:
+        configs = await TelegramBotConfigService(session).GetAllEnabled()
+    return [TelegramBotConfigService.ToDict(config) for config in configs]
+
+
+async def start_bots(bot_manager: BotManager):
+    """
+    Запускает включенных ботов (или свою долю при шардировании через Redis)
+    и прогревает справочники платформы для их хэндлеров.
+    """
+    logging.info("Загрузка и запуск активных ботов из БД...")
+    enabled_bots_configs = await load_enabled_configs()
+
+    # Справочники (курсы, направления, теги, ...) нужны хэндлерам запущенных ботов
+    reference = get_platform_client().reference
+
+    if redis_client.enabled and bot_manager.mode == "polling":
+        # Несколько воркеров: каждый запускает только свою долю ботов
+        # и держит справочники только своих школ
+        bot_manager.shards = BotShardCoordinator(
+            bot_manager, await redis_client.connect(), load_enabled_configs,
+            on_leases=lambda school_ids: reference.track(school_branch_ids(school_ids)))
+        # Первый шаг только отмечает шард живым: ботов он возьмет, когда
+        # кольцо устоится (через BOT_SHARD_LEASE_TTL), а справочники их школ
+        # догрузит reference.track
+        await bot_manager.shards.reconcile()
+        reference.start()
+        bot_manager.shards.start()
+    else:
+        # Справочники греем параллельно с ботами
+        school_ids = [config["school_id"] for config in enabled_bots_configs]
+        await asyncio.gather(*(bot_manager.start_bot(config)
+                               for config in enabled_bots_configs),
+                             warm_reference(reference, school_ids))
+        reference.start(school_branch_ids(school_ids))
+    logging.info(
+        f"✅ Запущено {len(bot_manager.running_bots)} из "
+        f"{len(enabled_bots_configs)} ботов при старте.")
+
+
+async def stop_bots(bot_manager: BotManager):
+    """
+    Останавливает ботов и шард.
+    """
+    if bot_manager.shards:
+        await bot_manager.shards.stop()
+    await bot_manager.stop_all_bots()
+    await redis_client.disconnect()
@@ -1,8 +1,17 @@
-from typing import Callable, Dict, Any, Awaitable
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Callable, Dict, Any, Awaitable
 from aiogram import BaseMiddleware
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware, NextRequestMiddlewareType)
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
 from aiogram.types import TelegramObject
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
 
+if TYPE_CHECKING:
+    from aiogram import Bot
+
 class DbSessionMiddleware(BaseMiddleware):
     def __init__(self, session_pool: async_sessionmaker[AsyncSession]):
         self.session_pool = session_pool
@@ -15,4 +24,80 @@ class DbSessionMiddleware(BaseMiddleware):
     ) -> Any:
         async with self.session_pool() as session:
             data["db"] = session
-            return await handler(event, data)
\ No newline at end of file
+            return await handler(event, data)
+
+class BotConfigMiddleware(BaseMiddleware):
+    """
+    Подставляет конфиг школы в data["config"] по id бота, получившего апдейт.
+    Один диспетчер обслуживает всех ботов, поэтому конфиг берется отсюда.
+    """
+
+    def __init__(self, configs: Dict[int, dict]):
+        self.configs = configs
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        config = self.configs.get(data["bot"].id)
+        if config is None:
+            # Бот уже остановлен - апдейт больше некому обрабатывать
+            return None
+        data["config"] = config
+        return await handler(event, data)
+
+
+class BotRequestStatsMiddleware(BaseRequestMiddleware):
+    """
+    Считает запросы к Bot API отдельно для каждого бота (по id из токена):
+    все боты ходят через одну HTTP-сессию, поэтому учет ведется здесь.
+    """
+
+    def __init__(self):
+        self.bots: Dict[int, Dict[str, Any]] = {}
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: "Bot",
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        stats = self.bots.get(bot.id)
+        if stats is None:
+            stats = self.bots[bot.id] = {
+                "requests": 0, "errors": 0, "in_flight": 0,
+                "seconds": 0.0, "methods": Counter()
+            }
+
+        stats["requests"] += 1
+        stats["in_flight"] += 1
+        stats["methods"][method.__api_method__] += 1
+        started = time.monotonic()
+        try:
+            return await make_request(bot, method)
+        except Exception:
+            stats["errors"] += 1
+            raise
+        finally:
+            stats["in_flight"] -= 1
+            # getUpdates висит весь long-poll, в среднее время его не берем
+            if method.__api_method__ != "getUpdates":
+                stats["seconds"] += time.monotonic() - started
+
+    def forget(self, bot_id: int):
+        self.bots.pop(bot_id, None)
+
+    def stats(self, bot_id: int) -> dict | None:
+        stats = self.bots.get(bot_id)
+        if stats is None:
+            return None
+        calls = stats["requests"] - stats["methods"].get("getUpdates", 0)
+        return {
+            "requests": stats["requests"],
+            "errors": stats["errors"],
+            "in_flight": stats["in_flight"],
+            "avg_ms": round(stats["seconds"] / calls * 1000, 1) if calls else 0.0,
+            "methods": dict(stats["methods"]),
+        }
@@ -0,0 +1,85 @@
+import logging
+import os
+from typing import Iterable
+
+from dotenv import load_dotenv
+
+from app.Services.LeeearnService.PlatformClient import (
+    CircuitBreaker,
+    PlatformClient,
+    ResponseCache,
+    SnapshotStore,
+    clients,
+    limiter_for,
+    set_codec
+)
+from app.Services.LeeearnService.PlatformClient.types import SafeUUID
+
+load_dotenv()
+PLATFORM_API_URL = os.getenv("PLATFORM_API_URL")
+MAIN_PLATFORMA_API_ID = os.getenv("MAIN_PLATFORMA_API_ID")
+MAIN_PLATFORMA_API_ACCESS_TOKEN = os.getenv("MAIN_PLATFORMA_API_ACCESS_TOKEN")
+# json (по умолчанию), orjson, msgspec или auto
+PLATFORM_JSON_CODEC = os.getenv("PLATFORM_JSON_CODEC")
+# Лимит запросов на один API ID платформы (запросов в секунду и размер всплеска)
+PLATFORM_RATE_LIMIT = float(os.getenv("PLATFORM_RATE_LIMIT", "10"))
+PLATFORM_RATE_BURST = int(os.getenv("PLATFORM_RATE_BURST", "20"))
+# Дублировать медленные чтения после p95 задержки эндпоинта (1/0)
+PLATFORM_HEDGE_READS = os.getenv("PLATFORM_HEDGE_READS", "0") == "1"
+# Фильтровать окна расписания на сервере (1/0). Значения CompareType не
+# подтверждены платформой, поэтому первое окно каждого эндпоинта сверяется
+# с полным списком
+PLATFORM_SCHEDULE_WINDOWS = os.getenv("PLATFORM_SCHEDULE_WINDOWS", "0") == "1"
+
+if PLATFORM_JSON_CODEC:
+    set_codec(PLATFORM_JSON_CODEC)
+
+
+def get_platform_client() -> PlatformClient:
+    """
+    Общий клиент платформы для хэндлеров ботов (один пул соединений и кэш ответов).
+    """
+    client = clients.get(
+        PLATFORM_API_URL,
+        MAIN_PLATFORMA_API_ID,
+        MAIN_PLATFORMA_API_ACCESS_TOKEN
+    )
+    if client.cache is None:
+        client.cache = ResponseCache()
+    if client.snapshots is None:
+        client.snapshots = SnapshotStore()
+    if client.limiter is None:
+        client.limiter = limiter_for(
+            client.api_id, PLATFORM_RATE_LIMIT, PLATFORM_RATE_BURST
+        )
+    if client.breaker is None:
+        # Пока платформа лежит, чтения отдают последний удачный ответ из кэша
+        client.breaker = CircuitBreaker()
+    client.policy.hedge = PLATFORM_HEDGE_READS
+    client.schedule_windows.enabled = PLATFORM_SCHEDULE_WINDOWS
+    client.debug_logs = True
+    return client
+
+
+def school_branch_id(school_id) -> SafeUUID:
+    """
+    Филиал платформы, который обслуживает школа: school_id конфига бота —
+    это id филиала (по нему StartHandler сверяет branch_id пользователя).
+    """
+    return SafeUUID(school_id)
+
+
+def school_branch_ids(school_ids: Iterable) -> list[SafeUUID]:
+    """
+    Филиалы платформы для списка школ, без повторов. Школы, чей id не
+    является id филиала, пропускаются с предупреждением.
+    """
+    branch_ids = {}
+    for school_id in school_ids:
+        try:
+            branch_id = school_branch_id(school_id)
+        except (TypeError, ValueError):
+            logging.warning(f"⚠️ school_id {school_id!r} не является id филиала платформы")
+            continue
+        branch_ids.setdefault(str(branch_id), branch_id)
+    return list(branch_ids.values())
@@ -0,0 +1,86 @@
+import logging
+import os
+
+import aiohttp
+from dotenv import load_dotenv
+
+from .Errors import BotRunnerError, BotRunnerUnavailable
+
+load_dotenv()
+# Адрес канала управления bot-runner (python -m app.bot_runner).
+# Пустой - боты работают в процессе API, как раньше
+BOT_RUNNER_URL = os.getenv("BOT_RUNNER_URL", "")
+# Общий секрет API и bot-runner для канала управления
+BOT_RUNNER_TOKEN = os.getenv("BOT_RUNNER_TOKEN", "")
+BOT_RUNNER_TOKEN_HEADER = "X-Bot-Runner-Token"
+# Сколько секунд API ждет ответа bot-runner (перезапуск бота занимает до ~11 с)
+BOT_RUNNER_TIMEOUT = float(os.getenv("BOT_RUNNER_TIMEOUT", "30"))
+
+
+class RemoteBotManager:
+    """
+    BotManager в отдельном процессе bot-runner: те же методы, что нужны API,
+    но через локальный HTTP-канал управления. Боты и их хэндлеры не делят
+    цикл событий с API и масштабируются отдельно.
+    """
+
+    def __init__(self, url: str = BOT_RUNNER_URL, token: str = BOT_RUNNER_TOKEN,
+                 timeout: float = BOT_RUNNER_TIMEOUT):
+        self.url = url.rstrip("/")
+        self.token = token
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._session: aiohttp.ClientSession | None = None
+
+    async def _call(self, method: str, path: str, json: dict | None = None,
+                    headers: dict | None = None) -> dict:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                headers={BOT_RUNNER_TOKEN_HEADER: self.token} if self.token else None
+            )
+        try:
+            async with self._session.request(method, self.url + path, json=json,
+                                             headers=headers) as response:
+                if response.status >= 400:
+                    raise BotRunnerError(response.status, await response.text())
+                return await response.json()
+        except (aiohttp.ClientError, TimeoutError) as e:
+            logging.error(f"❌ bot-runner недоступен ({self.url}{path}): {e}")
+            raise BotRunnerUnavailable("Bot runner is unavailable") from e
+
+    async def start_bot(self, config: dict):
+        return await self._call("POST", "/bots/start", json=config)
+
+    async def stop_bot(self, school_id: str):
+        return await self._call("POST", f"/bots/{school_id}/stop")
+
+    async def restart_bot(self, config: dict):
+        return await self._call("POST", f"/bots/{config['school_id']}/restart",
+                                json=config)
+
+    async def apply_config(self, config: dict):
+        return await self._call("POST", f"/bots/{config['school_id']}/config",
+                                json=config)
+
+    async def status(self, school_id: str) -> dict:
+        return await self._call("GET", f"/bots/{school_id}/status")
+
+    async def stats(self) -> dict:
+        return await self._call("GET", "/stats")
+
+    async def feed_webhook_update(self, school_id: str, secret: str | None,
+                                  update: dict) -> str:
+        result = await self._call(
+            "POST", f"/bots/{school_id}/update", json=update,
+            headers={"X-Telegram-Bot-Api-Secret-Token": secret} if secret else None
+        )
+        return result["status"]
+
+    async def stop_all_bots(self):
+        """
+        Боты принадлежат bot-runner и переживают перезапуск API:
+        закрываем только соединение с каналом управления.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -0,0 +1,50 @@
+import os
+
+from aiogram.client.session.aiohttp import AiohttpSession
+
+from .Middleware import BotRequestStatsMiddleware
+
+# Соединений к api.telegram.org на всех ботов сразу. В режиме polling каждый
+# бот держит одно соединение под long-poll getUpdates
+BOT_HTTP_POOL_LIMIT = int(os.getenv("BOT_HTTP_POOL_LIMIT", "100"))
+# Сколько соединений пула не отдается под long-poll: на них идут ответы
+# хэндлеров. Ботов в режиме polling может быть не больше LIMIT - RESERVED
+BOT_HTTP_RESERVED = int(os.getenv("BOT_HTTP_RESERVED", "10"))
+
+
+class SharedBotSession(AiohttpSession):
+    """
+    Одна HTTP-сессия (и один пул TCP/TLS-соединений) на всех ботов.
+    Токен бота попадает только в URL запроса, поэтому сессию можно делить;
+    закрывает ее BotManager при выключении, а не stop_bot.
+
+    :param limit: Соединений в пуле
+    :param reserved: Соединений, которые не занимают long-poll getUpdates
+    """
+
+    def __init__(self, limit: int = BOT_HTTP_POOL_LIMIT,
+                 reserved: int = BOT_HTTP_RESERVED, **kwargs):
+        if not 0 < reserved < limit:
+            raise ValueError("BOT_HTTP_RESERVED must be between 1 and BOT_HTTP_POOL_LIMIT - 1")
+
+        super().__init__(limit=limit, **kwargs)
+        self.pool_limit = limit
+        self.reserved = reserved
+
+        self.requests = BotRequestStatsMiddleware()
+        self.middleware(self.requests)
+
+    @property
+    def polling_capacity(self) -> int:
+        """Сколько ботов могут держать long-poll, не занимая резерв."""
+        return self.pool_limit - self.reserved
+
+    def stats(self) -> dict:
+        return {
+            "open": self._session is not None and not self._session.closed,
+            "limit": self.pool_limit,
+            "reserved": self.reserved,
+            "polling_capacity": self.polling_capacity,
+            "in_flight": sum(stats["in_flight"]
+                             for stats in self.requests.bots.values()),
+        }
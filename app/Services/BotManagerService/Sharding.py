@@ -0,0 +1,302 @@
+import asyncio
+import bisect
+import hashlib
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterable, List
+
+from dotenv import load_dotenv
+from redis.asyncio import Redis
+
+if TYPE_CHECKING:
+    from . import BotManager
+
+load_dotenv()
+# Сколько секунд живет аренда бота и отметка шарда без продления:
+# за это время боты упавшего воркера переходят к живым
+BOT_SHARD_LEASE_TTL = float(os.getenv("BOT_SHARD_LEASE_TTL", "10"))
+# Как часто шард продлевает аренды и пересобирает кольцо
+BOT_SHARD_INTERVAL = float(os.getenv("BOT_SHARD_INTERVAL", "3"))
+
+# Живые шарды: sorted set, score - время (мс), до которого шард считается живым
+SHARDS_KEY = "bots:shards"
+LEASE_KEY = "bots:lease:{school_id}"
+
+# Продлить / снять аренду, только если она все еще наша
+RENEW_LEASE = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+RELEASE_LEASE = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.md5(value.encode()).digest()[:8], "big")
+
+
+class HashRing:
+    """
+    Консистентное хэширование school_id по шардам: при появлении или
+    пропаже шарда переезжает только его доля ботов.
+    """
+
+    def __init__(self, nodes: Iterable[str], replicas: int = 128):
+        self.nodes = sorted(set(nodes))
+        points = sorted((_hash(f"{node}#{i}"), node)
+                        for node in self.nodes for i in range(replicas))
+        self._hashes = [point for point, _ in points]
+        self._nodes = [node for _, node in points]
+
+    def owner(self, key: str) -> str | None:
+        if not self._hashes:
+            return None
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._nodes[index]
+
+
+class BotShardCoordinator:
+    """
+    Распределяет ботов между процессами (воркерами gunicorn, нодами) через Redis.
+
+    Каждый шард раз в ``interval`` секунд отмечается живым, строит кольцо из
+    живых шардов и берет в аренду (SET NX PX) свою долю school_id. Аренды
+    продлеваются на ``lease_ttl``; бот, ушедший к другому шарду, сначала
+    останавливается, потом аренда снимается. Аренды упавшего шарда истекают
+    сами, и их подхватывают новые владельцы.
+
+    Первые ``lease_ttl`` секунд после входа шард только отмечается живым и
+    ничего не берет: при холодном старте кольцо каждого шарда сначала
+    состоит из одного него, и без этой паузы все шарды взяли бы всех ботов.
+    За это время отмечаются шарды, стартовавшие вместе с ним, и истекают
+    аренды прежних владельцев.
+
+    :param manager: BotManager этого процесса
+    :param redis: Подключение к Redis
+    :param load_configs: Загрузка конфигов всех включенных ботов из БД
+    :param shard_id: Имя шарда (по умолчанию хост:pid:случайный суффикс)
+    :param on_leases: Вызывается с school_id аренд шарда, когда их набор меняется
+    """
+
+    def __init__(self, manager: "BotManager", redis: Redis,
+                 load_configs: Callable[[], Awaitable[List[dict]]],
+                 shard_id: str | None = None,
+                 lease_ttl: float = BOT_SHARD_LEASE_TTL,
+                 interval: float = BOT_SHARD_INTERVAL,
+                 on_leases: Callable[[set[str]], None] | None = None):
+        if interval >= lease_ttl:
+            raise ValueError("BOT_SHARD_INTERVAL must be shorter than BOT_SHARD_LEASE_TTL")
+
+        self.manager = manager
+        self.redis = redis
+        self.load_configs = load_configs
+        self.shard_id = shard_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}")
+        self.lease_ttl = lease_ttl
+        self.interval = interval
+        self.on_leases = on_leases
+
+        self._renew = redis.register_script(RENEW_LEASE)
+        self._release = redis.register_script(RELEASE_LEASE)
+
+        self.shards: List[str] = []
+        # school_id, аренды которых держит этот шард
+        self.leases: set[str] = set()
+        self._task: asyncio.Task | None = None
+        self._healthy_at = time.monotonic()
+        # Когда шард впервые отметился живым (None - еще не отмечался)
+        self._joined_at: float | None = None
+
+        self.claimed = 0
+        self.released = 0
+        self.lost = 0
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logging.info(f"🧩 Шард ботов {self.shard_id} запущен")
+
+    async def stop(self):
+        """
+        Останавливает своих ботов и снимает аренды, чтобы другие шарды
+        подхватили их сразу, не дожидаясь истечения.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await asyncio.gather(*(self._give_up(school_id)
+                               for school_id in list(self.leases)))
+        try:
+            await self.redis.zrem(SHARDS_KEY, self.shard_id)
+        except Exception as e:
+            logging.error(f"❌ Ошибка снятия отметки шарда {self.shard_id}: {e}")
+        logging.info(f"👋 Шард ботов {self.shard_id} остановлен")
+
+    async def _run(self):
+        while True:
+            try:
+                await self.reconcile()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"❌ Ошибка синхронизации шарда {self.shard_id}: {e}",
+                              exc_info=True)
+                # Аренды не продлены: пока они не истекли, отдаем ботов сами,
+                # иначе их запустит новый владелец и getUpdates пойдут из двух мест
+                if time.monotonic() - self._healthy_at + self.interval >= self.lease_ttl:
+                    await self._drop_all()
+            await asyncio.sleep(self.interval)
+
+    async def reconcile(self):
+        """
+        Один шаг: отметка шарда, кольцо, аренды и запуск/остановка ботов.
+        """
+        now_ms = int(time.time() * 1000)
+        ttl_ms = int(self.lease_ttl * 1000)
+        leases = set(self.leases)
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zadd(SHARDS_KEY, {self.shard_id: now_ms + ttl_ms})
+            pipe.zremrangebyscore(SHARDS_KEY, "-inf", now_ms)
+            pipe.zrange(SHARDS_KEY, 0, -1)
+            _, _, shards = await pipe.execute()
+
+        self.shards = shards
+        ring = HashRing(shards)
+        if self._joined_at is None:
+            self._joined_at = time.monotonic()
+        configs = {str(config["school_id"]): config
+                   for config in await self.load_configs()}
+
+        # 1. Отдаем ботов, которые выключены или ушли к другому шарду
+        moved = [school_id for school_id in self.leases
+                 if school_id not in configs or ring.owner(school_id) != self.shard_id]
+        await asyncio.gather(*(self._give_up(school_id) for school_id in moved))
+
+        # 2. Продлеваем свои аренды одним пайплайном
+        held = sorted(self.leases)
+        if held:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for school_id in held:
+                    await self._renew(keys=[LEASE_KEY.format(school_id=school_id)],
+                                      args=[self.shard_id, ttl_ms], client=pipe)
+                renewed = await pipe.execute()
+            for school_id, ok in zip(held, renewed):
+                if not ok:
+                    logging.warning(f"⚠️ Аренда бота {school_id} потеряна шардом "
+                                    f"{self.shard_id}")
+                    self.lost += 1
+                    self.leases.discard(school_id)
+                    await self.manager.stop_bot(school_id)
+        self._healthy_at = time.monotonic()
+
+        # 3. Берем свободные аренды своей доли одним пайплайном; занятые
+        #    прежним владельцем освободятся при его следующем шаге или по истечении.
+        #    Пока кольцо не устоялось, не берем ничего
+        wanted = [school_id for school_id in configs
+                  if school_id not in self.leases
+                  and ring.owner(school_id) == self.shard_id] if self.settled else []
+        if wanted:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for school_id in wanted:
+                    pipe.set(LEASE_KEY.format(school_id=school_id),
+                             self.shard_id, nx=True, px=ttl_ms)
+                claimed = await pipe.execute()
+            for school_id, ok in zip(wanted, claimed):
+                if ok:
+                    self.leases.add(school_id)
+                    self.claimed += 1
+                    logging.info(f"🧩 Шард {self.shard_id} взял бота {school_id}")
+
+        if self.leases != leases:
+            self._leases_changed()
+
+        # 4. Запускаем своих ботов и перезапускаем тех, чей конфиг изменился
+        await asyncio.gather(*(self._ensure_running(configs[school_id])
+                               for school_id in self.leases))
+
+    @property
+    def settled(self) -> bool:
+        """Прошла ли с входа шарда одна аренда: с этого момента он берет ботов."""
+        return (self._joined_at is not None
+                and time.monotonic() - self._joined_at >= self.lease_ttl)
+
+    def _leases_changed(self):
+        if self.on_leases is not None:
+            self.on_leases(set(self.leases))
+
+    async def _ensure_running(self, config: dict):
+        bot_data = self.manager.running_bots.get(str(config["school_id"]))
+        if bot_data is None or bot_data["task"].done():
+            await self.manager.start_bot(config)
+        elif bot_data["config"] != config:
+            await self.manager.restart_bot(config)
+
+    async def _give_up(self, school_id: str):
+        try:
+            await self.manager.stop_bot(school_id)
+            await self._release(keys=[LEASE_KEY.format(school_id=school_id)],
+                                args=[self.shard_id])
+            self.released += 1
+            logging.info(f"🧩 Шард {self.shard_id} отдал бота {school_id}")
+        except Exception as e:
+            logging.error(f"❌ Ошибка передачи бота {school_id}: {e}")
+        finally:
+            self.leases.discard(school_id)
+
+    async def _drop_all(self):
+        for school_id in list(self.leases):
+            await self.manager.stop_bot(school_id)
+            self.lost += 1
+        self.leases.clear()
+        self._leases_changed()
+
+    async def apply(self, config: dict) -> dict:
+        """
+        Применяет измененный конфиг: свой бот перезапускается сразу,
+        чужой - шардом-владельцем на его следующем шаге (он сверяет конфиги).
+        """
+        school_id = str(config["school_id"])
+        if school_id in self.leases:
+            return await self.manager.restart_bot(config)
+        return {"status": "delegated", "school_id": school_id,
+                "shard": await self.owner_of(school_id)}
+
+    async def owner_of(self, school_id: str) -> str | None:
+        """Шард, который сейчас держит аренду бота."""
+        return await self.redis.get(LEASE_KEY.format(school_id=school_id))
+
+    async def assignments(self) -> dict:
+        """Все аренды: шард -> school_id его ботов."""
+        keys = [key async for key in self.redis.scan_iter(match=LEASE_KEY.format(school_id="*"))]
+        owners = await self.redis.mget(keys) if keys else []
+        shards: dict[str, list[str]] = {shard: [] for shard in self.shards}
+        for key, shard in zip(keys, owners):
+            if shard is not None:
+                shards.setdefault(shard, []).append(key.rsplit(":", 1)[1])
+        return {shard: sorted(school_ids) for shard, school_ids in shards.items()}
+
+    def stats(self) -> dict:
+        return {
+            "shard_id": self.shard_id,
+            "shards": self.shards,
+            "settled": self.settled,
+            "leases": len(self.leases),
+            "claimed": self.claimed,
+            "released": self.released,
+            "lost": self.lost,
+        }
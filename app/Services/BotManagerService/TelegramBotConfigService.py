@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Sequence
 
 from app.Objects.TelegramBotConfigModel import TelegramBotConfig
+from .Errors import BotTokenRequired
 
 
 class TelegramBotConfigService:
@@ -22,6 +23,7 @@ class TelegramBotConfigService:
     async def UpdateOrCreate(self, school_id: uuid.UUID, settings_data: dict) -> TelegramBotConfig:
         """
         Обновляет или создает конфиг бота для school_id.
+        Включенный бот без токена не сохраняется: BotTokenRequired.
         """
         result = await self.db.execute(
             select(TelegramBotConfig).where(TelegramBotConfig.school_id == school_id)
@@ -39,10 +41,28 @@ class TelegramBotConfigService:
             db_config = TelegramBotConfig(school_id=school_id, **settings_data)
             self.db.add(db_config)
 
+        if db_config.is_enabled and not db_config.bot_token:
+            await self.db.rollback()
+            raise BotTokenRequired(school_id)
+
         await self.db.commit()
         await self.db.refresh(db_config)
         return db_config
 
+    @staticmethod
+    def ToDict(config: TelegramBotConfig) -> dict:
+        """
+        Конфиг в виде dict, с которым работает BotManager.
+        """
+        return {
+            "school_id": str(config.school_id),
+            "is_enabled": config.is_enabled,
+            "bot_name": config.bot_name,
+            "bot_token": config.bot_token,
+            "welcome_message": config.welcome_message,
+            "image_url": config.image_url
+        }
+
     async def GetAllEnabled(self) -> Sequence[TelegramBotConfig]:
         """
         Получает ВСЕ конфиги ботов, у которых стоит is_enabled = True.
@@ -1,59 +1,214 @@
 import asyncio
+import hashlib
+import hmac
 import logging
-from typing import Dict, Any
+import os
+from typing import TYPE_CHECKING, Dict, Any
 
 from aiogram import Bot, Dispatcher
 from aiogram.enums import ParseMode
 from aiogram.client.default import DefaultBotProperties
+from aiogram.types import Update
+from aiogram.utils.backoff import Backoff, BackoffConfig
+from dotenv import load_dotenv
 
 from app.Infrastructure.Database import async_session
+from .Errors import BotTokenRequired
 from .Handlers import create_main_router
-from .Middleware import DbSessionMiddleware
+from .Middleware import BotConfigMiddleware, DbSessionMiddleware
+from .Platform import get_platform_client
+from .Session import SharedBotSession
+
+if TYPE_CHECKING:
+    from .Sharding import BotShardCoordinator
+
+load_dotenv()
+# polling (по умолчанию, для локальной разработки) или webhook
+BOT_UPDATES_MODE = os.getenv("BOT_UPDATES_MODE", "polling")
+# Публичный https-адрес API, на который Telegram шлёт вебхуки
+BOT_WEBHOOK_BASE_URL = os.getenv("BOT_WEBHOOK_BASE_URL", "")
+# Секрет для подписи вебхуков (если не задан - выводится из токена бота)
+BOT_WEBHOOK_SECRET = os.getenv("BOT_WEBHOOK_SECRET", "")
+WEBHOOK_PATH = "/api/v1/Bots/Webhook/{school_id}"
+# Сколько секунд Telegram держит long-poll getUpdates
+POLLING_TIMEOUT = 10
+POLLING_BACKOFF = BackoffConfig(min_delay=1.0, max_delay=5.0, factor=1.3, jitter=0.1)
 
 
 class BotManager:
-    def __init__(self):
+    def __init__(self, mode: str | None = None):
         """
         Храним словарь с запущенными ботами.
-        Ключ - school_id, значение - dict с task, dispatcher, bot и stop_event.
+        Ключ - school_id, значение - dict с task, bot, stop_event и config.
+
+        Диспетчер и дерево роутеров одни на всех ботов и собираются один раз;
+        конфиг школы подставляет BotConfigMiddleware по id бота. HTTP-сессия
+        (пул соединений к Bot API) тоже общая, запросы считаются по ботам.
+
+        :param mode: "polling" или "webhook" (по умолчанию BOT_UPDATES_MODE)
         """
+        self.mode = (mode or BOT_UPDATES_MODE).lower()
+        if self.mode not in ("polling", "webhook"):
+            raise ValueError(f"Unknown bot updates mode: {self.mode}")
+        if self.mode == "webhook" and not BOT_WEBHOOK_BASE_URL.startswith("https://"):
+            raise ValueError("BOT_WEBHOOK_BASE_URL must be an https:// URL in webhook mode")
+
         self.running_bots: Dict[str, Dict[str, Any]] = {}
-        logging.info("🤖 BotManager инициализирован.")
+        # id бота (из токена) -> конфиг школы
+        self.bot_configs: Dict[int, dict] = {}
+
+        self.dispatcher = Dispatcher()
+        self.dispatcher.include_router(create_main_router())
+        self.dispatcher.update.middleware(BotConfigMiddleware(self.bot_configs))
+        self.dispatcher.update.middleware(
+            DbSessionMiddleware(session_pool=async_session))
+        self.allowed_updates = self.dispatcher.resolve_used_update_types()
+
+        self.session = SharedBotSession()
+        # Шардирование ботов между процессами (если настроен Redis)
+        self.shards: "BotShardCoordinator | None" = None
+
+        # Сильные ссылки на задачи обработки апдейтов, чтобы их не собрал GC
+        self._update_tasks: set[asyncio.Task] = set()
+        logging.info(f"🤖 BotManager инициализирован (режим: {self.mode}).")
+
+    @staticmethod
+    def webhook_secret(config: dict) -> str:
+        """
+        Секрет для заголовка X-Telegram-Bot-Api-Secret-Token, свой для каждого бота.
+        """
+        key = (BOT_WEBHOOK_SECRET or config["bot_token"]).encode()
+        return hmac.new(key, str(config["school_id"]).encode(),
+                        hashlib.sha256).hexdigest()
+
+    @staticmethod
+    def webhook_url(school_id: str) -> str:
+        return BOT_WEBHOOK_BASE_URL.rstrip("/") + WEBHOOK_PATH.format(
+            school_id=school_id)
 
-    async def _run_bot_polling(self, dp: Dispatcher, bot: Bot, config: dict,
+    async def _run_bot_polling(self, bot: Bot, config: dict,
                                stop_event: asyncio.Event):
         """
-        Внутренний метод для запуска поллинга с возможностью остановки.
+        Свой цикл getUpdates для одного бота поверх общего диспетчера.
+        Останавливается по stop_event, не дожидаясь конца long-poll.
         """
         school_id = config.get("school_id")
         bot_name = config.get("bot_name", f"Bot {school_id}")
 
-        # Передаем пул сессий БД в middleware
-        dp.update.middleware(DbSessionMiddleware(session_pool=async_session))
-
         logging.info(
             f"🚀 Запуск поллинга для бота: {bot_name} (school_id: {school_id})")
 
+        backoff = Backoff(config=POLLING_BACKOFF)
+        offset = None
+        stopped = asyncio.ensure_future(stop_event.wait())
         try:
-            # Запускаем поллинг с передачей stop_event
-            await dp.start_polling(
-                bot,
-                allowed_updates=dp.resolve_used_update_types(),
-                config=config,
-                handle_signals=False
-                # Важно! Не перехватываем системные сигналы
-            )
+            while not stop_event.is_set():
+                request = asyncio.ensure_future(bot.get_updates(
+                    offset=offset,
+                    timeout=POLLING_TIMEOUT,
+                    allowed_updates=self.allowed_updates,
+                    request_timeout=int(bot.session.timeout + POLLING_TIMEOUT)
+                ))
+                await asyncio.wait({request, stopped},
+                                   return_when=asyncio.FIRST_COMPLETED)
+                if not request.done():
+                    request.cancel()
+                    break
+
+                try:
+                    updates = request.result()
+                except Exception as e:
+                    delay = next(backoff)
+                    logging.error(f"❌ Ошибка получения апдейтов {bot_name}: {e}. "
+                                  f"Повтор через {delay:.1f} с")
+                    await asyncio.wait({stopped}, timeout=delay)
+                    continue
+
+                backoff.reset()
+                for update in updates:
+                    # Подтверждаем апдейт следующим запросом getUpdates
+                    offset = update.update_id + 1
+                    self._spawn_update(bot, update)
         except asyncio.CancelledError:
             logging.info(f"🛑 Поллинг отменен для: {bot_name}")
         except Exception as e:
             logging.error(f"❌ Ошибка в цикле поллинга {bot_name}: {e}",
                           exc_info=True)
         finally:
+            stopped.cancel()
             logging.info(f"✅ Поллинг-цикл завершен для: {bot_name}")
 
+    async def _run_bot_webhook(self, bot: Bot, config: dict,
+                               stop_event: asyncio.Event):
+        """
+        Регистрирует вебхук и держит задачу бота живой до stop_event,
+        чтобы статус и остановка работали так же, как при поллинге.
+
+        Вебхук здесь не снимается: при выключении процесса или отмене задачи
+        он должен остаться у Telegram, чтобы апдейты дождались перезапуска.
+        Снимает его stop_bot, когда бота выключают явно.
+        """
+        school_id = config.get("school_id")
+        bot_name = config.get("bot_name", f"Bot {school_id}")
+        url = self.webhook_url(school_id)
+
+        try:
+            await bot.set_webhook(
+                url,
+                secret_token=self.webhook_secret(config),
+                allowed_updates=self.allowed_updates
+            )
+            logging.info(f"🔗 Вебхук установлен для {bot_name}: {url}")
+            await stop_event.wait()
+        except asyncio.CancelledError:
+            logging.info(f"🛑 Вебхук-задача отменена для: {bot_name}")
+        except Exception as e:
+            logging.error(f"❌ Ошибка вебхука {bot_name}: {e}", exc_info=True)
+
+    async def _delete_webhook(self, bot: Bot, config: dict):
+        bot_name = config.get("bot_name", f"Bot {config.get('school_id')}")
+        try:
+            await bot.delete_webhook()
+            logging.info(f"✅ Вебхук удален для: {bot_name}")
+        except Exception as e:
+            logging.error(f"❌ Ошибка удаления вебхука {bot_name}: {e}")
+
+    async def feed_webhook_update(self, school_id: str, secret: str | None,
+                                  update: dict) -> str:
+        """
+        Передаёт апдейт из вебхука в общий диспетчер от имени нужного бота.
+        Обработка идёт в фоне, чтобы сразу ответить Telegram 200 OK.
+
+        :return: "accepted", "not_found" или "forbidden"
+        """
+        bot_data = self.running_bots.get(str(school_id))
+        if not bot_data or bot_data["task"].done():
+            return "not_found"
+
+        if not secret or not hmac.compare_digest(
+                secret, self.webhook_secret(bot_data["config"])):
+            return "forbidden"
+
+        bot: Bot = bot_data["bot"]
+        self._spawn_update(bot, Update.model_validate(update, context={"bot": bot}))
+        return "accepted"
+
+    def _spawn_update(self, bot: Bot, update: Update):
+        task = asyncio.create_task(self._feed_update(bot, update))
+        self._update_tasks.add(task)
+        task.add_done_callback(self._update_tasks.discard)
+
+    async def _feed_update(self, bot: Bot, update: Update):
+        try:
+            await self.dispatcher.feed_update(bot, update)
+        except Exception as e:
+            logging.error(f"❌ Ошибка обработки апдейта {update.update_id}: {e}",
+                          exc_info=True)
+
     async def start_bot(self, config: dict):
         """
-        Запускает новый экземпляр бота.
+        Запускает новый экземпляр бота. Включенный в БД бот без токена
+        (старые конфиги) не запускается: статус no_token.
         """
         school_id = str(config["school_id"])
         token = config.get("bot_token")
@@ -72,26 +227,40 @@ class BotManager:
 
         logging.info(f"🔧 Создание бота для school_id: {school_id}")
 
-        # Создаем объекты
+        # Создаем объекты (id бота берется из токена, без запроса к Telegram)
         bot = Bot(
             token=token,
+            session=self.session,
             default=DefaultBotProperties(parse_mode=ParseMode.HTML)
         )
-        dp = Dispatcher()
-        stop_event = asyncio.Event()
+        owner = self.bot_configs.get(bot.id)
+        if owner is not None and str(owner["school_id"]) != school_id:
+            logging.warning(
+                f"⚠️ Токен бота {school_id} уже используется школой "
+                f"{owner['school_id']}. Бот не запущен.")
+            return {"status": "duplicate_token", "school_id": school_id}
+
+        # Каждый бот в режиме polling держит соединение под getUpdates:
+        # без свободного пула ответы хэндлеров ждали бы чужих long-poll
+        polling = sum(1 for bot_data in self.running_bots.values()
+                      if not bot_data["task"].done())
+        if self.mode == "polling" and polling >= self.session.polling_capacity:
+            logging.error(
+                f"❌ Нет свободных соединений для поллинга бота {school_id} "
+                f"({polling} из {self.session.polling_capacity}): увеличьте "
+                f"BOT_HTTP_POOL_LIMIT. Бот не запущен.")
+            return {"status": "pool_exhausted", "school_id": school_id}
 
-        # Регистрируем хэндлеры
-        dp.include_router(create_main_router())
+        stop_event = asyncio.Event()
+        self.bot_configs[bot.id] = config
 
         # Создаем задачу
-        task = asyncio.create_task(
-            self._run_bot_polling(dp, bot, config, stop_event)
-        )
+        run = self._run_bot_webhook if self.mode == "webhook" else self._run_bot_polling
+        task = asyncio.create_task(run(bot, config, stop_event))
 
         # Сохраняем ВСЕ объекты
         self.running_bots[school_id] = {
             "task": task,
-            "dispatcher": dp,
             "bot": bot,
             "stop_event": stop_event,
             "config": config  # Сохраняем конфиг для доступа к bot_name и т.д.
@@ -100,9 +269,12 @@ class BotManager:
         logging.info(f"✅ Бот для {school_id} запущен успешно")
         return {"status": "started", "school_id": school_id}
 
-    async def stop_bot(self, school_id: str):
+    async def stop_bot(self, school_id: str, remove_webhook: bool = True):
         """
         Корректно останавливает работающий бот.
+
+        :param remove_webhook: Снять вебхук бота (режим webhook). False -
+            при выключении процесса: Telegram придержит апдейты до запуска
         """
         school_id = str(school_id)
         bot_instance = self.running_bots.get(school_id)
@@ -117,27 +289,28 @@ class BotManager:
 
         if task.done():
             logging.info(f"ℹ️ Бот для {school_id} уже остановлен.")
+            if self.mode == "webhook" and remove_webhook:
+                await self._delete_webhook(bot_instance["bot"], bot_instance["config"])
             # Очищаем из словаря
             del self.running_bots[school_id]
+            self.bot_configs.pop(bot_instance["bot"].id, None)
+            self.session.requests.forget(bot_instance["bot"].id)
             return {"status": "already_stopped", "school_id": school_id}
 
         logging.info(f"🛑 Начинаем остановку бота для {school_id}...")
 
-        dispatcher: Dispatcher = bot_instance["dispatcher"]
         bot: Bot = bot_instance["bot"]
         stop_event: asyncio.Event = bot_instance["stop_event"]
 
         try:
-            # 1. Устанавливаем флаг остановки
+            # 1. Устанавливаем флаг остановки: цикл поллинга прерывает
+            #    текущий getUpdates, вебхук-задача завершается
             stop_event.set()
 
-            # 2. Останавливаем диспетчер (прекращает обработку новых обновлений)
-            await dispatcher.stop_polling()
-
             logging.info(
                 f"⏳ Ожидание завершения задачи поллинга для {school_id}...")
 
-            # 3. Ждем завершения задачи с таймаутом
+            # 2. Ждем завершения задачи с таймаутом
             await asyncio.wait_for(task, timeout=10.0)
 
             logging.info(f"✅ Задача поллинга для {school_id} завершена")
@@ -162,14 +335,15 @@ class BotManager:
                 pass
 
         finally:
-            # 4. Закрываем HTTP-сессию бота
-            try:
-                await bot.session.close()
-                logging.info(f"✅ HTTP сессия для {school_id} закрыта")
-            except Exception as e:
-                logging.error(f"❌ Ошибка закрытия сессии {school_id}: {e}")
-
-            # 5. Удаляем из списка запущенных
+            # 3. Бот выключен явно - Telegram больше не должен слать вебхуки
+            if self.mode == "webhook" and remove_webhook:
+                await self._delete_webhook(bot, bot_instance["config"])
+
+            # 4. Удаляем из списка запущенных; новые апдейты этого бота
+            #    BotConfigMiddleware отбросит. HTTP-сессия общая и
+            #    закрывается только в stop_all_bots
+            self.bot_configs.pop(bot.id, None)
+            self.session.requests.forget(bot.id)
             if school_id in self.running_bots:
                 del self.running_bots[school_id]
                 logging.info(f"✅ Бот {school_id} удален из списка запущенных")
@@ -183,8 +357,14 @@ class BotManager:
         school_id = str(config["school_id"])
         logging.info(f"🔄 Перезапуск бота для {school_id}...")
 
-        # 1. Останавливаем текущий бот
-        stop_result = await self.stop_bot(school_id)
+        # 1. Останавливаем текущий бот. Вебхук снимаем, только если бот
+        #    выключен или сменил токен: иначе start_bot сразу поставит новый
+        current = self.running_bots.get(school_id, {}).get("config", {})
+        stop_result = await self.stop_bot(
+            school_id,
+            remove_webhook=(not config.get("is_enabled")
+                            or current.get("bot_token") != config.get("bot_token"))
+        )
         logging.info(f"   Результат остановки: {stop_result['status']}")
 
         # 2. Небольшая пауза для полного завершения
@@ -201,12 +381,91 @@ class BotManager:
                 f"   ⏸️ Бот {school_id} остановлен и не включен (is_enabled=False)")
             return {"status": "stopped_disabled", "school_id": school_id}
 
+    async def apply_config(self, config: dict):
+        """
+        Применяет обновленный конфиг бота: перезапускает его здесь или,
+        при шардировании, в шарде-владельце. Включить бота без токена
+        нельзя: BotTokenRequired.
+        """
+        if config.get("is_enabled") and not config.get("bot_token"):
+            raise BotTokenRequired(config["school_id"])
+        if self.shards:
+            return await self.shards.apply(config)
+        return await self.restart_bot(config)
+
+    async def status(self, school_id: str) -> dict:
+        """
+        Запущен ли бот школы (в этом процессе или в другом шарде).
+        """
+        school_id = str(school_id)
+        bot_data = self.running_bots.get(school_id)
+
+        if bot_data is None:
+            # Бот может работать в другом шарде
+            shard = await self.shards.owner_of(school_id) if self.shards else None
+            if shard:
+                return {"status": "running", "school_id": school_id,
+                        "shard": shard}
+            return {"status": "stopped", "school_id": school_id}
+
+        is_running = not bot_data["task"].done()
+        return {
+            "status": "running" if is_running else "stopped",
+            "school_id": school_id,
+            "bot_name": bot_data.get("config", {}).get("bot_name")
+        }
+
+    async def stats(self) -> dict:
+        """
+        Статистика ботов этого процесса, общей HTTP-сессии, шардов
+        и клиента платформы, которым пользуются хэндлеры.
+        """
+        client = get_platform_client()
+
+        running_bots = []
+        stopped_bots = []
+
+        for school_id, bot_data in self.running_bots.items():
+            bot_info = {
+                "school_id": school_id,
+                "bot_name": bot_data.get("config", {}).get("bot_name", "Unknown"),
+                "is_running": not bot_data["task"].done(),
+                "requests": self.request_stats(school_id),
+                "shard": self.shards.shard_id if self.shards else None
+            }
+
+            if bot_info["is_running"]:
+                running_bots.append(bot_info)
+            else:
+                stopped_bots.append(bot_info)
+
+        return {
+            "total_bots": len(self.running_bots),
+            "running_count": len(running_bots),
+            "stopped_count": len(stopped_bots),
+            "running_bots": running_bots,
+            "stopped_bots": stopped_bots,
+            "bot_session": self.session.stats(),
+            "reference": client.reference.stats(),
+            "rate_limit": client.limiter.stats() if client.limiter else None,
+            "resilience": client.policy.stats(),
+            "circuits": client.breaker.stats() if client.breaker else None,
+            "schedule_windows": client.schedule_windows.stats(),
+            # Без Redis все боты работают в этом процессе
+            "sharding": {
+                **self.shards.stats(),
+                "assignments": await self.shards.assignments()
+            } if self.shards else None
+        }
+
     async def stop_all_bots(self):
         """
         Останавливает всех запущенных ботов при выключении FastAPI.
+        Вебхуки остаются зарегистрированными до следующего запуска.
         """
         if not self.running_bots:
             logging.info("ℹ️ Нет активных ботов для остановки")
+            await self.close_session()
             return
 
         logging.info(
@@ -214,7 +473,8 @@ class BotManager:
 
         # Создаем список задач на остановку
         school_ids = list(self.running_bots.keys())
-        tasks = [self.stop_bot(school_id) for school_id in school_ids]
+        tasks = [self.stop_bot(school_id, remove_webhook=False)
+                 for school_id in school_ids]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -226,3 +486,23 @@ class BotManager:
                 logging.info(f"✅ Бот {school_id} остановлен: {result}")
 
         logging.info("✅ Все боты остановлены")
+        await self.close_session()
+
+    async def close_session(self):
+        """
+        Закрывает общую HTTP-сессию ботов.
+        """
+        try:
+            await self.session.close()
+            logging.info("✅ HTTP сессия ботов закрыта")
+        except Exception as e:
+            logging.error(f"❌ Ошибка закрытия HTTP сессии ботов: {e}")
+
+    def request_stats(self, school_id: str) -> dict | None:
+        """
+        Запросы к Bot API бота школы через общую сессию.
+        """
+        bot_data = self.running_bots.get(str(school_id))
+        if not bot_data:
+            return None
+        return self.session.requests.stats(bot_data["bot"].id)
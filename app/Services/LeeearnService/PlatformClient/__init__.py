@@ -1,3 +1,21 @@
+from .bulk import BulkReport, BulkResult, gather_limited
+from .cache import ResponseCache
+from .circuit import CircuitBreaker
 from .client import PlatformClient as Client
+from .codec import JsonCodec, get_codec, set_codec
+from .fanout import BranchResult, fan_out, fan_out_items
+from .local_query import UnsupportedQuery, evaluate
+from .normalize import normalize
+from .query_builder import CompareType, QueryBuilder
+from .ratelimit import Priority, RateLimiter, limiter_for, request_priority
+from .reference import ReferenceData
+from .registry import ClientRegistry, clients
+from .resilience import ResiliencePolicy
+from .schedule import ScheduleItem, WindowPushdown, parse_schedule_items
+from .schedule_index import ScheduleIndex, ScheduleIndexCache
+from .singleflight import SingleFlight
+from .snapshots import SnapshotStore
+from .streaming import ItemStream, PlatformStream
+from .transport import AiohttpTransport, ThreadTransport, default_transport
 
-PlatformClient = Client
\ No newline at end of file
+PlatformClient = Client
@@ -0,0 +1,135 @@
+import asyncio
+import inspect
+import time
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Union
+
+from .utils import PlatformResponse
+
+# A call: a coroutine, a zero-argument coroutine function or ``(func, *args)``.
+Invocation = Union[Awaitable[Any], Callable[[], Awaitable[Any]], tuple]
+
+
+class BulkResult:
+    """
+    Outcome of one call of a batch. ``ok`` is False for an exception and for
+    a PlatformResponse with an error status (kept in ``value``).
+    """
+    __slots__ = ("index", "value", "error", "seconds")
+
+    def __init__(self, index: int, value: Any = None,
+                 error: BaseException | None = None, seconds: float = 0.0):
+        self.index = index
+        self.value = value
+        self.error = error
+        self.seconds = seconds
+
+    @property
+    def ok(self) -> bool:
+        if self.error is not None:
+            return False
+        return not isinstance(self.value, PlatformResponse) or self.value.ok
+
+    def __repr__(self):
+        state = "ok" if self.ok else f"error={self.error or self.value.status!r}"
+        return f"BulkResult({self.index}, {state}, {self.seconds:.3f}s)"
+
+
+class BulkReport:
+    """Results in call order plus batch timing."""
+
+    def __init__(self, results: list[BulkResult], elapsed: float, limit: int):
+        self.results = results
+        self.elapsed = elapsed
+        self.limit = limit
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[BulkResult]:
+        return iter(self.results)
+
+    def __getitem__(self, index: int) -> BulkResult:
+        return self.results[index]
+
+    @property
+    def values(self) -> list[Any]:
+        """Values in call order; None where the call raised."""
+        return [result.value for result in self.results]
+
+    @property
+    def failed(self) -> list[BulkResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def succeeded(self) -> int:
+        return len(self.results) - len(self.failed)
+
+    @property
+    def throughput(self) -> float:
+        """Calls completed per second."""
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+    def raise_for_errors(self):
+        """Re-raises the first exception of the batch, if any."""
+        for result in self.results:
+            if result.error is not None:
+                raise result.error
+
+    def stats(self) -> dict:
+        busy = sum(result.seconds for result in self.results)
+        return {
+            "calls": len(self.results),
+            "succeeded": self.succeeded,
+            "failed": len(self.results) - self.succeeded,
+            "elapsed": round(self.elapsed, 3),
+            "throughput": round(self.throughput, 2),
+            # Sum of call latencies over wall time: how much the batch overlapped.
+            "speedup": round(busy / self.elapsed, 2) if self.elapsed else 0.0,
+        }
+
+
+def _start(invocation: Invocation) -> Awaitable[Any]:
+    if inspect.isawaitable(invocation):
+        return invocation
+    if isinstance(invocation, tuple):
+        func, *args = invocation
+        return func(*args)
+    if callable(invocation):
+        return invocation()
+    raise ValueError(f"Not a call: {invocation!r}")
+
+
+async def gather_limited(calls: Iterable[Invocation], limit: int = 8) -> BulkReport:
+    """
+    Runs ``calls`` with at most ``limit`` in flight and returns their results
+    in order. A failing call is recorded in its BulkResult and does not stop
+    the others.
+
+    ``await gather_limited([(branch.Groups.GetDetails, group_id) for group_id in ids])``
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    calls = list(calls)
+    results: list[BulkResult] = [BulkResult(index) for index in range(len(calls))]
+    pending = iter(range(len(calls)))
+
+    async def worker():
+        for index in pending:
+            started = time.monotonic()
+            try:
+                results[index].value = await _start(calls[index])
+            except Exception as e:
+                results[index].error = e
+            results[index].seconds = time.monotonic() - started
+
+    started = time.monotonic()
+    try:
+        await asyncio.gather(*(worker() for _ in range(min(limit, len(calls)))))
+    finally:
+        # Coroutines passed in but never reached must still be closed.
+        for index in pending:
+            if inspect.iscoroutine(calls[index]):
+                calls[index].close()
+
+    return BulkReport(results, time.monotonic() - started, limit)
@@ -0,0 +1,220 @@
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+from .utils import (
+    PlatformResponse,
+    body_field,
+    branch_key,
+    endpoint_service,
+    is_read_endpoint,
+    request_key,
+)
+
+if TYPE_CHECKING:
+    from .client import PlatformClient
+
+SendFunc = Callable[[str, dict | str | None], Awaitable[PlatformResponse]]
+
+# Seconds a successful read stays fresh. Lookup is by endpoint, then by service.
+DEFAULT_TTLS: dict[str, float] = {
+    "/CompanyBranchTeacher/GetScheduleItemList": 30,
+    "/CompanyBranchCustomer/GetScheduleItemList": 30,
+    "/CompanyBranchGroupSchedule/GetDetails": 15,
+    "/CompanyBranchGroup/GetDetails": 60,
+    "/CompanyBranchTeacher/GetContacts": 300,
+    "/CompanyBranchCourse/GetDetails": 600,
+    "/CompanyBranchTag/Get": 600,
+}
+
+# Read services whose cached entries a mutation on the key service makes stale.
+# Services not listed only invalidate themselves.
+DEFAULT_INVALIDATES: dict[str, tuple[str, ...]] = {
+    "/CompanyBranchGroupSchedule": (
+        "/CompanyBranchGroupSchedule",
+        "/CompanyBranchGroup",
+        "/CompanyBranchTeacher",
+        "/CompanyBranchCustomer",
+    ),
+    "/CompanyBranchGroup": (
+        "/CompanyBranchGroup",
+        "/CompanyBranchTeacher",
+        "/CompanyBranchCustomer",
+        "/CompanyBranchLead",
+    ),
+}
+
+# Body fields that narrow a cached read to one object inside its service.
+ENTITY_FIELDS = (
+    "groupId", "teacherId", "customerId", "leadId", "boardId",
+    "courseId", "directionId", "lessonId", "tagId", "roleId", "managerId",
+)
+
+
+class _Entry:
+    __slots__ = ("response", "expires", "size", "scope", "entity")
+
+    def __init__(self, response, expires, size, scope, entity):
+        self.response = response
+        self.expires = expires
+        self.size = size
+        self.scope = scope
+        self.entity = entity
+
+
+def _scope(client: "PlatformClient", body, service: str) -> tuple:
+    return str(client.api_id), branch_key(body_field(body, "companyBranchId")), service
+
+
+def _entity(body) -> tuple[str, str] | None:
+    for name in ENTITY_FIELDS:
+        value = body_field(body, name)
+        if value is not None:
+            return name, str(value)
+    return None
+
+
+class ResponseCache:
+    """
+    TTL + LRU cache of successful read responses.
+
+    Keys are (api_id, endpoint, canonical body). Only endpoints with a TTL are cached.
+    Mutations drop the related reads of the same branch
+    (narrowed to the same group/teacher/... inside their own service),
+    and a read that was in flight meanwhile is not stored.
+
+    :param ttls: Per-endpoint (or per-service) TTL in seconds
+    :param max_bytes: Memory budget for cached bodies
+    :param invalidates: Mutation service -> read services it invalidates
+    """
+
+    def __init__(self, ttls: dict[str, float] | None = None,
+                 max_bytes: int = 16 * 1024 * 1024,
+                 invalidates: dict[str, tuple[str, ...]] | None = None):
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.max_bytes = max_bytes
+        self.invalidates = DEFAULT_INVALIDATES if invalidates is None else invalidates
+
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        self._scopes: dict[tuple, set[tuple]] = {}
+        # Bumped per scope by invalidate() (and for all scopes by clear());
+        # a read only stores its response if its scope's didn't change.
+        self._generations: dict[tuple, int] = {}
+        self._generation = 0
+        self.size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def ttl_for(self, endpoint: str) -> float | None:
+        ttl = self.ttls.get(endpoint)
+        if ttl is None:
+            ttl = self.ttls.get(endpoint_service(endpoint))
+        return ttl
+
+    def get(self, key: tuple) -> PlatformResponse | None:
+        entry = self._entries.get(key)
+        if entry is None or entry.expires < time.monotonic():
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.response
+
+    def get_stale(self, key: tuple) -> PlatformResponse | None:
+        """
+        The last good response for ``key`` even if its TTL has passed
+        (entries leave only by eviction or invalidation). Not counted as a hit.
+        """
+        entry = self._entries.get(key)
+        return None if entry is None else entry.response
+
+    def put(self, key: tuple, response: PlatformResponse, ttl: float,
+            scope: tuple, entity: tuple[str, str] | None = None):
+        size = len(response.bytes()) + len(key[2])
+        if size > self.max_bytes:
+            return
+
+        self._drop(key)
+        self._entries[key] = _Entry(response, time.monotonic() + ttl, size, scope, entity)
+        self._scopes.setdefault(scope, set()).add(key)
+        self.size += size
+
+        while self.size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def _drop(self, key: tuple):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.size -= entry.size
+        keys = self._scopes.get(entry.scope)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._scopes[entry.scope]
+
+    def invalidate(self, client: "PlatformClient", endpoint: str, body: dict | str | None = None):
+        service = endpoint_service(endpoint)
+        entity = _entity(body)
+
+        for target in self.invalidates.get(service, (service,)):
+            scope = _scope(client, body, target)
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+            for key in list(self._scopes.get(scope, ())):
+                cached = self._entries[key].entity
+                if (target == service and entity is not None and cached is not None
+                        and cached[0] == entity[0] and cached[1] != entity[1]):
+                    continue
+                self._drop(key)
+                self.invalidations += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._scopes.clear()
+        self._generation += 1
+        self.size = 0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    async def fetch(self, client: "PlatformClient", endpoint: str,
+                    body: dict | str | None, send: SendFunc) -> PlatformResponse:
+        if not is_read_endpoint(endpoint):
+            try:
+                return await send(endpoint, body)
+            finally:
+                self.invalidate(client, endpoint, body)
+
+        ttl = self.ttl_for(endpoint)
+        if ttl is None:
+            return await send(endpoint, body)
+
+        key = request_key(client, endpoint, body)
+        response = self.get(key)
+        if response is not None:
+            return response
+
+        scope = _scope(client, body, endpoint_service(endpoint))
+        generation = self._generation, self._generations.get(scope, 0)
+        response = await send(endpoint, body)
+        # A mutation of this scope finished during the send: the response
+        # may predate it, so it is returned but not cached.
+        if (response.ok and not response.stale
+                and generation == (self._generation, self._generations.get(scope, 0))):
+            self.put(key, response, ttl, scope, _entity(body))
+        return response
@@ -0,0 +1,133 @@
+import time
+from collections import deque
+
+from .utils import PlatformResponse
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    __slots__ = ("state", "outcomes", "opened_until", "probing", "opened")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.outcomes: deque[tuple[float, bool]] = deque()
+        self.opened_until = 0.0
+        self.probing = False
+        self.opened = 0
+
+
+def circuit_open_response(family: str) -> PlatformResponse:
+    """The fail-fast answer for a request refused by an open circuit."""
+    return PlatformResponse.from_payload(
+        {"error": f"Circuit open for {family}"},
+        status=503, reason="Circuit Open", headers={"X-Circuit-Open": "1"}
+    )
+
+
+class CircuitBreaker:
+    """
+    Per endpoint family (service path) circuit breaker.
+
+    Outcomes of the last ``window`` seconds are kept per family. Once there are
+    at least ``min_requests`` of them and the failure rate reaches
+    ``failure_rate`` the circuit opens and requests are refused without
+    touching the network. After ``open_seconds`` one probe is let through
+    (half-open): its success closes the circuit, its failure reopens it.
+    Failures are transport errors and 5xx statuses.
+
+    :param failure_rate: Failure share that opens the circuit
+    :param min_requests: Outcomes needed before the rate is trusted
+    :param window: Seconds of outcomes considered
+    :param open_seconds: Seconds an open circuit refuses requests
+    """
+
+    def __init__(self, failure_rate: float = 0.5, min_requests: int = 10,
+                 window: float = 30.0, open_seconds: float = 15.0):
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.open_seconds = open_seconds
+
+        self._circuits: dict[str, _Circuit] = {}
+
+        self.rejected = 0
+
+    def allow(self, family: str) -> bool:
+        circuit = self._circuits.get(family)
+        if circuit is None or circuit.state == CLOSED:
+            return True
+
+        if circuit.state == OPEN and time.monotonic() >= circuit.opened_until:
+            circuit.state = HALF_OPEN
+            circuit.probing = False
+        if circuit.state == HALF_OPEN and not circuit.probing:
+            circuit.probing = True
+            return True
+
+        self.rejected += 1
+        return False
+
+    def retry_in(self, family: str) -> float:
+        """Seconds until an open circuit accepts a probe (0 if it already does)."""
+        circuit = self._circuits.get(family)
+        if circuit is None or circuit.state != OPEN:
+            return 0.0
+        return max(0.0, circuit.opened_until - time.monotonic())
+
+    def state(self, family: str) -> str:
+        circuit = self._circuits.get(family)
+        return CLOSED if circuit is None else circuit.state
+
+    def record(self, family: str, ok: bool):
+        circuit = self._circuits.get(family)
+        if circuit is None:
+            circuit = self._circuits[family] = _Circuit()
+
+        now = time.monotonic()
+        if circuit.state == HALF_OPEN:
+            circuit.probing = False
+            if ok:
+                circuit.state = CLOSED
+                circuit.outcomes.clear()
+            else:
+                self._open(circuit, now)
+            return
+        if circuit.state == OPEN:
+            # A request admitted before the circuit opened; it does not count.
+            return
+
+        outcomes = circuit.outcomes
+        outcomes.append((now, ok))
+        while outcomes and outcomes[0][0] < now - self.window:
+            outcomes.popleft()
+
+        if len(outcomes) >= self.min_requests:
+            failures = sum(1 for _, success in outcomes if not success)
+            if failures >= self.failure_rate * len(outcomes):
+                self._open(circuit, now)
+
+    def release(self, family: str):
+        """Frees the half-open probe slot of a request that ended without an outcome."""
+        circuit = self._circuits.get(family)
+        if circuit is not None:
+            circuit.probing = False
+
+    def stats(self) -> dict:
+        return {
+            "rejected": self.rejected,
+            "circuits": {
+                family: {"state": circuit.state, "opened": circuit.opened,
+                         "retry_in": round(self.retry_in(family), 3)}
+                for family, circuit in self._circuits.items()
+                if circuit.state != CLOSED or circuit.opened
+            },
+        }
+
+    def _open(self, circuit: _Circuit, now: float):
+        circuit.state = OPEN
+        circuit.opened_until = now + self.open_seconds
+        circuit.outcomes.clear()
+        circuit.opened += 1
@@ -1,17 +1,48 @@
 import asyncio
-from http.client import HTTPResponse
+from typing import Any, AsyncIterator, Iterable, Optional
 from urllib.parse import urlparse
 
+from .cache import ResponseCache
+from .circuit import CircuitBreaker, circuit_open_response
+from .fanout import BranchQuery, BranchResult, fan_out, fan_out_items
 from .models.branch import BranchMethods, BranchClass
 from .models.company import CompanyMethods
+from .ratelimit import THROTTLE_STATUSES, Priority, RateLimiter, request_priority
+from .reference import ReferenceData
+from .resilience import ResiliencePolicy
+from .schedule import WindowPushdown
+from .schedule_index import SCHEDULE_SERVICES, ScheduleIndexCache
+from .singleflight import SingleFlight
+from .snapshots import SnapshotStore
+from .streaming import ItemsPath
+from .transport import AiohttpTransport, BaseTransport, default_transport
 from .types import SafeUUID
-from .utils import PlatformResponse
+from .utils import (
+    PlatformResponse,
+    body_field,
+    endpoint_service,
+    is_read_endpoint,
+    request_key,
+    response_encoding
+)
 
 
 class PlatformClient:
-    def __init__(self, url: str, api_id: SafeUUID | str, api_access_token: str):
+    def __init__(self, url: str, api_id: SafeUUID | str, api_access_token: str,
+                 transport: BaseTransport | None = None,
+                 cache: ResponseCache | None = None,
+                 coalesce: bool = True,
+                 snapshots: SnapshotStore | None = None,
+                 limiter: RateLimiter | None = None,
+                 throttle_retries: int = 2,
+                 policy: ResiliencePolicy | None = None,
+                 breaker: CircuitBreaker | None = None,
+                 schedule_windows: bool = False,
+                 pool_size: int | None = None):
         if not url.startswith("https://"):
             raise ValueError("URL must start with https://")
+        if transport is not None and pool_size is not None:
+            raise ValueError("Pass either transport or pool_size, not both")
 
         parsed = urlparse(url)
 
@@ -22,14 +53,191 @@ class PlatformClient:
         self.api_access_token: str = api_access_token
 
         self.debug_logs = False
+        # A given transport belongs to the caller and default_transport() to
+        # the process; only a pool created for this client is closed with it.
+        self._owns_transport = pool_size is not None
+        self.transport: BaseTransport = (
+            AiohttpTransport(pool_size=pool_size) if self._owns_transport
+            else transport or default_transport()
+        )
+        self.cache: ResponseCache | None = cache
+        self.single_flight: SingleFlight | None = SingleFlight() if coalesce else None
+        self.schedules = ScheduleIndexCache()
+        self.schedule_windows = WindowPushdown(schedule_windows)
+        self.snapshots: SnapshotStore | None = snapshots
+        self.reference = ReferenceData(self)
+        self.limiter: RateLimiter | None = limiter
+        self.throttle_retries = throttle_retries
+        self.policy: ResiliencePolicy = policy or ResiliencePolicy()
+        self.breaker: CircuitBreaker | None = breaker
+        self._revalidations: dict[str, asyncio.Task] = {}
 
         self.Company = CompanyMethods(self)
         self.Branch = BranchMethods(self)
 
-    def GetBranch(self, branch_id: SafeUUID | str):
-        return BranchClass(self, branch_id)
+        self._branches: dict[SafeUUID, BranchClass] = {}
+
+    def GetBranch(self, branch_id: SafeUUID | str) -> BranchClass:
+        """
+        Returns the cached BranchClass for ``branch_id``; sub-APIs are built lazily.
+        """
+        key = SafeUUID(branch_id)
+        branch = self._branches.get(key)
+        if branch is None:
+            branch = self._branches[key] = BranchClass(self, key)
+        return branch
+
+    def fan_out(self, branch_ids: Iterable[SafeUUID | str], query: BranchQuery, *,
+                limit: int = 8, timeout: Optional[float] = 15.0) -> AsyncIterator[BranchResult]:
+        """
+        Runs the same branch query across ``branch_ids`` and yields results
+        tagged by branch as they arrive (see ``fanout.fan_out``).
+        """
+        return fan_out(self, branch_ids, query, limit=limit, timeout=timeout)
+
+    def fan_out_items(self, branch_ids: Iterable[SafeUUID | str], query: BranchQuery, *,
+                      limit: int = 8, timeout: Optional[float] = 15.0) -> AsyncIterator[tuple[SafeUUID, Any]]:
+        """``(branch_id, item)`` pairs of a list query across branches."""
+        return fan_out_items(self, branch_ids, query, limit=limit, timeout=timeout)
 
     async def send_request(self, endpoint: str, params: dict | str | None = None) -> PlatformResponse:
-        from .utils import sync_request
+        read = is_read_endpoint(endpoint)
+        if read and self.snapshots is not None:
+            local = self.snapshots.answer(endpoint, params)
+            if local is not None:
+                return local
+
+        try:
+            if self.cache is not None:
+                response = await self.cache.fetch(self, endpoint, params, self._fetch)
+            else:
+                response = await self._fetch(endpoint, params)
+            if read and self.snapshots is not None:
+                self.snapshots.capture(endpoint, params, response)
+            return response
+        finally:
+            if not read:
+                branch_id = body_field(params, "companyBranchId")
+                if endpoint_service(endpoint) in SCHEDULE_SERVICES:
+                    self.schedules.invalidate(branch_id)
+                if self.snapshots is not None:
+                    self.snapshots.invalidate(endpoint_service(endpoint), branch_id)
+                self.reference.invalidate(endpoint_service(endpoint), branch_id)
+
+    async def refresh_snapshot(self, endpoint: str, params: dict,
+                               concurrency: int = 4) -> list:
+        """
+        Loads the full dataset of a snapshot endpoint so later list queries
+        with the same body are answered locally.
+        """
+        if self.snapshots is None:
+            raise ValueError("Snapshots are disabled for this client")
+        return await self.snapshots.refresh(endpoint, params, self._fetch,
+                                            concurrency=concurrency)
+
+    async def _fetch(self, endpoint: str, params: dict | str | None = None) -> PlatformResponse:
+        """
+        Identical concurrent reads share one request and one PlatformResponse.
+        """
+        if self.single_flight is not None and is_read_endpoint(endpoint):
+            return await self.single_flight.do(
+                request_key(self, endpoint, params),
+                lambda: self._send(endpoint, params)
+            )
+        return await self._send(endpoint, params)
+
+    async def _send(self, endpoint: str, params: dict | str | None = None) -> PlatformResponse:
         path = f"{self.base_path}{endpoint}"
-        return await asyncio.to_thread(sync_request, self, path, params)
\ No newline at end of file
+        if self.breaker is None:
+            return await self.policy.execute(
+                endpoint, lambda timeout: self._attempt(path, endpoint, params, timeout)
+            )
+
+        family = endpoint_service(endpoint)
+        if not self.breaker.allow(family):
+            return self._refused(family, endpoint, params)
+
+        try:
+            response = await self.policy.execute(
+                endpoint, lambda timeout: self._attempt(path, endpoint, params, timeout)
+            )
+        except asyncio.CancelledError:
+            self.breaker.release(family)
+            raise
+        except Exception:
+            self.breaker.record(family, False)
+            raise
+        self.breaker.record(family, response.status < 500)
+        return response
+
+    def _refused(self, family: str, endpoint: str, params: dict | str | None) -> PlatformResponse:
+        """
+        Answer for a request the open circuit refused: the last good cached
+        read marked ``stale`` (and a background revalidation), or a 503.
+        """
+        stale = None
+        if self.cache is not None and is_read_endpoint(endpoint):
+            stale = self.cache.get_stale(request_key(self, endpoint, params))
+        if stale is None:
+            return circuit_open_response(family)
+
+        task = self._revalidations.get(family)
+        if task is None or task.done():
+            with request_priority(Priority.BACKGROUND):
+                task = self._revalidations[family] = asyncio.ensure_future(
+                    self._revalidate(family, endpoint, params)
+                )
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        return stale.as_stale()
+
+    async def _revalidate(self, family: str, endpoint: str, params: dict | str | None):
+        """Becomes the half-open probe of ``family``; success refreshes the cache."""
+        await asyncio.sleep(self.breaker.retry_in(family))
+        await self.cache.fetch(self, endpoint, params, self._fetch)
+
+    async def _attempt(self, path: str, endpoint: str, params: dict | str | None,
+                       timeout: float) -> PlatformResponse:
+        """One request through the rate limiter, resent while it is throttled."""
+        if self.limiter is None:
+            return await self.transport.request(self, path, params, timeout=timeout)
+
+        # 429 is never processed; 503 is only resent for reads.
+        retries = self.throttle_retries
+        while True:
+            await self.limiter.acquire()
+            response = await self.transport.request(self, path, params, timeout=timeout)
+            self.limiter.feedback(response.status, response.headers)
+            if (response.status not in THROTTLE_STATUSES or retries <= 0
+                    or (response.status != 429 and not is_read_endpoint(endpoint))):
+                return response
+            retries -= 1
+
+    async def stream_items(self, endpoint: str, params: dict | str | None = None,
+                           path: ItemsPath = ("data", "data")) -> AsyncIterator[Any]:
+        """
+        Streaming counterpart of send_request for list endpoints: yields the
+        elements of the array at ``path`` while the body is still arriving.
+        Bypasses the response cache and request coalescing.
+        """
+        request_path = f"{self.base_path}{endpoint}"
+        if self.limiter is not None:
+            await self.limiter.acquire()
+        async with self.transport.stream(self, request_path, params,
+                                         timeout=self.policy.timeout_for(endpoint)) as stream:
+            if self.limiter is not None:
+                self.limiter.feedback(stream.status, stream.headers)
+            if not stream.ok:
+                body = await stream.read()
+                snippet = body[:200].decode(response_encoding(stream.headers), errors="replace")
+                raise ValueError(f"Request failed (status {stream.status}): {snippet}")
+
+            async for item in stream.items(path, response_encoding(stream.headers)):
+                yield item
+
+    async def close(self):
+        for task in self._revalidations.values():
+            task.cancel()
+        self._revalidations.clear()
+        await self.reference.stop()
+        if self._owns_transport:
+            await self.transport.close()
\ No newline at end of file
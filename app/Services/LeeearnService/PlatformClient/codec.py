@@ -0,0 +1,92 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional speedup
+    msgspec = None
+
+
+class JsonCodec:
+    """
+    Encodes request bodies and decodes response bodies.
+
+    ``loads`` accepts UTF-8 ``bytes`` or ``str``; ``decode_errors`` lists the
+    exceptions it raises on malformed input.
+    """
+    name = "json"
+    decode_errors: tuple[type[Exception], ...] = (ValueError,)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self.decode_errors = (ValueError, msgspec.DecodeError)
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode()
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+def available_codecs() -> dict[str, type[JsonCodec]]:
+    codecs = {"json": JsonCodec}
+    if orjson is not None:
+        codecs["orjson"] = OrjsonCodec
+    if msgspec is not None:
+        codecs["msgspec"] = MsgspecCodec
+    return codecs
+
+
+_codec: JsonCodec = JsonCodec()
+
+
+def get_codec() -> JsonCodec:
+    return _codec
+
+
+def set_codec(codec: str | JsonCodec = "auto") -> JsonCodec:
+    """
+    Selects the process-wide codec by name (``json``, ``orjson``, ``msgspec``)
+    or instance. ``auto`` picks the fastest installed one.
+    """
+    global _codec
+
+    if isinstance(codec, JsonCodec):
+        _codec = codec
+        return _codec
+
+    codecs = available_codecs()
+    if codec == "auto":
+        codec = next(name for name in ("orjson", "msgspec", "json") if name in codecs)
+    if codec not in codecs:
+        raise ValueError(f"JSON codec '{codec}' is not installed "
+                         f"(available: {', '.join(codecs)})")
+
+    _codec = codecs[codec]()
+    return _codec
@@ -0,0 +1,96 @@
+import asyncio
+import time
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterable, Optional
+
+from .pagination import page_items
+from .types import SafeUUID
+from .utils import PlatformResponse
+
+if TYPE_CHECKING:
+    from .client import PlatformClient
+    from .models.branch import BranchClass
+
+BranchQuery = Callable[["BranchClass"], Awaitable[Any]]
+
+
+class BranchResult:
+    """
+    Outcome of the query for one branch. ``ok`` is False for an exception
+    (including a timeout) and for a PlatformResponse with an error status.
+    """
+    __slots__ = ("branch_id", "value", "error", "seconds")
+
+    def __init__(self, branch_id: SafeUUID, value: Any = None,
+                 error: Optional[BaseException] = None, seconds: float = 0.0):
+        self.branch_id = branch_id
+        self.value = value
+        self.error = error
+        self.seconds = seconds
+
+    @property
+    def ok(self) -> bool:
+        if self.error is not None:
+            return False
+        return not isinstance(self.value, PlatformResponse) or self.value.ok
+
+    def items(self) -> list:
+        """The list behind the value: a list response's items or the list itself."""
+        if not self.ok:
+            return []
+        if isinstance(self.value, PlatformResponse):
+            return page_items(self.value.json())
+        return list(self.value) if isinstance(self.value, (list, tuple)) else [self.value]
+
+    def __repr__(self):
+        state = "ok" if self.ok else f"error={self.error or self.value.status!r}"
+        return f"BranchResult({self.branch_id}, {state}, {self.seconds:.3f}s)"
+
+
+async def fan_out(client: "PlatformClient", branch_ids: Iterable[SafeUUID | str],
+                  query: BranchQuery, *, limit: int = 8,
+                  timeout: Optional[float] = 15.0) -> AsyncIterator[BranchResult]:
+    """
+    Runs ``query(branch)`` for every branch, at most ``limit`` branches at a
+    time, each bounded by ``timeout`` seconds, and yields one BranchResult per
+    branch in completion order. Leaving the loop early cancels the rest.
+
+    ``async for result in fan_out(client, ids, lambda branch: branch.Teachers.fetch_all()): ...``
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(branch_id: SafeUUID) -> BranchResult:
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                value = await asyncio.wait_for(query(client.GetBranch(branch_id)), timeout)
+                return BranchResult(branch_id, value, seconds=time.monotonic() - started)
+            except Exception as e:
+                return BranchResult(branch_id, error=e, seconds=time.monotonic() - started)
+
+    # Duplicate ids would only query the same branch twice.
+    ids = list(dict.fromkeys(SafeUUID(branch_id) for branch_id in branch_ids))
+    tasks = [asyncio.ensure_future(run(branch_id)) for branch_id in ids]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def fan_out_items(client: "PlatformClient", branch_ids: Iterable[SafeUUID | str],
+                        query: BranchQuery, *, limit: int = 8,
+                        timeout: Optional[float] = 15.0) -> AsyncIterator[tuple[SafeUUID, Any]]:
+    """
+    ``fan_out`` for list queries: yields ``(branch_id, item)`` as each branch
+    answers. Failed branches are skipped; use ``fan_out`` to see them.
+    """
+    async with aclosing(fan_out(client, branch_ids, query,
+                                limit=limit, timeout=timeout)) as results:
+        async for result in results:
+            for item in result.items():
+                yield result.branch_id, item
@@ -0,0 +1,145 @@
+from typing import Any, Callable, Iterable, Optional
+
+from .query_builder import CompareType, QueryBuilder
+from .utils import body_field
+
+_MISSING = object()
+
+
+class UnsupportedQuery(ValueError):
+    """The query uses something the local evaluator does not reproduce faithfully."""
+
+
+def extract(item: Any, property_path: str) -> Any:
+    """
+    Dotted, case-insensitive property lookup (``"lesson.name"`` matches
+    ``{"Lesson": {"name": ...}}``). Missing properties are None.
+    """
+    value = item
+    for name in property_path.split("."):
+        if value is None:
+            return None
+        if not isinstance(value, dict):
+            raise UnsupportedQuery(f"Property path '{property_path}' crosses a non-object")
+        found = value.get(name, _MISSING)
+        if found is _MISSING:
+            found = body_field(value, name)
+        value = found
+    if isinstance(value, (list, dict)):
+        raise UnsupportedQuery(f"Property path '{property_path}' is not a scalar")
+    return value
+
+
+def _coerce(value: Any, like: Any) -> Any:
+    """Brings a filter value to the type of the property it is compared with."""
+    if isinstance(like, bool):
+        if isinstance(value, str):
+            return value.strip().lower() == "true"
+        return bool(value)
+    if isinstance(like, (int, float)) and isinstance(value, str):
+        try:
+            return type(like)(value)
+        except ValueError:
+            raise UnsupportedQuery(f"Cannot compare {like!r} with {value!r}")
+    if isinstance(like, str):
+        return str(value).casefold()
+    return value
+
+
+def _matches(item: Any, condition: dict) -> bool:
+    path = body_field(condition, "PropertyPath")
+    if not path:
+        raise UnsupportedQuery("Filter without a property path")
+    if body_field(condition, "ValueBlock") is not None:
+        raise UnsupportedQuery("Nested value blocks are not evaluated locally")
+
+    try:
+        compare = CompareType(body_field(condition, "CompareType") or 0)
+    except ValueError:
+        raise UnsupportedQuery(f"Unknown compare type {body_field(condition, 'CompareType')}")
+
+    prop = extract(item, path)
+
+    if body_field(condition, "ValueNull"):
+        if compare != CompareType.Equals:
+            raise UnsupportedQuery("Null values only support Equals")
+        result = prop is None
+    elif prop is None:
+        result = False
+    else:
+        value = _coerce(body_field(condition, "Value"), prop)
+        if isinstance(prop, str):
+            prop = prop.casefold()
+
+        if compare == CompareType.Equals:
+            result = prop == value
+        elif compare == CompareType.Contains:
+            result = str(value) in str(prop)
+        else:
+            try:
+                if compare == CompareType.GreaterThan:
+                    result = prop > value
+                elif compare == CompareType.GreaterThanOrEqual:
+                    result = prop >= value
+                elif compare == CompareType.LessThan:
+                    result = prop < value
+                else:
+                    result = prop <= value
+            except TypeError:
+                raise UnsupportedQuery(f"Cannot order {prop!r} and {value!r}")
+
+    return not result if body_field(condition, "InvertCompare") else result
+
+
+def _sort_key(value: Any) -> tuple:
+    if value is None:
+        return (0, "")
+    if isinstance(value, str):
+        return (1, value.casefold())
+    return (1, value)
+
+
+def evaluate(items: Iterable[Any], query: None | dict | QueryBuilder,
+             key: Optional[Callable[[Any], Any]] = None) -> tuple[list, int]:
+    """
+    Applies a QueryBuilder query (or its built dict) to in-memory items.
+    With ``key`` the query is applied to ``key(item)`` and the items
+    themselves are returned.
+
+    Conditions of a filter block are ANDed; string comparisons ignore case.
+    Returns ``(page, total matched)``. Raises UnsupportedQuery for anything
+    the platform might evaluate differently (several filter blocks, value
+    blocks, paths into collections).
+    """
+    if isinstance(query, QueryBuilder):
+        query = query.build()
+    query = query or {}
+
+    blocks = body_field(query, "FilterQuery") or []
+    if len(blocks) > 1:
+        raise UnsupportedQuery("Several filter blocks are not evaluated locally")
+    conditions = (body_field(blocks[0], "Properties") or []) if blocks else []
+
+    view = key or (lambda item: item)
+    result = [item for item in items
+              if all(_matches(view(item), condition) for condition in conditions)]
+
+    orders = body_field(query, "OrderQuery") or []
+    if len(orders) > 1:
+        raise UnsupportedQuery("Several order blocks are not evaluated locally")
+    keys = (body_field(orders[0], "Properties") or []) if orders else []
+    try:
+        # Stable sorts from the last key to the first give a multi-key order.
+        for key in reversed(keys):
+            path = body_field(key, "PropertyPath")
+            asc = body_field(key, "Asc")
+            result.sort(key=lambda item: _sort_key(extract(view(item), path)),
+                        reverse=asc is False)
+    except TypeError:
+        raise UnsupportedQuery("Order keys of mixed types")
+
+    total = len(result)
+    offset = body_field(query, "Offset") or 0
+    count = body_field(query, "Count")
+    end = None if count is None else offset + count
+    return result[offset:end], total
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, TypeVar, Generic, Type
 
+from ..pagination import fetch_windows, iterate
 from ..types import SafeUUID
 
 if TYPE_CHECKING:
@@ -25,4 +26,64 @@ class BaseClass(Generic[T_Methods]):
     def __init__(self, client: "PlatformClient", object_id: SafeUUID | str, methods_class: Type[T_Methods]):
         self.client = client
         self.Id = SafeUUID(object_id)
-        self.methods = methods_class(client)
\ No newline at end of file
+        self.methods = methods_class(client)
+
+class LazyMethods:
+    """
+    Builds a sub-API on first attribute access and caches it on the instance.
+
+    Without ``bound_class`` the attribute is ``methods_class(instance.client)``;
+    with it, the methods object is wrapped as ``bound_class(methods, str(instance.Id))``.
+    """
+
+    def __init__(self, methods_class: Type[BaseMethods], bound_class: type | None = None):
+        self.methods_class = methods_class
+        self.bound_class = bound_class
+        self.name = ""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        value = self.methods_class(instance.client)
+        if self.bound_class is not None:
+            value = self.bound_class(value, str(instance.Id))
+
+        instance.__dict__[self.name] = value
+        return value
+
+
+class PaginatedMethods:
+    """
+    Mixin for Bound*Methods whose ``list_method`` takes a QueryBuilder.
+
+    ``async for item in branch.Leads.iter(query): ...``
+    ``items = await branch.Customers.fetch_all(query, concurrency=8)``
+    """
+    list_method = "GetList"
+
+    def iter(self, filter_query=None, *, page_size: int = 100,
+             prefetch: bool = True, limit: int | None = None, **kwargs):
+        list_method = getattr(self, self.list_method)
+        return iterate(
+            lambda query: list_method(query, **kwargs),
+            filter_query,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit
+        )
+
+    async def fetch_all(self, filter_query=None, *, window: int = 100,
+                        concurrency: int = 4, limit: int | None = None,
+                        **kwargs) -> list:
+        list_method = getattr(self, self.list_method)
+        return await fetch_windows(
+            lambda query: list_method(query, **kwargs),
+            filter_query,
+            window=window,
+            concurrency=concurrency,
+            limit=limit
+        )
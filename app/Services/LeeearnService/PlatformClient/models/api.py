@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID, UserAccess
-from ._default import BaseMethods, BaseClass
+from ._default import BaseMethods, BaseClass, PaginatedMethods
 
 if TYPE_CHECKING:
     from ..client import PlatformClient
@@ -148,7 +148,7 @@ class APIMethods(BaseMethods):
 
 
 
-class BoundAPIMethods:
+class BoundAPIMethods(PaginatedMethods):
     def __init__(self, methods: APIMethods, branch_id: SafeUUID | str):
         self.methods = methods
         self.branch_id = branch_id
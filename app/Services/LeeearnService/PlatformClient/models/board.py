@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID
-from ._default import BaseMethods, BaseClass
+from ._default import BaseMethods, BaseClass, PaginatedMethods
 from ..utils import PlatformResponse
 
 if TYPE_CHECKING:
@@ -825,7 +825,9 @@ class BoardMethods(BaseMethods):
         )
 
 
-class BoundBoardMethods:
+class BoundBoardMethods(PaginatedMethods):
+    list_method = "Get"
+
     def __init__(self, methods: BoardMethods, branch_id: SafeUUID | str):
         self.methods = methods
         self.branch_id = branch_id
@@ -1,6 +1,7 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
-from ._default import BaseClass, BaseMethods
+from ..bulk import BulkReport, Invocation, gather_limited
+from ._default import BaseClass, BaseMethods, LazyMethods
 from .api import APIClass, APIMethods, BoundAPIMethods
 from .board import BoundBoardMethods, BoardMethods
 from .course import BoundCourseMethods, CourseMethods
@@ -24,22 +25,20 @@ if TYPE_CHECKING:
 class BranchMethods(BaseMethods):
     path = "CompanyBranch"
 
-    def __init__(self, client: "PlatformClient"):
-        super().__init__(client)
-        self.API = APIMethods(client)
-        self.Leads = LeadMethods(client)
-        self.Teachers = TeacherMethods(client)
-        self.Managers = ManagerMethods(client)
-        self.MemberContent = MemberContentMethods(client)
-        self.Roles = RoleMethods(client)
-        self.GroupSchedule = GroupScheduleMethods(client)
-        self.Lessons = LessonMethods(client)
-        self.Tags = TagMethods(client)
-        self.Directions = DirectionMethods(client)
-        self.Courses = CourseMethods(client)
-        self.Customers = CustomerMethods(client)
-        self.Groups = GroupMethods(client)
-        self.Boards = BoardMethods(client)
+    API = LazyMethods(APIMethods)
+    Leads = LazyMethods(LeadMethods)
+    Teachers = LazyMethods(TeacherMethods)
+    Managers = LazyMethods(ManagerMethods)
+    MemberContent = LazyMethods(MemberContentMethods)
+    Roles = LazyMethods(RoleMethods)
+    GroupSchedule = LazyMethods(GroupScheduleMethods)
+    Lessons = LazyMethods(LessonMethods)
+    Tags = LazyMethods(TagMethods)
+    Directions = LazyMethods(DirectionMethods)
+    Courses = LazyMethods(CourseMethods)
+    Customers = LazyMethods(CustomerMethods)
+    Groups = LazyMethods(GroupMethods)
+    Boards = LazyMethods(BoardMethods)
 
     async def GetAccess(self, branch_id: SafeUUID | str):
         return await self.client.send_request(
@@ -50,22 +49,23 @@ class BranchMethods(BaseMethods):
 class BranchClass(BaseClass[BranchMethods]):
     path = "CompanyBranch"
 
+    API = LazyMethods(APIMethods, BoundAPIMethods)
+    Leads = LazyMethods(LeadMethods, BoundLeadMethods)
+    Teachers = LazyMethods(TeacherMethods, BoundTeacherMethods)
+    Managers = LazyMethods(ManagerMethods, BoundManagerMethods)
+    MemberContent = LazyMethods(MemberContentMethods, BoundMemberContent)
+    Roles = LazyMethods(RoleMethods, BoundRoleMethods)
+    GroupSchedule = LazyMethods(GroupScheduleMethods, BoundGroupScheduleMethods)
+    Lessons = LazyMethods(LessonMethods, BoundLessonMethods)
+    Tags = LazyMethods(TagMethods, BoundTagMethods)
+    Directions = LazyMethods(DirectionMethods, BoundDirectionMethods)
+    Courses = LazyMethods(CourseMethods, BoundCourseMethods)
+    Customers = LazyMethods(CustomerMethods, BoundCustomerMethods)
+    Groups = LazyMethods(GroupMethods, BoundGroupMethods)
+    Boards = LazyMethods(BoardMethods, BoundBoardMethods)
+
     def __init__(self, client: "PlatformClient", branch_id: SafeUUID | str):
         super().__init__(client, branch_id, BranchMethods)
-        self.API = BoundAPIMethods(APIMethods(client), branch_id)
-        self.Leads = BoundLeadMethods(LeadMethods(client), branch_id)
-        self.Teachers = BoundTeacherMethods(TeacherMethods(client), branch_id)
-        self.Managers = BoundManagerMethods(ManagerMethods(client), branch_id)
-        self.MemberContent = BoundMemberContent(MemberContentMethods(client), branch_id)
-        self.Roles = BoundRoleMethods(RoleMethods(client), branch_id)
-        self.GroupSchedule = BoundGroupScheduleMethods(GroupScheduleMethods(client), branch_id)
-        self.Lessons = BoundLessonMethods(LessonMethods(client), branch_id)
-        self.Tags = BoundTagMethods(TagMethods(client), branch_id)
-        self.Directions = BoundDirectionMethods(DirectionMethods(client), branch_id)
-        self.Courses = BoundCourseMethods(CourseMethods(client), branch_id)
-        self.Customers = BoundCustomerMethods(CustomerMethods(client), branch_id)
-        self.Groups = BoundGroupMethods(GroupMethods(client), branch_id)
-        self.Boards = BoundBoardMethods(BoardMethods(client), branch_id)
 
     def GetAPI(self, api_id: SafeUUID | str) -> APIClass:
         return APIClass(self.client, self.Id, api_id)
@@ -82,3 +82,11 @@ class BranchClass(BaseClass[BranchMethods]):
     async def GetAccess(self):
         return await self.methods.GetAccess(self.Id)
 
+    async def bulk(self, calls: Iterable[Invocation], limit: int = 8) -> BulkReport:
+        """
+        Runs many calls of this branch concurrently (see ``gather_limited``):
+
+        ``await branch.bulk([(branch.Groups.GetDetails, group_id) for group_id in ids])``
+        """
+        return await gather_limited(calls, limit=limit)
+
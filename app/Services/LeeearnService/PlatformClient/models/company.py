@@ -15,8 +15,8 @@ class CompanyMethods(BaseMethods):
         super().__init__(client)
         self.Branch = BranchMethods(client)
 
-    def GetBranch(self, branch_id: SafeUUID | str):
-        return BranchClass(self.client, branch_id)
+    def GetBranch(self, branch_id: SafeUUID | str) -> BranchClass:
+        return self.client.GetBranch(branch_id)
 
     async def GetAccess(self, branch_id: SafeUUID | str):
         return await self.client.send_request(
@@ -30,8 +30,8 @@ class CompanyClass(BaseClass[CompanyMethods]):
     def __init__(self, client: "PlatformClient", company_id: SafeUUID | str):
         super().__init__(client, company_id, CompanyMethods)
 
-    def GetBranch(self, branch_id: SafeUUID | str):
-        return BranchClass(self.client, branch_id)
+    def GetBranch(self, branch_id: SafeUUID | str) -> BranchClass:
+        return self.client.GetBranch(branch_id)
 
     async def GetAccess(self):
         return await self.methods.GetAccess(self.Id)
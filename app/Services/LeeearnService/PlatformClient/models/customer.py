@@ -2,8 +2,17 @@ from http.client import HTTPResponse
 from typing import TYPE_CHECKING
 
 from ..query_builder import QueryBuilder
+from ..schedule import (
+    ScheduleBound,
+    ScheduleItem,
+    fetch_schedule_window,
+    schedule_items,
+    window_query
+)
+from ..schedule_index import ScheduleIndex
 from ..types import SafeUUID
-from ._default import BaseMethods, BaseClass
+from ..utils import branch_key
+from ._default import BaseMethods, BaseClass, PaginatedMethods
 
 if TYPE_CHECKING:
     from ..client import PlatformClient
@@ -83,7 +92,10 @@ class CustomerMethods(BaseMethods):
             self,
             branch_id: SafeUUID | str,
             customer_id: SafeUUID | str,
-            filter_query: None | dict | QueryBuilder = None
+            filter_query: None | dict | QueryBuilder = None,
+            *,
+            date_from: ScheduleBound = None,
+            date_to: ScheduleBound = None
     ) -> HTTPResponse:
         """
         Endpoint: /CompanyBranchCustomer/GetScheduleItemList
@@ -98,7 +110,12 @@ class CustomerMethods(BaseMethods):
         :param branch_id: Branch ID
         :param customer_id: Customer ID
         :param filter_query: Optional filter
+        :param date_from: Local start of the window (filtered and ordered server-side)
+        :param date_to: Local end of the window, exclusive
         """
+        if date_from is not None or date_to is not None:
+            filter_query = window_query(date_from, date_to, filter_query)
+
         new_filter_query = filter_query or {}
         if isinstance(new_filter_query, QueryBuilder):
             new_filter_query = new_filter_query.build()
@@ -112,8 +129,78 @@ class CustomerMethods(BaseMethods):
             }
         )
 
+    async def GetScheduleItems(
+            self, branch_id: SafeUUID | str,
+            customer_id: SafeUUID | str,
+            filter_query: None | dict | QueryBuilder = None,
+            *,
+            date_from: ScheduleBound = None,
+            date_to: ScheduleBound = None
+    ) -> tuple[ScheduleItem, ...]:
+        """
+        GetScheduleItemList parsed into ScheduleItems sorted by start;
+        entries with invalid dates are dropped.
+
+        With ``date_from``/``date_to`` (local time, ``[from, to)``) only that
+        window is returned; it is filtered on the server only as far as
+        ``client.schedule_windows`` allows.
+        """
+        if date_from is None and date_to is None:
+            response = await self.GetScheduleItemList(branch_id, customer_id,
+                                                      filter_query)
+            return schedule_items(response)
+
+        return await fetch_schedule_window(
+            lambda query: self.GetScheduleItemList(branch_id, customer_id, query),
+            date_from, date_to, filter_query,
+            pushdown=self.client.schedule_windows,
+            endpoint=f"{self.path}/GetScheduleItemList"
+        )
+
+    async def GetScheduleIndex(
+            self, branch_id: SafeUUID | str,
+            customer_id: SafeUUID | str,
+            *,
+            date_from: ScheduleBound = None,
+            date_to: ScheduleBound = None
+    ) -> ScheduleIndex:
+        """
+        Cached ScheduleIndex over the schedule, or over the given window
+        (see ``client.schedules``). One index is kept per customer; windows are
+        sliced from it and only the part not loaded yet is requested.
+        """
+        return await self.client.schedules.get(
+            ("customer", branch_key(branch_id), str(customer_id)),
+            lambda start, end: self.GetScheduleItems(branch_id, customer_id,
+                                                     date_from=start, date_to=end),
+            date_from, date_to
+        )
+
+    def StreamScheduleItemList(
+            self,
+            branch_id: SafeUUID | str,
+            customer_id: SafeUUID | str,
+            filter_query: None | dict | QueryBuilder = None
+    ):
+        """
+        Streaming GetScheduleItemList: an async iterator over ``data.data``
+        items decoded while the body arrives, so callers can stop early.
+        """
+        new_filter_query = filter_query or {}
+        if isinstance(new_filter_query, QueryBuilder):
+            new_filter_query = new_filter_query.build()
+
+        return self.client.stream_items(
+            f"{self.path}/GetScheduleItemList",
+            {
+                "companyBranchId": str(branch_id),
+                "customerId": str(customer_id),
+                "data": new_filter_query
+            }
+        )
+
 
-class BoundCustomerMethods:
+class BoundCustomerMethods(PaginatedMethods):
     def __init__(self, methods: CustomerMethods, branch_id: SafeUUID | str):
         self.methods = methods
         self.branch_id = branch_id
@@ -132,8 +219,33 @@ class BoundCustomerMethods:
         )
 
     async def GetScheduleItemList(self, customer_id: SafeUUID | str,
-                                  filter_query=None):
+                                  filter_query=None, *, date_from=None,
+                                  date_to=None):
         return await self.methods.GetScheduleItemList(
+            self.branch_id,
+            customer_id,
+            filter_query=filter_query,
+            date_from=date_from,
+            date_to=date_to
+        )
+
+    async def GetScheduleItems(self, customer_id: SafeUUID | str,
+                               filter_query=None, *, date_from=None,
+                               date_to=None):
+        return await self.methods.GetScheduleItems(self.branch_id, customer_id,
+                                                   filter_query,
+                                                   date_from=date_from,
+                                                   date_to=date_to)
+
+    async def GetScheduleIndex(self, customer_id: SafeUUID | str, *,
+                               date_from=None, date_to=None):
+        return await self.methods.GetScheduleIndex(self.branch_id, customer_id,
+                                                   date_from=date_from,
+                                                   date_to=date_to)
+
+    def StreamScheduleItemList(self, customer_id: SafeUUID | str,
+                               filter_query=None):
+        return self.methods.StreamScheduleItemList(
             self.branch_id,
             customer_id,
             filter_query=filter_query
@@ -153,8 +265,30 @@ class CustomerClass(BaseClass[CustomerMethods]):
     async def GetCustomerGroups(self, filter_query=None):
         return await self.methods.GetCustomerGroups(self.BranchId, self.Id, filter_query)
 
-    async def GetScheduleItemList(self, filter_query=None):
+    async def GetScheduleItemList(self, filter_query=None, *, date_from=None,
+                                  date_to=None):
         return await self.methods.GetScheduleItemList(
+            self.BranchId,
+            self.Id,
+            filter_query,
+            date_from=date_from,
+            date_to=date_to
+        )
+
+    async def GetScheduleItems(self, filter_query=None, *, date_from=None,
+                               date_to=None):
+        return await self.methods.GetScheduleItems(self.BranchId, self.Id,
+                                                   filter_query,
+                                                   date_from=date_from,
+                                                   date_to=date_to)
+
+    async def GetScheduleIndex(self, *, date_from=None, date_to=None):
+        return await self.methods.GetScheduleIndex(self.BranchId, self.Id,
+                                                   date_from=date_from,
+                                                   date_to=date_to)
+
+    def StreamScheduleItemList(self, filter_query=None):
+        return self.methods.StreamScheduleItemList(
             self.BranchId,
             self.Id,
             filter_query
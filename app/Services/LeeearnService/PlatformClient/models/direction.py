@@ -2,7 +2,7 @@ from http.client import HTTPResponse
 from typing import TYPE_CHECKING
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID
-from ._default import BaseMethods, BaseClass
+from ._default import BaseMethods, BaseClass, PaginatedMethods
 
 if TYPE_CHECKING:
     from ..client import PlatformClient
@@ -57,7 +57,9 @@ class DirectionMethods(BaseMethods):
         )
 
 
-class BoundDirectionMethods:
+class BoundDirectionMethods(PaginatedMethods):
+    list_method = "Get"
+
     def __init__(self, methods: DirectionMethods, branch_id: SafeUUID | str):
         self.methods = methods
         self.branch_id = branch_id
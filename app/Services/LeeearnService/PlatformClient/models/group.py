@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, List, Dict, Optional
 
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID
-from ._default import BaseMethods, BaseClass
+from ._default import BaseMethods, BaseClass, PaginatedMethods
 
 if TYPE_CHECKING:
     from ..client import PlatformClient
@@ -159,7 +159,9 @@ class GroupMethods(BaseMethods):
         )
 
 
-class BoundGroupMethods:
+class BoundGroupMethods(PaginatedMethods):
+    list_method = "Get"
+
     def __init__(self, methods: GroupMethods, branch_id: SafeUUID | str):
         self.methods = methods
         self.branch_id = branch_id
@@ -2,6 +2,10 @@ from datetime import datetime, timedelta
 from http.client import HTTPResponse
 from typing import TYPE_CHECKING
 
+from app.Services.LeeearnService.PlatformClient.bulk import (
+    BulkReport,
+    gather_limited
+)
 from app.Services.LeeearnService.PlatformClient.models._default import (
     BaseMethods,
     BaseClass
@@ -242,6 +246,24 @@ class BoundGroupScheduleMethods:
         return await self.methods.ConfirmStudent(self.branch_id, group_id,
                                                  data)
 
+    async def ConfirmStudents(self, group_id: SafeUUID | str,
+                              item_id: SafeUUID | str,
+                              user_ids: list[SafeUUID | str],
+                              confirmed: bool = True,
+                              limit: int = 8) -> BulkReport:
+        """
+        ``ConfirmStudent`` for every user of one schedule item, concurrently.
+        Results follow ``user_ids``; failures are reported per student.
+        """
+        return await gather_limited(
+            [(self.ConfirmStudent, group_id, {
+                "groupScheduleItemId": str(item_id),
+                "userId": str(user_id),
+                "confirmed": confirmed
+            }) for user_id in user_ids],
+            limit=limit
+        )
+
     async def GetTeachersSchedule(self, group_id: SafeUUID | str, data: dict):
         return await self.methods.GetTeachersSchedule(self.branch_id, group_id,
                                                       data)
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Dict
 
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID, UserAccess
-from ._default import BaseMethods, BaseClass
+from ._default import BaseMethods, BaseClass, PaginatedMethods
 
 if TYPE_CHECKING:
     from ..client import PlatformClient
@@ -141,7 +141,7 @@ class LeadMethods(BaseMethods):
         )
 
 
-class BoundLeadMethods:
+class BoundLeadMethods(PaginatedMethods):
     def __init__(self, methods: LeadMethods, branch_id: SafeUUID | str):
         self.methods = methods
         self.branch_id = branch_id
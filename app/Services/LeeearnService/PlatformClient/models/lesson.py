@@ -1,7 +1,7 @@
 from http.client import HTTPResponse
 from typing import TYPE_CHECKING
 
-from ._default import BaseMethods, BaseClass
+from ._default import BaseMethods, BaseClass, PaginatedMethods
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID
 
@@ -54,7 +54,7 @@ class LessonMethods(BaseMethods):
         )
 
 
-class BoundLessonMethods:
+class BoundLessonMethods(PaginatedMethods):
     def __init__(self, methods: LessonMethods, branch_id: SafeUUID | str):
         self.methods = methods
         self.branch_id = branch_id
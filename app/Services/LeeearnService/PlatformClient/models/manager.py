@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID, UserAccess
-from ._default import BaseMethods, BaseClass
+from ._default import BaseMethods, BaseClass, PaginatedMethods
 
 if TYPE_CHECKING:
     from ..client import PlatformClient
@@ -45,7 +45,7 @@ class ManagerMethods(BaseMethods):
 
 
 
-class BoundManagerMethods:
+class BoundManagerMethods(PaginatedMethods):
     def __init__(self, methods: ManagerMethods, branch_id: SafeUUID | str):
         self.methods = methods
         self.branch_id = branch_id
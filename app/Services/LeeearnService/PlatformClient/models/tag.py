@@ -1,7 +1,7 @@
 from http.client import HTTPResponse
 from typing import TYPE_CHECKING
 
-from ._default import BaseMethods, BaseClass
+from ._default import BaseMethods, BaseClass, PaginatedMethods
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID
 
@@ -42,7 +42,9 @@ class TagMethods(BaseMethods):
         )
 
 
-class BoundTagMethods:
+class BoundTagMethods(PaginatedMethods):
+    list_method = "Get"
+
     def __init__(self, methods: TagMethods, branch_id: SafeUUID | str):
         self.methods = methods
         self.branch_id = branch_id
@@ -2,8 +2,17 @@ from http.client import HTTPResponse
 from typing import TYPE_CHECKING
 
 from ..query_builder import QueryBuilder
+from ..schedule import (
+    ScheduleBound,
+    ScheduleItem,
+    fetch_schedule_window,
+    schedule_items,
+    window_query
+)
+from ..schedule_index import ScheduleIndex
 from ..types import SafeUUID, UserAccess
-from ._default import BaseMethods, BaseClass
+from ..utils import branch_key
+from ._default import BaseMethods, BaseClass, PaginatedMethods
 
 if TYPE_CHECKING:
     from ..client import PlatformClient
@@ -53,7 +62,10 @@ class TeacherMethods(BaseMethods):
     async def GetScheduleItemList(
             self, branch_id: SafeUUID | str,
             teacher_id: SafeUUID | str,
-            filter_query: None | dict | QueryBuilder = None) -> HTTPResponse:
+            filter_query: None | dict | QueryBuilder = None,
+            *,
+            date_from: ScheduleBound = None,
+            date_to: ScheduleBound = None) -> HTTPResponse:
         """
         Endpoint: /CompanyBranchTeacher/GetScheduleItemList
 
@@ -65,7 +77,12 @@ class TeacherMethods(BaseMethods):
         :param branch_id: Branch ID
         :param teacher_id: Teacher ID
         :param filter_query: Filter query data
+        :param date_from: Local start of the window (filtered and ordered server-side)
+        :param date_to: Local end of the window, exclusive
         """
+        if date_from is not None or date_to is not None:
+            filter_query = window_query(date_from, date_to, filter_query)
+
         new_filter_query = filter_query or {}
         if isinstance(new_filter_query, QueryBuilder):
             new_filter_query = new_filter_query.build()
@@ -77,6 +94,72 @@ class TeacherMethods(BaseMethods):
              "teacherId": str(teacher_id)}
         )
 
+    async def GetScheduleItems(
+            self, branch_id: SafeUUID | str,
+            teacher_id: SafeUUID | str,
+            filter_query: None | dict | QueryBuilder = None,
+            *,
+            date_from: ScheduleBound = None,
+            date_to: ScheduleBound = None
+    ) -> tuple[ScheduleItem, ...]:
+        """
+        GetScheduleItemList parsed into ScheduleItems sorted by start;
+        entries with invalid dates are dropped.
+
+        With ``date_from``/``date_to`` (local time, ``[from, to)``) only that
+        window is returned; it is filtered on the server only as far as
+        ``client.schedule_windows`` allows.
+        """
+        if date_from is None and date_to is None:
+            response = await self.GetScheduleItemList(branch_id, teacher_id,
+                                                      filter_query)
+            return schedule_items(response)
+
+        return await fetch_schedule_window(
+            lambda query: self.GetScheduleItemList(branch_id, teacher_id, query),
+            date_from, date_to, filter_query,
+            pushdown=self.client.schedule_windows,
+            endpoint=f"{self.path}/GetScheduleItemList"
+        )
+
+    async def GetScheduleIndex(
+            self, branch_id: SafeUUID | str,
+            teacher_id: SafeUUID | str,
+            *,
+            date_from: ScheduleBound = None,
+            date_to: ScheduleBound = None
+    ) -> ScheduleIndex:
+        """
+        Cached ScheduleIndex over the schedule, or over the given window
+        (see ``client.schedules``). One index is kept per teacher; windows are
+        sliced from it and only the part not loaded yet is requested.
+        """
+        return await self.client.schedules.get(
+            ("teacher", branch_key(branch_id), str(teacher_id)),
+            lambda start, end: self.GetScheduleItems(branch_id, teacher_id,
+                                                     date_from=start, date_to=end),
+            date_from, date_to
+        )
+
+    def StreamScheduleItemList(
+            self, branch_id: SafeUUID | str,
+            teacher_id: SafeUUID | str,
+            filter_query: None | dict | QueryBuilder = None):
+        """
+        Streaming GetScheduleItemList: an async iterator over ``data.data``
+        items decoded while the body arrives, so callers can stop early.
+        """
+        new_filter_query = filter_query or {}
+        if isinstance(new_filter_query, QueryBuilder):
+            new_filter_query = new_filter_query.build()
+
+        return self.client.stream_items(
+            f"{self.path}/GetScheduleItemList",
+            {"companyBranchId": str(branch_id),
+             "data": new_filter_query,
+             "teacherId": str(teacher_id)}
+        )
+
     async def GetSchedule(
             self, branch_id: SafeUUID | str,
             teacher_id: SafeUUID | str,
@@ -150,7 +233,7 @@ class TeacherMethods(BaseMethods):
         return await self.client.send_request(f"{self.path}/GetContacts", body)
 
 
-class BoundTeacherMethods:
+class BoundTeacherMethods(PaginatedMethods):
     def __init__(self, methods: TeacherMethods, branch_id: SafeUUID | str):
         self.methods = methods
         self.branch_id = branch_id
@@ -163,9 +246,31 @@ class BoundTeacherMethods:
         return await self.methods.GetDetails(self.branch_id, teacher_id)
 
     async def GetScheduleItemList(self, teacher_id: SafeUUID | str,
-                                  filter_query=None):
+                                  filter_query=None, *, date_from=None,
+                                  date_to=None):
         return await self.methods.GetScheduleItemList(self.branch_id,
-                                                      teacher_id, filter_query)
+                                                      teacher_id, filter_query,
+                                                      date_from=date_from,
+                                                      date_to=date_to)
+
+    async def GetScheduleItems(self, teacher_id: SafeUUID | str,
+                               filter_query=None, *, date_from=None,
+                               date_to=None):
+        return await self.methods.GetScheduleItems(self.branch_id, teacher_id,
+                                                   filter_query,
+                                                   date_from=date_from,
+                                                   date_to=date_to)
+
+    async def GetScheduleIndex(self, teacher_id: SafeUUID | str, *,
+                               date_from=None, date_to=None):
+        return await self.methods.GetScheduleIndex(self.branch_id, teacher_id,
+                                                   date_from=date_from,
+                                                   date_to=date_to)
+
+    def StreamScheduleItemList(self, teacher_id: SafeUUID | str,
+                               filter_query=None):
+        return self.methods.StreamScheduleItemList(self.branch_id, teacher_id,
+                                                   filter_query)
 
     async def GetSchedule(self, teacher_id: SafeUUID | str, filter_query=None):
         return await self.methods.GetSchedule(self.branch_id, teacher_id,
@@ -191,9 +296,28 @@ class TeacherClass(BaseClass[TeacherMethods]):
     async def GetDetails(self):
         return await self.methods.GetDetails(self.BranchId, self.Id)
 
-    async def GetScheduleItemList(self, filter_query=None):
+    async def GetScheduleItemList(self, filter_query=None, *, date_from=None,
+                                  date_to=None):
         return await self.methods.GetScheduleItemList(self.BranchId, self.Id,
-                                                      filter_query)
+                                                      filter_query,
+                                                      date_from=date_from,
+                                                      date_to=date_to)
+
+    async def GetScheduleItems(self, filter_query=None, *, date_from=None,
+                               date_to=None):
+        return await self.methods.GetScheduleItems(self.BranchId, self.Id,
+                                                   filter_query,
+                                                   date_from=date_from,
+                                                   date_to=date_to)
+
+    async def GetScheduleIndex(self, *, date_from=None, date_to=None):
+        return await self.methods.GetScheduleIndex(self.BranchId, self.Id,
+                                                   date_from=date_from,
+                                                   date_to=date_to)
+
+    def StreamScheduleItemList(self, filter_query=None):
+        return self.methods.StreamScheduleItemList(self.BranchId, self.Id,
+                                                   filter_query)
 
     async def GetSchedule(self, filter_query=None):
         return await self.methods.GetSchedule(self.BranchId, self.Id,
@@ -0,0 +1,66 @@
+from typing import Any
+
+_UNRESOLVED = object()
+
+
+def normalize(payload: Any) -> Any:
+    """
+    Converts .NET reference-preserving JSON into plain Python objects in one pass.
+
+    - ``{"$id": ..., "$values": [...]}`` becomes the list itself;
+    - ``$id`` keys are dropped from objects;
+    - ``{"$ref": id}`` is replaced by the object registered under that id, so a
+      lesson or group referenced many times is one shared object.
+
+    The walk uses an explicit stack, so deeply nested payloads do not hit the
+    recursion limit. The input is not modified. A ``$ref`` whose id never
+    appears is kept as is.
+    """
+    ids: dict[str, Any] = {}
+    pending: list[tuple[Any, Any, str, dict]] = []
+
+    root = [None]
+    stack: list[tuple[Any, Any]] = [(root, iter(((0, payload),)))]
+
+    while stack:
+        target, children = stack[-1]
+
+        for key, value in children:
+            if isinstance(value, dict):
+                if "$ref" in value:
+                    ref = value["$ref"]
+                    resolved = ids.get(ref, _UNRESOLVED)
+                    if resolved is _UNRESOLVED:
+                        pending.append((target, key, ref, value))
+                        resolved = None
+                    target[key] = resolved
+                    continue
+
+                values = value.get("$values")
+                if isinstance(values, list):
+                    out = [None] * len(values)
+                    nested = enumerate(values)
+                else:
+                    out = {}
+                    nested = ((k, v) for k, v in value.items() if k != "$id")
+
+                if "$id" in value:
+                    ids[value["$id"]] = out
+            elif isinstance(value, list):
+                out = [None] * len(value)
+                nested = enumerate(value)
+            else:
+                target[key] = value
+                continue
+
+            target[key] = out
+            stack.append((out, nested))
+            break
+        else:
+            stack.pop()
+
+    # References to an $id that appears later in the document.
+    for target, key, ref, original in pending:
+        target[key] = ids.get(ref, original)
+
+    return root[0]
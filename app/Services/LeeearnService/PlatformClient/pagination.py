@@ -0,0 +1,298 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from .query_builder import QueryBuilder
+from .utils import PlatformResponse, body_field
+
+# Hard bound on the pages one listing may take; a server that ignores
+# Offset and reports no total would otherwise be paged forever.
+MAX_PAGES = 1000
+
+FetchPage = Callable[[dict], Awaitable[PlatformResponse]]
+# Turns one page response into its items (``page_items`` of the raw JSON by default).
+PageItems = Callable[[PlatformResponse], list]
+
+
+def page_items(payload: Any) -> list:
+    """
+    Extracts the item list from a list response: ``data.data`` or ``data.data.$values``.
+    """
+    data = payload.get("data") if isinstance(payload, dict) else payload
+    if isinstance(data, dict):
+        data = data.get("data", data)
+    if isinstance(data, dict):
+        data = data.get("$values")
+    return data if isinstance(data, list) else []
+
+
+def page_total(payload: Any) -> int | None:
+    """
+    The ``data.count`` of a list response, if any. Whether it is the listing
+    total is not documented, so callers check it with ``plausible_total``.
+    """
+    data = payload.get("data") if isinstance(payload, dict) else None
+    if not isinstance(data, dict):
+        return None
+    for key, value in data.items():
+        if key.lower() == "count" and isinstance(value, int) and not isinstance(value, bool):
+            return value
+    return None
+
+
+def plausible_total(total: int | None, offset: int, count: int, page: list) -> int | None:
+    """
+    ``total`` if it can be the size of the whole listing given the page at
+    ``offset`` (``count`` requested), else None. A count below the items
+    already seen is rejected, as is one equal to a full page's length: that
+    may be the page size echoed back, and trusting it would stop after the
+    first page.
+    """
+    if total is None or total < offset + len(page):
+        return None
+    if len(page) == count and total == len(page):
+        return None
+    return total
+
+
+def page_ids(page: list) -> tuple:
+    """Ids of the page's items (the items themselves where there is no id)."""
+    return tuple(body_field(item, "id") if isinstance(item, dict) and body_field(item, "id") is not None
+                 else repr(item) for item in page)
+
+
+def query_offset(filter_query: None | dict | QueryBuilder) -> int:
+    if isinstance(filter_query, QueryBuilder):
+        return filter_query.offset
+    for key, value in (filter_query or {}).items():
+        if key.lower() == "offset":
+            return value
+    return 0
+
+
+def page_query(filter_query: None | dict | QueryBuilder, offset: int, count: int) -> dict:
+    """
+    The same filters and ordering as ``filter_query`` with the given Offset/Count window.
+    """
+    if isinstance(filter_query, QueryBuilder):
+        query = filter_query.build()
+    else:
+        query = {key: value for key, value in (filter_query or {}).items()
+                 if key.lower() not in ("offset", "count")}
+
+    query["Offset"] = offset
+    query["Count"] = count
+    return query
+
+
+async def fetch_page(fetch: FetchPage, filter_query, offset: int, count: int,
+                     items: PageItems | None = None) -> tuple[list, int | None]:
+    """One page: its items and its ``page_total`` (None if not reported)."""
+    response = await fetch(page_query(filter_query, offset, count))
+    if not response.ok:
+        raise ValueError(
+            f"Page request failed (status {response.status}, offset {offset})"
+        )
+    payload = response.json()
+    return (items(response) if items else page_items(payload)), page_total(payload)
+
+
+async def iterate(
+    fetch: FetchPage,
+    filter_query: None | dict | QueryBuilder = None,
+    *,
+    page_size: int = 100,
+    prefetch: bool = True,
+    limit: int | None = None,
+    max_pages: int = MAX_PAGES,
+) -> AsyncIterator[Any]:
+    """
+    Streams items page by page, starting at the query's offset.
+
+    At most two pages are held at once: the one being consumed and, with
+    ``prefetch``, the next one already in flight. Iteration stops after
+    ``limit`` items, or on an empty page. With a plausible total count
+    (see ``plausible_total``) it runs up to that total, so pages capped
+    below ``page_size`` by the platform are followed; without one a short
+    page ends it. A page repeating the previous page's ids (the server
+    ignoring Offset) ends it too, and more than ``max_pages`` pages raise
+    ValueError.
+    """
+    offset = query_offset(filter_query)
+    remaining = limit
+    total: int | None = None
+    previous: tuple | None = None
+    pages = 0
+    next_page: asyncio.Future | None = None
+
+    def load(page_offset: int) -> asyncio.Future:
+        nonlocal pages
+        pages += 1
+        if pages > max_pages:
+            raise ValueError(f"Pagination exceeded {max_pages} pages at offset {page_offset}")
+        count = page_size if remaining is None else min(page_size, remaining)
+        return asyncio.ensure_future(fetch_page(fetch, filter_query, page_offset, count))
+
+    if remaining is not None and remaining <= 0:
+        return
+
+    try:
+        page = load(offset)
+        while True:
+            requested = page_size if remaining is None else min(page_size, remaining)
+            items, page_count = await page
+            items = items[:requested]
+
+            ids = page_ids(items)
+            if items and ids == previous:
+                return
+            previous = ids
+            page_count = plausible_total(page_count, offset, requested, items)
+            if page_count is not None:
+                total = page_count
+
+            offset += len(items)
+            if remaining is not None:
+                remaining -= len(items)
+
+            has_more = bool(items) and (remaining is None or remaining > 0)
+            if total is not None:
+                has_more = has_more and offset < total
+            else:
+                has_more = has_more and len(items) >= requested
+            if has_more and prefetch:
+                next_page = load(offset)
+
+            for item in items:
+                yield item
+
+            if not has_more:
+                return
+
+            if next_page is None:
+                next_page = load(offset)
+            page, next_page = next_page, None
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+
+
+async def fetch_windows(
+    fetch: FetchPage,
+    filter_query: None | dict | QueryBuilder = None,
+    *,
+    window: int = 100,
+    concurrency: int = 4,
+    limit: int | None = None,
+    items: PageItems | None = None,
+    max_pages: int = MAX_PAGES,
+) -> list:
+    """
+    Fetches the range ``[offset, offset + limit)`` as concurrent Offset/Count
+    windows and reassembles the items in order.
+
+    ``items`` extracts each window's items from its response. Every response
+    numbers its own ``$id``s, so a window has to be resolved on its own
+    (e.g. ``lambda response: page_items(response.data())``), not after the
+    windows are joined.
+
+    Without ``limit`` windows are issued up to a plausible total count
+    (see ``plausible_total``); a window that comes back short of it has the
+    rest of its range fetched as another window. Without a total the first
+    short window ends the listing, and a window repeating another window's
+    ids (the server ignoring Offset) ends it at that window. Windows past the
+    end are cancelled; more than ``max_pages`` windows raise ValueError.
+    """
+    start = query_offset(filter_query)
+    end = None if limit is None else start + limit
+    total: int | None = None
+
+    windows: dict[asyncio.Future, tuple[int, int]] = {}
+    pages: dict[int, list] = {}
+    seen: dict[tuple, list[int]] = {}
+    # Unfetched tails of short windows, fetched before new windows are opened.
+    gaps: list[tuple[int, int]] = []
+    next_offset = start
+    opened = 0
+    # The listing has nothing at or past this offset.
+    stop_at: int | None = None
+
+    def past_end(offset: int) -> bool:
+        return ((stop_at is not None and offset >= stop_at)
+                or (end is not None and offset >= end)
+                or (total is not None and offset >= total))
+
+    def open_window(offset: int, count: int):
+        nonlocal opened
+        opened += 1
+        if opened > max_pages:
+            raise ValueError(f"Pagination exceeded {max_pages} pages at offset {offset}")
+        task = asyncio.ensure_future(
+            fetch_page(fetch, filter_query, offset, count, items)
+        )
+        windows[task] = (offset, count)
+
+    def stop(offset: int):
+        nonlocal stop_at
+        if stop_at is None or offset < stop_at:
+            stop_at = offset
+
+    try:
+        while True:
+            while len(windows) < concurrency and gaps:
+                offset, count = gaps.pop()
+                if not past_end(offset):
+                    open_window(offset, count)
+            while len(windows) < concurrency and not past_end(next_offset):
+                count = window if end is None else min(window, end - next_offset)
+                open_window(next_offset, count)
+                next_offset += count
+
+            if not windows:
+                break
+
+            done, _ = await asyncio.wait(windows, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task not in windows:
+                    # Cancelled as past the end by a window of the same batch.
+                    continue
+                offset, count = windows.pop(task)
+                page, page_count = task.result()
+                pages[offset] = page
+
+                if total is None:
+                    total = plausible_total(page_count, offset, count, page)
+                if page:
+                    # Windows returning the same ids: the listing ends at the
+                    # second of them, whatever order they completed in.
+                    offsets = seen.setdefault(page_ids(page), [])
+                    offsets.append(offset)
+                    if len(offsets) > 1:
+                        stop(sorted(offsets)[1])
+
+                if not page:
+                    stop(offset)
+                elif len(page) < count:
+                    tail = offset + len(page)
+                    if total is None:
+                        stop(tail)
+                    elif not past_end(tail):
+                        rest = min(count - len(page), total - tail)
+                        if end is not None:
+                            rest = min(rest, end - tail)
+                        gaps.append((tail, rest))
+
+                for other, (other_offset, _) in list(windows.items()):
+                    if past_end(other_offset):
+                        other.cancel()
+                        del windows[other]
+    finally:
+        for task in windows:
+            task.cancel()
+
+    result = []
+    for offset in sorted(pages):
+        if past_end(offset):
+            break
+        result.extend(pages[offset])
+    bounds = [value for value in (end, total, stop_at) if value is not None]
+    return result[:max(min(bounds) - start, 0)] if bounds else result
@@ -1,3 +1,21 @@
+from enum import IntEnum
+
+
+class CompareType(IntEnum):
+    """
+    ``CompareType`` values of the platform filter query, assumed to follow the
+    platform's enum order (not published with the API and not confirmed).
+    A wrong range mapping makes the server drop items silently, so schedule
+    windows are only pushed down behind ``WindowPushdown`` (see schedule.py).
+    """
+    Equals = 0
+    Contains = 1
+    GreaterThan = 2
+    GreaterThanOrEqual = 3
+    LessThan = 4
+    LessThanOrEqual = 5
+
+
 class QueryBuilder:
     """
         {
@@ -52,7 +70,7 @@ class QueryBuilder:
         self,
         property_path: str,
         *,
-        compare_type: int = 0,
+        compare_type: int | CompareType = CompareType.Equals,
         value=None,
         invert: bool = False,
         value_null: bool = False,
@@ -60,7 +78,7 @@ class QueryBuilder:
     ):
         self.filters.append({
             "PropertyPath": property_path,
-            "CompareType": compare_type,
+            "CompareType": int(compare_type),
             "InvertCompare": invert,
             "Value": value,
             "ValueNull": value_null,
@@ -75,6 +93,24 @@ class QueryBuilder:
         })
         return self
 
+    def between(self, property_path: str, start, end):
+        """``start <= property < end``; either bound may be None."""
+        if start is not None:
+            self.filter(property_path, compare_type=CompareType.GreaterThanOrEqual,
+                        value=start)
+        if end is not None:
+            self.filter(property_path, compare_type=CompareType.LessThan,
+                        value=end)
+        return self
+
+    def copy(self) -> "QueryBuilder":
+        query = QueryBuilder()
+        query.offset = self.offset
+        query.count = self.count
+        query.filters = [dict(item) for item in self.filters]
+        query.orders = [dict(item) for item in self.orders]
+        return query
+
     def build(self):
         return {
             "Offset": self.offset,
@@ -0,0 +1,218 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Iterator, Mapping, Optional
+
+from .types import SafeUUID
+
+# Statuses that mean "slow down": the request was not served and may be resent.
+THROTTLE_STATUSES = frozenset((429, 503))
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_priority: ContextVar[Priority] = ContextVar("platform_request_priority",
+                                             default=Priority.INTERACTIVE)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """
+    Platform requests made inside the block (and in tasks created from it)
+    queue with ``priority``. Handlers run as INTERACTIVE by default.
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    value = next((v for k, v in headers.items() if k.lower() == "retry-after"), None)
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every client of one API credential.
+
+    ``acquire`` waits for a token instead of failing. Waiters are served FIFO
+    per priority, interactive first; after ``interactive_streak`` interactive
+    grants in a row a waiting background request is let through so it cannot
+    starve. The refill rate adapts AIMD-style: each throttled response
+    (429/503) multiplies it by ``decrease`` and honours ``Retry-After``, each
+    successful one adds ``increase / rate`` (about ``increase`` tokens/s per
+    second of full-speed traffic) up to the configured rate.
+
+    :param rate: Tokens per second (the upper bound of the adaptive rate)
+    :param burst: Bucket capacity
+    :param min_rate: Lower bound of the adaptive rate
+    :param increase: Additive increase, tokens/s per second of traffic
+    :param decrease: Multiplicative decrease on throttling
+    :param interactive_streak: Interactive grants before a background one
+    """
+
+    def __init__(self, rate: float = 10.0, burst: int = 20, *,
+                 min_rate: float = 0.5, increase: float = 1.0,
+                 decrease: float = 0.5, interactive_streak: int = 4):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.interactive_streak = interactive_streak
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._queues: tuple[deque, ...] = tuple(deque() for _ in Priority)
+        self._streak = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        self.granted = 0
+        self.waited = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+
+    async def acquire(self, priority: Optional[Priority] = None):
+        priority = current_priority() if priority is None else priority
+        self._refill()
+        if self._tokens >= 1 and not self._waiting() and not self._blocked():
+            self._tokens -= 1
+            self.granted += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._queues[priority].append(future)
+        self.waited += 1
+        started = time.monotonic()
+        self._ensure_dispatcher()
+        try:
+            await future
+        finally:
+            self.wait_seconds += time.monotonic() - started
+            if not future.done():
+                future.cancel()
+
+    def feedback(self, status: int, headers: Mapping[str, str] | None = None):
+        """Adapts the rate to a response: back off on 429/503, else probe up."""
+        if status in THROTTLE_STATUSES:
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            delay = retry_after(headers or {})
+            if delay:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+            self._tokens = min(self._tokens, 0.0)
+        elif self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def stats(self) -> dict:
+        return {
+            "rate": round(self.rate, 3),
+            "max_rate": self.max_rate,
+            "tokens": round(self._tokens, 3),
+            "queued": {priority.name.lower(): len(self._queues[priority]) for priority in Priority},
+            "blocked_for": round(max(0.0, self._blocked_until - time.monotonic()), 3),
+            "granted": self.granted,
+            "waited": self.waited,
+            "throttled": self.throttled,
+            "wait_seconds": round(self.wait_seconds, 3),
+        }
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _blocked(self) -> bool:
+        return time.monotonic() < self._blocked_until
+
+    def _waiting(self) -> bool:
+        return any(self._queues)
+
+    def _next_waiter(self) -> Optional[asyncio.Future]:
+        interactive, background = self._queues
+        for queue in self._queues:
+            while queue and queue[0].done():
+                queue.popleft()
+
+        if background and (not interactive or self._streak >= self.interactive_streak):
+            self._streak = 0
+            return background.popleft()
+        if interactive:
+            self._streak += 1 if background else 0
+            return interactive.popleft()
+        return None
+
+    def _ensure_dispatcher(self):
+        if self._dispatcher is None or self._dispatcher.done():
+            self._wakeup = asyncio.Event()
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+
+    async def _dispatch(self):
+        while self._waiting():
+            self._refill()
+            delay = self._blocked_until - time.monotonic()
+            if delay <= 0 and self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+
+            if delay > 0:
+                # Feedback can change the rate or the block; re-evaluate then.
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            waiter = self._next_waiter()
+            if waiter is None:
+                break
+            self._tokens -= 1
+            self.granted += 1
+            waiter.set_result(None)
+
+
+_limiters: dict[SafeUUID, RateLimiter] = {}
+
+
+def limiter_for(api_id: SafeUUID | str, rate: float = 10.0, burst: int = 20) -> RateLimiter:
+    """
+    The process-wide limiter of an API credential; ``rate``/``burst`` only
+    apply when it is created.
+    """
+    key = SafeUUID(api_id)
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limiter = _limiters[key] = RateLimiter(rate, burst)
+    return limiter
@@ -0,0 +1,288 @@
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from .bulk import gather_limited
+from .pagination import fetch_windows, page_items
+from .ratelimit import Priority, request_priority
+from .utils import branch_key, body_field
+
+if TYPE_CHECKING:
+    from .client import PlatformClient
+
+# Catalog name -> (service path, id field of its GetDetails body).
+REFERENCE_CATALOGS: dict[str, tuple[str, str]] = {
+    "courses": ("/CompanyBranchCourse", "courseId"),
+    "directions": ("/CompanyBranchDirection", "directionId"),
+    "lessons": ("/CompanyBranchLesson", "lessonId"),
+    "tags": ("/CompanyBranchTag", "tagId"),
+    "roles": ("/CompanyBranchRole", "roleId"),
+    "managers": ("/CompanyBranchManager", "managerId"),
+}
+
+# Catalogs only filled by ``details``: their GetDetails items carry fields the
+# branch-wide lists lack (a group's teachers, a lesson's students), so they
+# are not warmed and each item is kept for ``details_ttl`` seconds.
+DETAIL_CATALOGS: dict[str, tuple[str, str]] = {
+    "groups": ("/CompanyBranchGroup", "groupId"),
+    "group_lessons": ("/CompanyBranchGroupSchedule", "data"),
+}
+
+# Items of DETAIL_CATALOGS kept at most; expired ones are dropped first.
+MAX_DETAILS = 4096
+
+
+class ReferenceData:
+    """
+    In-memory catalogs (courses, directions, lessons, tags, roles, managers)
+    per branch, used to render names without waiting on the platform.
+
+    ``warm`` loads every catalog of every branch, at most ``limit`` at a time;
+    ``start`` keeps them fresh from a background task and ``track`` replaces
+    the branches it refreshes. ``get`` is a pure memory lookup and
+    ``details`` falls back to the service's GetDetails on a miss and also
+    serves the on-demand ``detail_catalogs``. A mutation of a catalog service
+    drops that catalog until the next refresh.
+
+    :param client: Platform client the catalogs are loaded with
+    :param interval: Seconds between background refreshes
+    :param catalogs: Catalogs to keep, see ``REFERENCE_CATALOGS``
+    :param limit: Catalogs loaded concurrently by ``warm``
+    :param detail_catalogs: Catalogs filled by ``details``, see ``DETAIL_CATALOGS``
+    :param details_ttl: Seconds an item of ``detail_catalogs`` is served
+    """
+
+    def __init__(self, client: "PlatformClient", interval: float = 300.0,
+                 catalogs: dict[str, tuple[str, str]] = REFERENCE_CATALOGS,
+                 limit: int = 4,
+                 detail_catalogs: dict[str, tuple[str, str]] = DETAIL_CATALOGS,
+                 details_ttl: float = 60.0):
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+
+        self.client = client
+        self.interval = interval
+        self.catalogs = catalogs
+        self.limit = limit
+        self.detail_catalogs = detail_catalogs
+        self.details_ttl = details_ttl
+
+        self._items: dict[tuple[str, str], dict[str, Any]] = {}
+        # (catalog, branch, item id) -> (item, expires) for detail_catalogs.
+        self._details: dict[tuple[str, str, str], tuple[Any, float]] = {}
+        self._loaded_at: dict[tuple[str, str], float] = {}
+        self._branches: dict[str, Any] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._loading: set[asyncio.Task] = set()
+
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+
+    async def warm(self, branch_ids: Iterable) -> int:
+        """
+        Loads all catalogs of ``branch_ids`` and of the tracked branches,
+        ``limit`` at a time so a warm-up of many branches does not crowd out
+        user requests at the rate limiter. Failed catalogs are logged and
+        skipped; returns how many were loaded.
+        """
+        for branch_id in branch_ids:
+            self._branches.setdefault(branch_key(branch_id), branch_id)
+        return await self._load_branches(list(self._branches.values()))
+
+    async def _load_branches(self, branch_ids: list) -> int:
+        jobs = [(branch_id, catalog)
+                for branch_id in branch_ids
+                for catalog in self.catalogs]
+        report = await gather_limited(
+            ((self.load, branch_id, catalog) for branch_id, catalog in jobs),
+            limit=self.limit
+        )
+
+        for (branch_id, catalog), result in zip(jobs, report):
+            if result.error is not None:
+                self.failures += 1
+                logging.warning(f"Reference catalog '{catalog}' of {branch_id} "
+                                f"failed to load: {result.error}")
+        return report.succeeded
+
+    async def load(self, branch_id, catalog: str) -> dict[str, Any]:
+        """Fetches one catalog of one branch and replaces it in memory."""
+        service, _ = self.catalogs[catalog]
+        endpoint = f"{service}/Get"
+        body = {"companyBranchId": str(branch_id)}
+
+        # Windows of one catalog go one at a time, so ``limit`` bounds the
+        # requests ``warm`` keeps in flight.
+        if self.client.snapshots is not None:
+            # Also lets list queries against the catalog be answered locally.
+            items = await self.client.refresh_snapshot(endpoint, body, concurrency=1)
+        else:
+            # Each window resolves its own $id/$ref table.
+            items = await fetch_windows(
+                lambda query: self.client.send_request(endpoint, {**body, "data": query}),
+                concurrency=1,
+                items=lambda response: page_items(response.data())
+            )
+
+        by_id = {}
+        for item in items:
+            item_id = body_field(item, "id")
+            if item_id is not None:
+                by_id[str(item_id).lower()] = item
+
+        key = (catalog, branch_key(branch_id))
+        self._items[key] = by_id
+        self._loaded_at[key] = time.monotonic()
+        return by_id
+
+    def get(self, catalog: str, branch_id, item_id) -> Optional[Any]:
+        """The cached catalog item, or None (counted as a miss)."""
+        items = self._items.get((catalog, branch_key(branch_id)))
+        item = None if items is None else items.get(str(item_id).lower())
+        if item is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return item
+
+    def name(self, catalog: str, branch_id, item_id, default: str = "") -> str:
+        item = self.get(catalog, branch_id, item_id)
+        if item is None:
+            return default
+        return body_field(item, "name") or default
+
+    async def details(self, catalog: str, branch_id, item_id, **fields) -> Optional[Any]:
+        """
+        ``get`` with a GetDetails fallback; the fetched item is kept in memory.
+        Items of ``detail_catalogs`` are looked up and kept the same way, for
+        ``details_ttl`` seconds.
+
+        :param fields: Extra GetDetails body fields (e.g. ``groupId`` of a
+            ``group_lessons`` item)
+        """
+        detail_key = None
+        if catalog in self.catalogs:
+            item = self.get(catalog, branch_id, item_id)
+            if item is not None:
+                return item
+            service, id_field = self.catalogs[catalog]
+        else:
+            service, id_field = self.detail_catalogs[catalog]
+            detail_key = (catalog, branch_key(branch_id), str(item_id).lower())
+            cached = self._details.get(detail_key)
+            if cached is not None and cached[1] > time.monotonic():
+                self.hits += 1
+                return cached[0]
+            self.misses += 1
+
+        response = await self.client.send_request(
+            f"{service}/GetDetails",
+            {"companyBranchId": str(branch_id),
+             **{name: str(value) for name, value in fields.items()},
+             id_field: str(item_id)}
+        )
+        if not response.ok:
+            return None
+
+        item = response.data()
+        if item is None:
+            return None
+        if detail_key is None:
+            items = self._items.setdefault((catalog, branch_key(branch_id)), {})
+            items[str(item_id).lower()] = item
+        else:
+            self._keep_details(detail_key, item)
+        return item
+
+    def _keep_details(self, key: tuple[str, str, str], item: Any):
+        now = time.monotonic()
+        self._details.pop(key, None)
+        if len(self._details) >= MAX_DETAILS:
+            self._details = {other: cached for other, cached in self._details.items()
+                             if cached[1] > now}
+        while len(self._details) >= MAX_DETAILS:
+            del self._details[next(iter(self._details))]
+        self._details[key] = (item, now + self.details_ttl)
+
+    def invalidate(self, service: str, branch_id=None):
+        """Drops the catalogs backed by ``service`` (one branch, or all if None)."""
+        catalogs = {name for name, (path, _) in (*self.catalogs.items(),
+                                                  *self.detail_catalogs.items())
+                    if path == service}
+        if not catalogs:
+            return
+        branch = None if branch_id is None else branch_key(branch_id)
+        for key in list(self._items):
+            if key[0] in catalogs and (branch is None or key[1] == branch):
+                del self._items[key]
+                self._loaded_at.pop(key, None)
+        for key in list(self._details):
+            if key[0] in catalogs and (branch is None or key[1] == branch):
+                del self._details[key]
+
+    def track(self, branch_ids: Iterable):
+        """
+        Replaces the refreshed branches with ``branch_ids`` (e.g. the bots a
+        shard currently leases). Catalogs of dropped branches are released;
+        once the refresh loop runs, new branches are loaded right away
+        instead of waiting for the next refresh.
+        """
+        branches = {branch_key(branch_id): branch_id for branch_id in branch_ids}
+        added = [branch_id for key, branch_id in branches.items()
+                 if key not in self._branches]
+        for key in list(self._items):
+            if key[1] not in branches:
+                del self._items[key]
+                self._loaded_at.pop(key, None)
+        for key in list(self._details):
+            if key[1] not in branches:
+                del self._details[key]
+        self._branches = branches
+
+        if added and self._task is not None and not self._task.done():
+            with request_priority(Priority.BACKGROUND):
+                task = asyncio.create_task(self._load_branches(added))
+            self._loading.add(task)
+            task.add_done_callback(self._loading.discard)
+
+    def start(self, branch_ids: Iterable = ()):
+        """Starts the background refresh loop for ``branch_ids`` and warmed branches."""
+        for branch_id in branch_ids:
+            self._branches.setdefault(branch_key(branch_id), branch_id)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        tasks = [task for task in (self._task, *self._loading) if task is not None]
+        self._task = None
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _refresh_loop(self):
+        with request_priority(Priority.BACKGROUND):
+            while True:
+                await asyncio.sleep(self.interval)
+                await self.warm(())
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        now = time.monotonic()
+        return {
+            "branches": len(self._branches),
+            "catalogs": len(self._items),
+            "items": sum(len(items) for items in self._items.values()),
+            "details": len(self._details),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "failures": self.failures,
+            "oldest_seconds": max((now - loaded for loaded in self._loaded_at.values()),
+                                  default=0.0),
+        }
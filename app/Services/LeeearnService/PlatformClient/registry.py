@@ -0,0 +1,38 @@
+from .cache import ResponseCache
+from .client import PlatformClient
+from .transport import BaseTransport
+from .types import SafeUUID
+
+
+class ClientRegistry:
+    """
+    Process-wide store of long-lived PlatformClient instances keyed by (url, api_id).
+    Reusing one client keeps its connection pool and BranchClass cache warm.
+    """
+
+    def __init__(self):
+        self._clients: dict[tuple[str, SafeUUID], PlatformClient] = {}
+
+    def get(self, url: str, api_id: SafeUUID | str, api_access_token: str,
+            transport: BaseTransport | None = None,
+            cache: ResponseCache | None = None) -> PlatformClient:
+        key = (url, SafeUUID(api_id))
+        client = self._clients.get(key)
+
+        if client is None:
+            client = self._clients[key] = PlatformClient(
+                url, api_id, api_access_token, transport=transport, cache=cache
+            )
+        elif client.api_access_token != api_access_token:
+            client.api_access_token = api_access_token
+
+        return client
+
+    async def close_all(self):
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.close()
+
+
+clients = ClientRegistry()
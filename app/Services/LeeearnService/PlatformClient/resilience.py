@@ -0,0 +1,178 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - aiohttp is listed in requirements
+    aiohttp = None
+
+from .utils import PlatformResponse, endpoint_service, is_read_endpoint
+
+Attempt = Callable[[float], Awaitable[PlatformResponse]]
+
+# Seconds one attempt may take. Lookup is by endpoint, then by service.
+DEFAULT_TIMEOUTS: dict[str, float] = {
+    "/CompanyBranchTeacher/GetScheduleItemList": 10,
+    "/CompanyBranchCustomer/GetScheduleItemList": 10,
+    "/CompanyBranchGroupSchedule/GetDetails": 5,
+    "/CompanyBranchGroup/GetDetails": 5,
+    "/CompanyBranchTeacher/GetContacts": 5,
+}
+
+# Gateway errors that are worth another attempt of an idempotent read.
+RETRY_STATUSES = frozenset((502, 504))
+
+RETRY_ERRORS: tuple[type[BaseException], ...] = (asyncio.TimeoutError, OSError)
+if aiohttp is not None:
+    RETRY_ERRORS += (aiohttp.ClientError,)
+
+
+class ResiliencePolicy:
+    """
+    Timeouts, retries and hedging for platform requests.
+
+    Every request gets a per-endpoint timeout. Reads (``Get*`` endpoints) are
+    retried on transport errors and gateway statuses with decorrelated-jitter
+    backoff. With ``hedge`` enabled a read still running after the p95 latency
+    of its endpoint gets a duplicate; the first answer wins and the other is
+    cancelled. Mutations are sent exactly once.
+
+    :param read_timeout: Timeout of reads without an entry in ``timeouts``
+    :param write_timeout: Timeout of mutations without an entry in ``timeouts``
+    :param timeouts: Per-endpoint or per-service timeouts
+    :param read_retries: Extra attempts for a failed read
+    :param base_delay: Smallest backoff between attempts
+    :param max_delay: Largest backoff between attempts
+    :param hedge: Send hedged duplicates of slow reads
+    :param hedge_quantile: Latency quantile after which a read is hedged
+    :param hedge_min_delay: Lower bound of the hedge delay
+    :param hedge_min_samples: Latencies an endpoint needs before it is hedged
+    :param window: Latencies kept per endpoint
+    """
+
+    def __init__(self, read_timeout: float = 10.0, write_timeout: float = 30.0,
+                 timeouts: dict[str, float] = DEFAULT_TIMEOUTS, *,
+                 read_retries: int = 2, base_delay: float = 0.1,
+                 max_delay: float = 2.0, hedge: bool = False,
+                 hedge_quantile: float = 0.95, hedge_min_delay: float = 0.05,
+                 hedge_min_samples: int = 20, window: int = 200):
+        self.read_timeout = read_timeout
+        self.write_timeout = write_timeout
+        self.timeouts = timeouts
+        self.read_retries = read_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_min_samples = hedge_min_samples
+        self.window = window
+
+        self._latencies: dict[str, deque] = {}
+
+        self.retries = 0
+        self.hedges = 0
+        self.hedges_won = 0
+        self.failures = 0
+
+    def timeout_for(self, endpoint: str) -> float:
+        timeout = self.timeouts.get(endpoint)
+        if timeout is None:
+            timeout = self.timeouts.get(endpoint_service(endpoint))
+        if timeout is None:
+            timeout = self.read_timeout if is_read_endpoint(endpoint) else self.write_timeout
+        return timeout
+
+    def backoff(self, previous: float) -> float:
+        """Decorrelated jitter: uniform between the base and 3x the last delay."""
+        return min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """The endpoint's latency quantile, or None while there are too few samples."""
+        samples = self._latencies.get(endpoint)
+        if not samples or len(samples) < self.hedge_min_samples:
+            return None
+        ordered = sorted(samples)
+        position = min(len(ordered) - 1, int(len(ordered) * self.hedge_quantile))
+        return max(self.hedge_min_delay, ordered[position])
+
+    def record(self, endpoint: str, seconds: float):
+        samples = self._latencies.get(endpoint)
+        if samples is None:
+            samples = self._latencies[endpoint] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    async def execute(self, endpoint: str, attempt: Attempt) -> PlatformResponse:
+        """Runs ``attempt(timeout)`` under the policy for ``endpoint``."""
+        timeout = self.timeout_for(endpoint)
+        if not is_read_endpoint(endpoint):
+            return await attempt(timeout)
+
+        delay = self.base_delay
+        retries = self.read_retries
+        while True:
+            try:
+                response = await self._hedged(endpoint, attempt, timeout)
+            except RETRY_ERRORS:
+                if retries <= 0:
+                    self.failures += 1
+                    raise
+            else:
+                if response.status not in RETRY_STATUSES or retries <= 0:
+                    return response
+
+            retries -= 1
+            self.retries += 1
+            delay = self.backoff(delay)
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict:
+        return {
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "hedges_won": self.hedges_won,
+            "failures": self.failures,
+            "hedge_delays": {endpoint: round(delay, 3)
+                             for endpoint in self._latencies
+                             if (delay := self.hedge_delay(endpoint)) is not None},
+        }
+
+    async def _timed(self, endpoint: str, attempt: Attempt, timeout: float) -> PlatformResponse:
+        started = time.monotonic()
+        response = await attempt(timeout)
+        if response.ok:
+            self.record(endpoint, time.monotonic() - started)
+        return response
+
+    async def _hedged(self, endpoint: str, attempt: Attempt, timeout: float) -> PlatformResponse:
+        delay = self.hedge_delay(endpoint) if self.hedge else None
+        if delay is None:
+            return await self._timed(endpoint, attempt, timeout)
+
+        primary = asyncio.ensure_future(self._timed(endpoint, attempt, timeout))
+        try:
+            done, _ = await asyncio.wait((primary,), timeout=delay)
+            if done:
+                return primary.result()
+
+            self.hedges += 1
+            hedge = asyncio.ensure_future(self._timed(endpoint, attempt, timeout))
+            pending = {primary, hedge}
+            try:
+                while True:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    # Prefer an answer; an error only counts once both have failed.
+                    for task in done:
+                        if task.exception() is None:
+                            if task is hedge:
+                                self.hedges_won += 1
+                            return task.result()
+                    if not pending:
+                        return primary.result()
+            finally:
+                hedge.cancel()
+        finally:
+            primary.cancel()
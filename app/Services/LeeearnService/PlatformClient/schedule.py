@@ -0,0 +1,321 @@
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Iterable, Optional
+
+from .pagination import FetchPage, iterate, page_items
+from .query_builder import QueryBuilder
+from .utils import PlatformResponse
+
+# Platform schedule times are naive UTC; the bots show and compare them in local time.
+PLATFORM_UTC_OFFSET = timedelta(hours=2)
+DEFAULT_LESSON_MINUTES = 30
+DEFAULT_LESSON_NAME = "Без назви"
+# Page size for date-window queries; a day or a week is normally one page.
+WINDOW_PAGE_SIZE = 500
+
+ScheduleBound = date | datetime | None
+
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+
+def parse_epoch(value: Any) -> Optional[int]:
+    """
+    Platform date string -> epoch seconds (UTC), or None for missing and
+    placeholder dates (``0001-01-01``, year 0).
+    """
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    if dt.year <= 1:
+        return None
+    return (dt - _EPOCH) // _SECOND
+
+
+def local_epoch(dt: datetime) -> int:
+    """Naive local time (platform + offset) -> epoch seconds comparable with ScheduleItem.start."""
+    return (dt - PLATFORM_UTC_OFFSET - _EPOCH) // _SECOND
+
+
+def local_datetime(epoch: int) -> datetime:
+    return _EPOCH + timedelta(seconds=epoch) + PLATFORM_UTC_OFFSET
+
+
+class ScheduleItem:
+    """
+    One GetScheduleItemList entry, parsed once.
+
+    ``start``/``end`` are epoch seconds of the platform (UTC) time;
+    ``start_local``/``end_local`` apply ``PLATFORM_UTC_OFFSET``.
+    """
+    __slots__ = ("id", "group_id", "lesson_id", "lesson_name", "start", "end")
+
+    def __init__(self, id: str, group_id: Optional[str], lesson_id: Optional[str],
+                 lesson_name: str, start: int, end: int):
+        self.id = id
+        self.group_id = group_id
+        self.lesson_id = lesson_id
+        self.lesson_name = lesson_name
+        self.start = start
+        self.end = end
+
+    @classmethod
+    def from_platform(cls, item: dict, strings: dict | None = None) -> Optional["ScheduleItem"]:
+        """
+        Returns None for entries without a valid start date. A missing end
+        falls back to the lesson's ``minutesEstimated``.
+
+        :param strings: Shared lookup used to store repeated ids and names once
+        """
+        start = parse_epoch(item.get("date"))
+        if start is None:
+            return None
+
+        group = item.get("group") or {}
+        lesson = item.get("lesson") or {}
+
+        end = parse_epoch(item.get("endDate"))
+        if end is None or end < start:
+            minutes = lesson.get("minutesEstimated") or DEFAULT_LESSON_MINUTES
+            end = start + int(minutes) * 60
+
+        group_id = group.get("id") or item.get("groupId")
+        lesson_id = lesson.get("id") or item.get("lessonId")
+        lesson_name = lesson.get("name") or DEFAULT_LESSON_NAME
+        if strings is not None:
+            group_id = strings.setdefault(group_id, group_id)
+            lesson_id = strings.setdefault(lesson_id, lesson_id)
+            lesson_name = strings.setdefault(lesson_name, lesson_name)
+
+        return cls(item.get("id"), group_id, lesson_id, lesson_name, start, end)
+
+    @property
+    def start_local(self) -> datetime:
+        return local_datetime(self.start)
+
+    @property
+    def end_local(self) -> datetime:
+        return local_datetime(self.end)
+
+    @property
+    def duration_minutes(self) -> int:
+        return (self.end - self.start) // 60
+
+    def _fields(self) -> tuple:
+        return (self.id, self.group_id, self.lesson_id, self.lesson_name,
+                self.start, self.end)
+
+    def __eq__(self, other):
+        if not isinstance(other, ScheduleItem):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self):
+        return hash(self._fields())
+
+    def __repr__(self):
+        return (f"ScheduleItem(id={self.id!r}, lesson_name={self.lesson_name!r}, "
+                f"start={self.start_local:%Y-%m-%d %H:%M}, end={self.end_local:%H:%M})")
+
+
+def parse_schedule_items(items: Iterable[dict]) -> tuple[ScheduleItem, ...]:
+    """Parses raw schedule entries, drops invalid ones and sorts by start."""
+    strings: dict = {}
+    parsed = [schedule_item for schedule_item in
+              (ScheduleItem.from_platform(item, strings) for item in items)
+              if schedule_item is not None]
+    parsed.sort(key=lambda schedule_item: schedule_item.start)
+    return tuple(parsed)
+
+
+def _parse_response(response: PlatformResponse) -> tuple[ScheduleItem, ...]:
+    return parse_schedule_items(page_items(response.json()))
+
+
+def schedule_items(response: PlatformResponse) -> tuple[ScheduleItem, ...]:
+    """
+    ScheduleItems of a GetScheduleItemList response, memoized on the response
+    so every handler reading a cached response shares one parsed tuple.
+    """
+    if not response.ok:
+        raise ValueError(f"Schedule request failed (status {response.status})")
+    return response.parsed(_parse_response)
+
+
+def platform_time(value: date | datetime) -> str:
+    """Local date (midnight) or naive local datetime -> platform time string."""
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    return (value - PLATFORM_UTC_OFFSET).isoformat(timespec="seconds")
+
+
+def window_query(date_from: ScheduleBound, date_to: ScheduleBound,
+                 filter_query: None | dict | QueryBuilder = None) -> QueryBuilder:
+    """
+    ``filter_query`` plus ``date_from <= date < date_to`` (local time),
+    ordered by date unless the query already has an order.
+    """
+    if filter_query is None:
+        query = QueryBuilder().set_count(WINDOW_PAGE_SIZE)
+    elif isinstance(filter_query, QueryBuilder):
+        query = filter_query.copy()
+    else:
+        raise ValueError("A date window can only be combined with a QueryBuilder filter")
+
+    query.between(
+        "date",
+        platform_time(date_from) if date_from is not None else None,
+        platform_time(date_to) if date_to is not None else None,
+    )
+    if not query.orders:
+        query.order("date")
+    return query
+
+
+def _window_bound(value: ScheduleBound) -> Optional[int]:
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    return local_epoch(value)
+
+
+def in_window(items: Iterable[ScheduleItem], date_from: ScheduleBound,
+              date_to: ScheduleBound) -> tuple[ScheduleItem, ...]:
+    """Local re-check of a pushed-down window (ScheduleItem.start in ``[from, to)``)."""
+    start, end = _window_bound(date_from), _window_bound(date_to)
+    return tuple(item for item in items
+                 if (start is None or item.start >= start)
+                 and (end is None or item.start < end))
+
+
+class WindowPushdown:
+    """
+    Whether schedule date windows are sent to the server as a filter.
+
+    The range CompareType values are not confirmed by the platform; if they
+    are wrong the server drops lessons that no local re-check can restore.
+    So pushdown is opt-in, and even then windowed fetches of each endpoint
+    are compared with a local scan until one non-empty window agrees. If
+    they disagree, the endpoint keeps using the scan for the life of the
+    client.
+
+    :param enabled: Send date windows to the server at all
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        # endpoint -> True (a non-empty window agreed) / False (it did not)
+        self._verified: dict[str, bool] = {}
+
+        self.mismatches = 0
+
+    def mode(self, endpoint: str) -> Optional[bool]:
+        """True: filter on the server; None: filter and verify; False: scan locally."""
+        if not self.enabled:
+            return False
+        return self._verified.get(endpoint)
+
+    def verified(self, endpoint: str, filtered: tuple[ScheduleItem, ...],
+                 expected: tuple[ScheduleItem, ...]):
+        """
+        Records the comparison of a windowed fetch with the scan. Two empty
+        results prove nothing about the filter and are not recorded.
+        """
+        if not _same_items(filtered, expected):
+            if self._verified.get(endpoint) is not False:
+                self.mismatches += 1
+                logging.warning(f"Schedule window filter of {endpoint} disagrees with "
+                                f"the unfiltered list; filtering locally from now on")
+            self._verified[endpoint] = False
+        elif expected:
+            self._verified.setdefault(endpoint, True)
+
+    def stats(self) -> dict:
+        return {"enabled": self.enabled, "verified": dict(self._verified),
+                "mismatches": self.mismatches}
+
+
+def _newest_first(filter_query: None | dict | QueryBuilder) -> Optional[QueryBuilder]:
+    """``filter_query`` ordered by date descending, or None if it has its own order."""
+    if filter_query is None:
+        return QueryBuilder().set_count(WINDOW_PAGE_SIZE).order("date", False)
+    if isinstance(filter_query, QueryBuilder) and not filter_query.orders:
+        return filter_query.copy().order("date", False)
+    return None
+
+
+async def scan_window(fetch: FetchPage, date_from: ScheduleBound, date_to: ScheduleBound,
+                      filter_query: None | dict | QueryBuilder = None
+                      ) -> tuple[ScheduleItem, ...]:
+    """
+    The window without a range filter: the list is paged newest first and
+    the scan stops at the first lesson before ``date_from``, so only the
+    lessons from ``date_from`` on (for "today" or "this week", mostly the
+    upcoming ones) are transferred, not the whole history.
+
+    Ordering is checked as the items arrive: the scan only stops once it has
+    seen dates going down and never up. If the server does not honour the
+    order, or ``filter_query`` brings its own, the list is read to the end.
+    """
+    query = _newest_first(filter_query)
+    ordered = query is not None
+    start = _window_bound(date_from)
+
+    raw = []
+    previous = None
+    descending = False
+    async for item in iterate(fetch, query if ordered else filter_query,
+                              page_size=WINDOW_PAGE_SIZE):
+        raw.append(item)
+        item_start = parse_epoch(item.get("date")) if isinstance(item, dict) else None
+        if not ordered or item_start is None:
+            continue
+        if previous is not None:
+            if item_start > previous:
+                ordered = False
+                continue
+            descending = descending or item_start < previous
+        previous = item_start
+        if descending and start is not None and item_start < start:
+            break
+    return in_window(parse_schedule_items(raw), date_from, date_to)
+
+
+def _same_items(first: tuple[ScheduleItem, ...], second: tuple[ScheduleItem, ...]) -> bool:
+    def key(items):
+        return sorted((str(item.id), item.start) for item in items)
+    return key(first) == key(second)
+
+
+async def fetch_schedule_window(fetch: FetchPage, date_from: ScheduleBound,
+                                date_to: ScheduleBound,
+                                filter_query: None | dict | QueryBuilder = None,
+                                pushdown: WindowPushdown | None = None,
+                                endpoint: str = ""
+                                ) -> tuple[ScheduleItem, ...]:
+    """
+    The items of a GetScheduleItemList endpoint in ``[date_from, date_to)``,
+    fetched page by page and sorted by start.
+
+    The window is sent to the server only as ``pushdown`` allows; otherwise
+    it is read with ``scan_window``.
+    """
+    mode = pushdown.mode(endpoint) if pushdown is not None else False
+    if mode is False:
+        return await scan_window(fetch, date_from, date_to, filter_query)
+
+    raw = [item async for item in iterate(fetch, window_query(date_from, date_to, filter_query),
+                                          page_size=WINDOW_PAGE_SIZE)]
+    filtered = in_window(parse_schedule_items(raw), date_from, date_to)
+    if mode:
+        return filtered
+
+    expected = await scan_window(fetch, date_from, date_to, filter_query)
+    pushdown.verified(endpoint, filtered, expected)
+    return expected
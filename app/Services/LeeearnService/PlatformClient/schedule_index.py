@@ -0,0 +1,303 @@
+import asyncio
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import date, datetime, time as day_time, timedelta
+from typing import Awaitable, Callable, Iterator, Optional, Sequence
+
+from .ratelimit import Priority, request_priority
+from .schedule import (
+    ScheduleBound,
+    ScheduleItem,
+    _window_bound,
+    local_datetime,
+    local_epoch,
+)
+from .utils import branch_key
+
+TimePoint = datetime | int
+
+# Services whose mutations can move, add or remove schedule items.
+SCHEDULE_SERVICES = frozenset((
+    "/CompanyBranchGroupSchedule",
+    "/CompanyBranchGroup",
+    "/CompanyBranchTeacher",
+    "/CompanyBranchCustomer",
+))
+
+LoadItems = Callable[[Optional[datetime], Optional[datetime]],
+                     Awaitable[Sequence[ScheduleItem]]]
+
+# Epoch stand-ins for an unbounded window side.
+_OPEN_START = -2 ** 62
+_OPEN_END = 2 ** 62
+# Fresh windows remembered per index; older ones just count as stale.
+_FRESH_SPANS = 16
+
+
+def _epoch(value: TimePoint) -> int:
+    """Naive local datetimes are converted; ints are already platform epoch seconds."""
+    return local_epoch(value) if isinstance(value, datetime) else value
+
+
+def _bounds(date_from: ScheduleBound, date_to: ScheduleBound) -> tuple[int, int]:
+    start, end = _window_bound(date_from), _window_bound(date_to)
+    return (_OPEN_START if start is None else start,
+            _OPEN_END if end is None else end)
+
+
+def _bound(epoch: int, open_side: int) -> Optional[datetime]:
+    return None if epoch == open_side else local_datetime(epoch)
+
+
+class ScheduleIndex:
+    """
+    Read-only lookup structure over one teacher's or customer's schedule.
+
+    Items are kept sorted by start next to an ``array`` of starts and a running
+    maximum of ends, so range queries are a bisect plus the slice and
+    ``current_at`` only walks back over lessons that can still be running.
+    Times are naive local datetimes or epoch seconds of the platform time.
+    """
+    __slots__ = ("items", "_starts", "_max_ends", "_by_id")
+
+    def __init__(self, items: Sequence[ScheduleItem]):
+        self.items: tuple[ScheduleItem, ...] = tuple(
+            sorted(items, key=lambda item: item.start)
+        )
+        self._starts = array("q", (item.start for item in self.items))
+        self._max_ends = array("q")
+        self._by_id: dict[str, ScheduleItem] = {}
+
+        running = None
+        for item in self.items:
+            running = item.end if running is None else max(running, item.end)
+            self._max_ends.append(running)
+            self._by_id.setdefault(item.id, item)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[ScheduleItem]:
+        return iter(self.items)
+
+    def by_id(self, item_id: str) -> Optional[ScheduleItem]:
+        return self._by_id.get(item_id)
+
+    def current_at(self, at: TimePoint) -> Optional[ScheduleItem]:
+        """The earliest-starting lesson with ``start <= at <= end``, or None."""
+        ts = _epoch(at)
+        current = None
+        index = bisect_right(self._starts, ts) - 1
+        while index >= 0 and self._max_ends[index] >= ts:
+            item = self.items[index]
+            if item.end >= ts:
+                current = item
+            index -= 1
+        return current
+
+    def between(self, start: TimePoint, end: TimePoint) -> tuple[ScheduleItem, ...]:
+        """Lessons starting in ``[start, end)``, in start order."""
+        return self.items[bisect_left(self._starts, _epoch(start)):
+                          bisect_left(self._starts, _epoch(end))]
+
+    def by_day(self, day: date) -> tuple[ScheduleItem, ...]:
+        """Lessons starting on the given local calendar day."""
+        midnight = datetime.combine(day, day_time())
+        return self.between(midnight, midnight + timedelta(days=1))
+
+    def days(self, start: TimePoint, end: TimePoint) -> list[date]:
+        """Sorted local dates with at least one lesson starting in ``[start, end)``."""
+        return sorted({item.start_local.date() for item in self.between(start, end)})
+
+    def replaced(self, start: TimePoint, end: TimePoint,
+                 items: Sequence[ScheduleItem]) -> "ScheduleIndex":
+        """A new index with the lessons starting in ``[start, end)`` replaced by ``items``."""
+        low = bisect_left(self._starts, _epoch(start))
+        high = bisect_left(self._starts, _epoch(end))
+        return ScheduleIndex(self.items[:low] + tuple(items) + self.items[high:])
+
+
+class _IndexEntry:
+    """
+    One owner's index over the loaded range ``[start, end)`` plus the parts of
+    it that are still fresh, as ``(start, end, expires)`` spans.
+    """
+    __slots__ = ("index", "start", "end", "fresh")
+
+    def __init__(self, index: ScheduleIndex, start: int, end: int):
+        self.index = index
+        self.start = start
+        self.end = end
+        self.fresh: list[tuple[int, int, float]] = []
+
+    def covers(self, start: int, end: int) -> bool:
+        return self.start <= start and end <= self.end
+
+    def touches(self, start: int, end: int) -> bool:
+        return start <= self.end and self.start <= end
+
+    def is_fresh(self, start: int, end: int, now: float) -> bool:
+        reached = start
+        for span_start, span_end, expires in sorted(self.fresh):
+            if reached >= end or span_start > reached:
+                break
+            if expires > now:
+                reached = max(reached, span_end)
+        return reached >= end
+
+    def mark_fresh(self, start: int, end: int, expires: float, now: float):
+        self.fresh = [span for span in self.fresh if span[2] > now]
+        self.fresh.append((start, end, expires))
+        del self.fresh[:-_FRESH_SPANS]
+
+    def window(self, start: int, end: int) -> ScheduleIndex:
+        if start <= self.start and self.end <= end:
+            return self.index
+        return ScheduleIndex(self.index.between(start, end))
+
+
+class ScheduleIndexCache:
+    """
+    One ScheduleIndex per (kind, branch, owner), sliced by the requested window.
+
+    Each entry remembers the range it has loaded. A window inside that range
+    is answered from the index; a window reaching past it loads only the
+    missing part and merges it in. Freshness is tracked per loaded window:
+    once a window's TTL passes it is still answered from the index while a
+    single background refresh reloads just that window, and the index is only
+    rebuilt when the reloaded items differ. Invalidated entries are dropped.
+
+    :param ttl: Seconds a loaded window is served without a refresh
+    :param max_entries: LRU bound on the number of indexes kept
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[tuple, _IndexEntry] = OrderedDict()
+        self._loading: dict[tuple, asyncio.Task] = {}
+        # Bumped by invalidate(): per branch, and globally for all branches.
+        # A load only stores its items if neither changed while it ran.
+        self._version = 0
+        self._branch_versions: dict[str, int] = {}
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.rebuilds = 0
+
+    async def get(self, key: tuple, load: LoadItems,
+                  date_from: ScheduleBound = None,
+                  date_to: ScheduleBound = None) -> ScheduleIndex:
+        """
+        :param key: ``(kind, branch_key(branch_id), owner_id)``
+        :param load: ``load(date_from, date_to)`` returning the ScheduleItems
+            starting in ``[date_from, date_to)``; None bounds are open
+        :param date_from: Local start of the window, None for unbounded
+        :param date_to: Local end of the window (exclusive), None for unbounded
+        """
+        start, end = _bounds(date_from, date_to)
+        entry = self._entries.get(key)
+        if entry is not None and entry.covers(start, end):
+            self._entries.move_to_end(key)
+            if entry.is_fresh(start, end, time.monotonic()):
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+                with request_priority(Priority.BACKGROUND):
+                    self._refresh(key, load, start, end)
+            return entry.window(start, end)
+
+        self.misses += 1
+        if entry is not None and entry.touches(start, end):
+            # Only the parts of the window outside the loaded range.
+            parts = [(start, entry.start)] if start < entry.start else []
+            if end > entry.end:
+                parts.append((entry.end, end))
+            known = entry.index.between(start, end)
+        else:
+            parts, known = [(start, end)], ()
+
+        loaded = await asyncio.gather(*(asyncio.shield(self._refresh(key, load, *part))
+                                        for part in parts))
+        entry = self._entries.get(key)
+        if entry is not None and entry.covers(start, end):
+            return entry.window(start, end)
+        # Invalidated while loading: answer from what was read, uncached.
+        return ScheduleIndex(known + tuple(item for items in loaded for item in items))
+
+    def invalidate(self, branch_id=None):
+        """Drops the indexes of one branch (all branches if None)."""
+        branch = None if branch_id is None else branch_key(branch_id)
+        if branch is None:
+            self._version += 1
+        else:
+            self._branch_versions[branch] = self._branch_versions.get(branch, 0) + 1
+        for key in list(self._entries):
+            if branch is None or key[1] == branch:
+                del self._entries[key]
+        for key in list(self._loading):
+            if branch is None or key[0][1] == branch:
+                del self._loading[key]
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "rebuilds": self.rebuilds,
+        }
+
+    def _refresh(self, key: tuple, load: LoadItems, start: int, end: int) -> asyncio.Task:
+        loading = (key, start, end)
+        task = self._loading.get(loading)
+        if task is None:
+            task = self._loading[loading] = asyncio.ensure_future(
+                self._load(key, load, start, end)
+            )
+            task.add_done_callback(lambda done: self._forget(loading, done))
+        return task
+
+    def _version_of(self, key: tuple) -> tuple[int, int]:
+        return self._version, self._branch_versions.get(key[1], 0)
+
+    async def _load(self, key: tuple, load: LoadItems,
+                    start: int, end: int) -> tuple[ScheduleItem, ...]:
+        version = self._version_of(key)
+        items = tuple(await load(_bound(start, _OPEN_START), _bound(end, _OPEN_END)))
+
+        # An invalidation of this branch during the load means the items may
+        # predate a mutation; other branches' invalidations don't matter.
+        if version != self._version_of(key):
+            return items
+
+        entry = self._entries.get(key)
+        if entry is None or not entry.touches(start, end):
+            entry = _IndexEntry(ScheduleIndex(items), start, end)
+            self.rebuilds += 1
+        else:
+            # Unchanged items keep the current index instead of rebuilding it.
+            current = entry.index.between(start, end)
+            if len(current) != len(items) or set(current) != set(items):
+                entry.index = entry.index.replaced(start, end, items)
+                self.rebuilds += 1
+            entry.start, entry.end = min(entry.start, start), max(entry.end, end)
+
+        now = time.monotonic()
+        entry.mark_fresh(start, end, now + self.ttl, now)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return items
+
+    def _forget(self, loading: tuple, task: asyncio.Task):
+        if self._loading.get(loading) is task:
+            del self._loading[loading]
+        if not task.cancelled():
+            # A failed background refresh keeps serving the stale index.
+            task.exception()
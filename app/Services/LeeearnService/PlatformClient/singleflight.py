@@ -0,0 +1,63 @@
+import asyncio
+from collections import Counter
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls: the first caller starts the request,
+    later callers with the same key await the same task and share its result.
+
+    The request runs as its own task, so a cancelled caller does not cancel it
+    for the others; it is cancelled only once every caller has gone away.
+    """
+
+    def __init__(self):
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        self._waiters: dict[asyncio.Task, int] = {}
+
+        self.started = 0
+        self.deduplicated = 0
+        self.deduplicated_by_endpoint: Counter[str] = Counter()
+
+    async def do(self, key: tuple, func: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.started += 1
+        else:
+            self.deduplicated += 1
+            self.deduplicated_by_endpoint[key[1]] += 1
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            remaining = self._waiters[task] - 1
+            if remaining:
+                self._waiters[task] = remaining
+            else:
+                del self._waiters[task]
+                if not task.done():
+                    # Every caller was cancelled or timed out: nobody needs the answer.
+                    task.cancel()
+
+    def _forget(self, key: tuple, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every caller went away.
+            task.exception()
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._inflight),
+            "started": self.started,
+            "deduplicated": self.deduplicated,
+            "deduplicated_by_endpoint": dict(self.deduplicated_by_endpoint),
+        }
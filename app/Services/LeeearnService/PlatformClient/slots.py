@@ -0,0 +1,216 @@
+from array import array
+from datetime import date, timedelta
+from typing import Iterable, Iterator, Mapping, Sequence
+
+from .schedule import PLATFORM_UTC_OFFSET, ScheduleItem
+
+MINUTES_PER_DAY = 24 * 60
+
+_EPOCH_DATE = date(1970, 1, 1)
+_OFFSET_SECONDS = int(PLATFORM_UTC_OFFSET.total_seconds())
+
+
+def day_number(day: date) -> int:
+    return (day - _EPOCH_DATE).days
+
+
+def day_from_number(number: int) -> date:
+    return _EPOCH_DATE + timedelta(days=number)
+
+
+def parse_clock(value: str) -> int:
+    """``"09:30"`` / ``"09:30:00"`` -> minutes since midnight."""
+    return int(value[:2]) * 60 + int(value[3:5])
+
+
+def format_clock(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+class Intervals:
+    """
+    Sorted, non-overlapping half-open ``[start, end)`` intervals stored in two
+    ``array('q')`` columns of local minutes since 1970-01-01.
+
+    Set operations are single merge-sweeps over both operands, so their cost
+    is linear in the number of intervals.
+    """
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, starts: array | None = None, ends: array | None = None):
+        self.starts = starts if starts is not None else array("q")
+        self.ends = ends if ends is not None else array("q")
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[tuple[int, int]]) -> "Intervals":
+        """Builds a normalized set from unsorted, possibly overlapping pairs."""
+        starts, ends = array("q"), array("q")
+        for start, end in sorted(pair for pair in pairs if pair[0] < pair[1]):
+            if ends and start <= ends[-1]:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+        return cls(starts, ends)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self.starts, self.ends)
+
+    def __eq__(self, other):
+        if not isinstance(other, Intervals):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __repr__(self):
+        return f"Intervals({list(self)!r})"
+
+    def total(self) -> int:
+        return sum(self.ends) - sum(self.starts)
+
+    def union(self, other: "Intervals") -> "Intervals":
+        a_starts, a_ends, b_starts, b_ends = self.starts, self.ends, other.starts, other.ends
+        starts, ends = array("q"), array("q")
+        i = j = 0
+        while i < len(a_starts) or j < len(b_starts):
+            if j >= len(b_starts) or (i < len(a_starts) and a_starts[i] <= b_starts[j]):
+                start, end = a_starts[i], a_ends[i]
+                i += 1
+            else:
+                start, end = b_starts[j], b_ends[j]
+                j += 1
+
+            if ends and start <= ends[-1]:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+        return Intervals(starts, ends)
+
+    def intersect(self, other: "Intervals") -> "Intervals":
+        a_starts, a_ends, b_starts, b_ends = self.starts, self.ends, other.starts, other.ends
+        starts, ends = array("q"), array("q")
+        i = j = 0
+        while i < len(a_starts) and j < len(b_starts):
+            start = max(a_starts[i], b_starts[j])
+            end = min(a_ends[i], b_ends[j])
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+            if a_ends[i] < b_ends[j]:
+                i += 1
+            else:
+                j += 1
+        return Intervals(starts, ends)
+
+    def subtract(self, other: "Intervals") -> "Intervals":
+        a_starts, a_ends, b_starts, b_ends = self.starts, self.ends, other.starts, other.ends
+        starts, ends = array("q"), array("q")
+        j = 0
+        for i in range(len(a_starts)):
+            start, end = a_starts[i], a_ends[i]
+            # Busy intervals that end before this one starts never matter again.
+            while j < len(b_starts) and b_ends[j] <= start:
+                j += 1
+
+            k = j
+            while k < len(b_starts) and b_starts[k] < end:
+                if b_starts[k] > start:
+                    starts.append(start)
+                    ends.append(b_starts[k])
+                start = max(start, b_ends[k])
+                if start >= end:
+                    break
+                k += 1
+
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+        return Intervals(starts, ends)
+
+    def by_day(self) -> dict[date, list[tuple[str, str]]]:
+        """
+        ``{date: [("HH:MM", "HH:MM"), ...]}`` with intervals split at midnight.
+
+        The clock strings round-trip through ``parse_clock``. A day's last
+        interval can end at ``"24:00"`` (the following midnight), which
+        ``datetime.strptime(..., "%H:%M")`` rejects, so parse them with
+        ``parse_clock``. Intervals are never empty, so no ``(t, t)`` pairs
+        are produced.
+        """
+        days: dict[date, list[tuple[str, str]]] = {}
+        for start, end in self:
+            while start < end:
+                number, offset = divmod(start, MINUTES_PER_DAY)
+                day_end = min(end, (number + 1) * MINUTES_PER_DAY)
+                # An interval ending exactly at midnight is shown as "24:00".
+                days.setdefault(day_from_number(number), []).append(
+                    (format_clock(offset), format_clock(day_end - number * MINUTES_PER_DAY))
+                )
+                start = day_end
+        return days
+
+
+def weekly_hours(schedule_input: Sequence[dict], start_day: date, days: int) -> Intervals:
+    """
+    Tiles ``regularScheduleInputRequests`` (``{"day": weekday, "from", "to"}``,
+    Monday = 0) over ``days`` days from ``start_day``.
+
+    A ``to`` at or before ``from`` runs past midnight into the next day, so
+    ``"22:00"``-``"00:00"`` ends at midnight and ``"00:00"``-``"00:00"`` is
+    the whole day.
+    """
+    week: list[list[tuple[int, int]]] = [[] for _ in range(7)]
+    for entry in schedule_input:
+        start, end = parse_clock(entry["from"]), parse_clock(entry["to"])
+        if end <= start:
+            end += MINUTES_PER_DAY
+        week[entry["day"] % 7].append((start, end))
+    for hours in week:
+        hours.sort()
+
+    first = day_number(start_day)
+    weekday = start_day.weekday()
+    pairs = []
+    for offset in range(days):
+        base = (first + offset) * MINUTES_PER_DAY
+        for start, end in week[(weekday + offset) % 7]:
+            pairs.append((base + start, base + end))
+    return Intervals.from_pairs(pairs)
+
+
+def busy_intervals(items: Iterable[ScheduleItem]) -> Intervals:
+    """Lessons as local-minute intervals (start rounded down, end rounded up)."""
+    return Intervals.from_pairs(
+        ((item.start + _OFFSET_SECONDS) // 60, -(-(item.end + _OFFSET_SECONDS) // 60))
+        for item in items
+    )
+
+
+def free_slots(schedule_input: Sequence[dict], items: Iterable[ScheduleItem],
+               start_day: date, days: int) -> Intervals:
+    return weekly_hours(schedule_input, start_day, days).subtract(busy_intervals(items))
+
+
+def free_slots_many(
+        teachers: Mapping[str, tuple[Sequence[dict], Iterable[ScheduleItem]]],
+        start_day: date,
+        days: int
+) -> dict[str, Intervals]:
+    """Free intervals per teacher: ``{teacher_id: (schedule_input, items)}``."""
+    return {
+        teacher_id: free_slots(schedule_input, items, start_day, days)
+        for teacher_id, (schedule_input, items) in teachers.items()
+    }
+
+
+def common_free(intervals: Iterable[Intervals]) -> Intervals:
+    """Time free for every given teacher."""
+    result = None
+    for value in intervals:
+        result = value if result is None else result.intersect(value)
+    return result if result is not None else Intervals()
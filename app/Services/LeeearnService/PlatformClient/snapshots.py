@@ -0,0 +1,264 @@
+import time
+from itertools import repeat
+from typing import Any, Awaitable, Callable, Optional
+
+from .local_query import UnsupportedQuery, evaluate
+from .pagination import fetch_windows, page_items
+from .query_builder import QueryBuilder
+from .utils import (
+    PlatformResponse,
+    body_field,
+    branch_key,
+    canonical_body,
+    endpoint_service,
+)
+
+SendFunc = Callable[[str, dict | str | None], Awaitable[PlatformResponse]]
+
+# Small reference-data list endpoints whose full contents can be held locally.
+SNAPSHOT_ENDPOINTS = frozenset((
+    "/CompanyBranchRole/Get",
+    "/CompanyBranchTag/Get",
+    "/CompanyBranchCourse/Get",
+    "/CompanyBranchDirection/Get",
+    "/CompanyBranchManager/Get",
+    "/CompanyBranchLesson/Get",
+))
+
+
+# (raw item as received, the same item resolved, index of its response)
+Entry = tuple[Any, Any, int]
+
+
+class _Snapshot:
+    __slots__ = ("entries", "definitions", "template", "expires", "branch")
+
+    def __init__(self, entries: list[Entry], definitions: list[dict],
+                 template: Any, expires: float, branch):
+        self.entries = entries
+        # Per source response: $id -> raw object carrying it
+        self.definitions = definitions
+        # Payload of source response 0; local answers reuse its envelope
+        self.template = template
+        self.expires = expires
+        self.branch = branch
+
+
+def _definitions(payload: Any) -> dict:
+    """Every ``$id`` of a raw payload and the object that carries it."""
+    found = {}
+    stack = [payload]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            if "$id" in value:
+                found[value["$id"]] = value
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return found
+
+
+def _portable(entries: list[Entry], definitions: list[dict]) -> list:
+    """
+    Raw items of a local page that stay valid reference-preserving JSON on
+    their own. A ``$ref`` to an object outside the page is replaced by the
+    object itself. Items from responses other than the template's get their
+    ids prefixed with the response index, since every response numbers its
+    ids from 1. A page taken whole from one response comes back unchanged.
+    """
+    prefixed = any(source for _, _, source in entries)
+    in_page = {(source, key) for raw, _, source in entries
+               for key in _definitions(raw)}
+    emitted: set = set()
+
+    def rename(source: int, key):
+        return f"{source}.{key}" if prefixed and source else key
+
+    def rewrite(value, source: int, defs: dict):
+        if isinstance(value, dict):
+            if "$ref" in value:
+                ref = (source, value["$ref"])
+                if ref not in in_page and ref not in emitted and value["$ref"] in defs:
+                    return rewrite(defs[value["$ref"]], source, defs)
+                return {**value, "$ref": rename(source, value["$ref"])}
+            if "$id" in value:
+                emitted.add((source, value["$id"]))
+            out = {key: rewrite(item, source, defs) for key, item in value.items()}
+            if "$id" in out:
+                out["$id"] = rename(source, out["$id"])
+            return out
+        if isinstance(value, list):
+            return [rewrite(item, source, defs) for item in value]
+        return value
+
+    return [rewrite(raw, source, definitions[source]) for raw, _, source in entries]
+
+
+def _with_items(template: Any, page: list, total: int) -> Any:
+    """
+    ``template`` with its item list (where ``page_items`` finds it) replaced
+    by ``page`` and its count by ``total``; ``$values`` wrapping is kept.
+    """
+    if not isinstance(template, dict):
+        return {"data": {"data": page, "count": total}}
+    data = template.get("data")
+    if isinstance(data, list):
+        return {**template, "data": page}
+    if not isinstance(data, dict):
+        return {**template, "data": {"data": page, "count": total}}
+
+    if "data" not in data:
+        # The data member is the $values wrapper itself.
+        return {**template, "data": {**data, "$values": page}}
+
+    data = dict(data)
+    listing = data["data"]
+    if isinstance(listing, dict) and "$values" in listing:
+        data["data"] = {**listing, "$values": page}
+    else:
+        data["data"] = page
+    for key in data:
+        if key.lower() == "count":
+            data[key] = total
+    return {**template, "data": data}
+
+
+def _entries(response: PlatformResponse, source: int) -> list[Entry]:
+    # data() resolves the whole response, so items line up with the raw ones.
+    return list(zip(page_items(response.json()), page_items(response.data()),
+                    repeat(source)))
+
+
+def _split_body(body) -> tuple[str, dict | None]:
+    """Snapshot key part (everything but the query) and the query itself."""
+    if not isinstance(body, dict):
+        return canonical_body(body), None
+    rest = {key: value for key, value in body.items() if key.lower() != "data"}
+    return canonical_body(rest), body_field(body, "data")
+
+
+def _is_plain_query(query) -> bool:
+    """A query without filters that starts at offset 0."""
+    if not isinstance(query, dict):
+        return False
+    return (not body_field(query, "FilterQuery")
+            and not body_field(query, "Offset"))
+
+
+class SnapshotStore:
+    """
+    Full in-memory copies of small list datasets (roles, tags, courses,
+    directions, managers, lessons) per branch.
+
+    While a snapshot is fresh, list queries against it are answered by the
+    local QueryBuilder evaluator instead of the network. Snapshots are taken
+    explicitly with ``refresh`` or captured from an unfiltered response that
+    is provably complete (fewer items than its Count), and dropped when the
+    service sees a mutation.
+
+    :param ttl: Seconds a snapshot may answer queries
+    :param endpoints: Endpoints eligible for snapshots
+    """
+
+    def __init__(self, ttl: float = 300.0,
+                 endpoints: frozenset[str] = SNAPSHOT_ENDPOINTS):
+        self.ttl = ttl
+        self.endpoints = endpoints
+        self._snapshots: dict[tuple[str, str], _Snapshot] = {}
+
+        self.local_hits = 0
+        self.unsupported = 0
+        self.captures = 0
+
+    def answer(self, endpoint: str, body) -> Optional[PlatformResponse]:
+        """A locally evaluated response, or None if the network is needed."""
+        if endpoint not in self.endpoints:
+            return None
+
+        key_body, query = _split_body(body)
+        snapshot = self._snapshots.get((endpoint, key_body))
+        if snapshot is None or time.monotonic() >= snapshot.expires:
+            return None
+
+        try:
+            page, total = evaluate(snapshot.entries, query, key=lambda entry: entry[1])
+        except UnsupportedQuery:
+            self.unsupported += 1
+            return None
+
+        self.local_hits += 1
+        # Same shape as the network answer: only data() normalizes.
+        return PlatformResponse.from_payload(
+            _with_items(snapshot.template,
+                        _portable(page, snapshot.definitions), total),
+            headers={"X-Local-Snapshot": "1"}
+        )
+
+    def capture(self, endpoint: str, body, response: PlatformResponse):
+        """Stores a network response as a snapshot if it holds the whole dataset."""
+        if endpoint not in self.endpoints or not response.ok or response.stale:
+            return
+
+        key_body, query = _split_body(body)
+        count = body_field(query, "Count") if isinstance(query, dict) else None
+        if not _is_plain_query(query) or count is None:
+            return
+
+        payload = response.json()
+        if len(page_items(payload)) < count:
+            self._store(endpoint, key_body, body, _entries(response, 0),
+                        [_definitions(payload)], payload)
+
+    async def refresh(self, endpoint: str, body: dict, send: SendFunc,
+                      window: int = 200, concurrency: int = 4) -> list:
+        """
+        Loads the complete dataset of ``endpoint`` for ``body`` (without its
+        ``data`` query) in up to ``concurrency`` parallel windows and stores
+        it as a snapshot. Returns the resolved items.
+        """
+        key_body, _ = _split_body(body)
+        base = {key: value for key, value in body.items() if key.lower() != "data"}
+
+        definitions: list[dict] = []
+        payloads: list = []
+
+        def window_entries(response: PlatformResponse) -> list[Entry]:
+            payloads.append(response.json())
+            definitions.append(_definitions(payloads[-1]))
+            return _entries(response, len(definitions) - 1)
+
+        entries = await fetch_windows(
+            lambda query: send(endpoint, {**base, "data": query}),
+            QueryBuilder(), window=window, concurrency=concurrency,
+            items=window_entries
+        )
+        self._store(endpoint, key_body, body, entries, definitions,
+                    payloads[0] if payloads else None)
+        return [item for _, item, _ in entries]
+
+    def invalidate(self, service: str, branch_id=None):
+        """Drops the snapshots of ``service`` (one branch, or all if None)."""
+        branch = None if branch_id is None else branch_key(branch_id)
+        for key, snapshot in list(self._snapshots.items()):
+            if (endpoint_service(key[0]) == service
+                    and (branch is None or snapshot.branch == branch)):
+                del self._snapshots[key]
+
+    def stats(self) -> dict:
+        return {
+            "snapshots": len(self._snapshots),
+            "items": sum(len(snapshot.entries) for snapshot in self._snapshots.values()),
+            "local_hits": self.local_hits,
+            "unsupported": self.unsupported,
+            "captures": self.captures,
+        }
+
+    def _store(self, endpoint: str, key_body: str, body, entries: list[Entry],
+               definitions: list[dict], template: Any):
+        branch = body_field(body, "companyBranchId")
+        self._snapshots[(endpoint, key_body)] = _Snapshot(
+            entries, definitions, template, time.monotonic() + self.ttl,
+            None if branch is None else branch_key(branch)
+        )
+        self.captures += 1
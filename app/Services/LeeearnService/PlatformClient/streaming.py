@@ -0,0 +1,154 @@
+import codecs
+import re
+from typing import Any, AsyncIterator
+
+from .codec import get_codec
+
+_STRUCTURAL = re.compile(r'[{}\[\]",:]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+ItemsPath = tuple[str, ...]
+
+
+class ItemStream:
+    """
+    Incremental extractor for the elements of one JSON array inside a response body.
+
+    Bytes are fed as they arrive; every element of the array found at ``path``
+    (or at ``path + ("$values",)``) is decoded and returned as soon as it is
+    complete. Text before the current element is dropped, so memory stays
+    around the size of one element.
+    """
+
+    def __init__(self, path: ItemsPath = ("data", "data"), encoding: str = "utf-8"):
+        self.path = tuple(path)
+        self.done = False
+
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._buf = ""
+        self._pos = 0
+
+        # Open containers: [kind, key path, last key, expecting key]
+        self._stack: list[list] = []
+        self._in_string = False
+        self._string_start = 0
+
+        self._target_depth: int | None = None
+        self._item_start = 0
+
+    def _matches(self, key_path: ItemsPath) -> bool:
+        return key_path == self.path or key_path == self.path + ("$values",)
+
+    def _emit(self, end: int, items: list):
+        text = self._buf[self._item_start:end].strip()
+        if text:
+            items.append(get_codec().loads(text))
+
+    def feed(self, chunk: bytes) -> list:
+        if self.done:
+            return []
+
+        self._buf += self._decoder.decode(chunk)
+        items: list = []
+        buf = self._buf
+        pos = self._pos
+        stack = self._stack
+
+        while not self.done:
+            if self._in_string:
+                m = _STRING_SPECIAL.search(buf, pos)
+                if m is None:
+                    pos = len(buf)
+                    break
+                if m.group() == "\\":
+                    if m.start() + 1 >= len(buf):
+                        pos = m.start()
+                        break
+                    pos = m.start() + 2
+                    continue
+
+                pos = m.end()
+                self._in_string = False
+                top = stack[-1] if stack else None
+                if top is not None and top[0] == "{" and top[3]:
+                    top[2] = get_codec().loads(buf[self._string_start:pos])
+                continue
+
+            m = _STRUCTURAL.search(buf, pos)
+            if m is None:
+                pos = len(buf)
+                break
+
+            char, index = m.group(), m.start()
+            pos = index + 1
+            top = stack[-1] if stack else None
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = index
+            elif char == "{" or char == "[":
+                if top is None:
+                    key_path = ()
+                elif top[0] == "{":
+                    key_path = top[1] + (top[2],)
+                else:
+                    key_path = top[1]
+                stack.append([char, key_path, None, char == "{"])
+
+                if (char == "[" and self._target_depth is None
+                        and self._matches(key_path)):
+                    self._target_depth = len(stack)
+                    self._item_start = pos
+            elif char == "}" or char == "]":
+                if self._target_depth == len(stack):
+                    self._emit(index, items)
+                    self.done = True
+                stack.pop()
+            elif char == ":":
+                if top is not None:
+                    top[3] = False
+            elif char == ",":
+                if top is not None and top[0] == "{":
+                    top[3] = True
+                if self._target_depth == len(stack):
+                    self._emit(index, items)
+                    self._item_start = pos
+
+        # Drop text that no pending element, key or string still needs.
+        keep = pos
+        if self._in_string:
+            keep = min(keep, self._string_start)
+        if self._target_depth is not None and not self.done:
+            keep = min(keep, self._item_start)
+
+        self._buf = buf[keep:]
+        self._pos = pos - keep
+        self._string_start -= keep
+        self._item_start -= keep
+        return items
+
+
+class PlatformStream:
+    """
+    Unbuffered platform response: status and headers plus the raw body chunks.
+    """
+
+    def __init__(self, status: int, reason: str, headers: dict[str, str],
+                 chunks: AsyncIterator[bytes]):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.ok = 200 <= status < 300
+        self.chunks = chunks
+
+    async def read(self) -> bytes:
+        return b"".join([chunk async for chunk in self.chunks])
+
+    async def items(self, path: ItemsPath = ("data", "data"),
+                    encoding: str = "utf-8") -> AsyncIterator[Any]:
+        stream = ItemStream(path, encoding)
+        async for chunk in self.chunks:
+            for item in stream.feed(chunk):
+                yield item
+            if stream.done:
+                return
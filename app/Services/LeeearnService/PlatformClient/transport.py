@@ -0,0 +1,177 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+
+try:
+    import aiohttp
+    from multidict import CIMultiDict
+except ImportError:  # pragma: no cover - aiohttp is listed in requirements
+    aiohttp = None
+
+from .streaming import PlatformStream
+from .utils import PlatformResponse, prepare_request, sync_request
+
+if TYPE_CHECKING:
+    from .client import PlatformClient
+
+
+class BaseTransport:
+    """
+    Sends a prepared platform request and returns a buffered PlatformResponse.
+    """
+
+    async def request(
+        self,
+        client: "PlatformClient",
+        endpoint: str,
+        body: dict | str | None = None,
+        *,
+        method: str = "POST",
+        timeout: Optional[float] = 30.0,
+    ) -> PlatformResponse:
+        raise NotImplementedError
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        client: "PlatformClient",
+        endpoint: str,
+        body: dict | str | None = None,
+        *,
+        method: str = "POST",
+        timeout: Optional[float] = 30.0,
+    ) -> AsyncIterator[PlatformStream]:
+        """
+        Fallback for transports without streaming: buffers the body and yields it as one chunk.
+        """
+        response = await self.request(client, endpoint, body, method=method, timeout=timeout)
+
+        async def chunks():
+            yield response.bytes()
+
+        yield PlatformStream(response.status, response.reason, response.headers, chunks())
+
+    async def close(self):
+        pass
+
+
+class ThreadTransport(BaseTransport):
+    """
+    Blocking ``http.client`` request on the default executor.
+    Opens a new connection per call; kept for environments without aiohttp.
+    """
+
+    async def request(self, client, endpoint, body=None, *, method="POST",
+                      timeout=30.0) -> PlatformResponse:
+        return await asyncio.to_thread(
+            sync_request, client, endpoint, body,
+            method=method, timeout=timeout
+        )
+
+
+class AiohttpTransport(BaseTransport):
+    """
+    Native asyncio transport with a bounded keep-alive connection pool.
+
+    :param pool_size: Max open connections per host
+    :param idle_timeout: Seconds an idle keep-alive connection is kept open
+    :param chunk_size: Read size for streamed responses
+    """
+
+    def __init__(self, pool_size: int = 20, idle_timeout: float = 30.0,
+                 chunk_size: int = 64 * 1024):
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required for AiohttpTransport")
+
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.chunk_size = chunk_size
+
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: set[asyncio.Future] = set()
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._loop is not loop:
+            self._close_detached(self._session, self._loop)
+            self._session = None
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_size,
+                keepalive_timeout=self.idle_timeout,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._loop = loop
+        return self._session
+
+    def _close_detached(self, session: "aiohttp.ClientSession",
+                        loop: asyncio.AbstractEventLoop):
+        """Closes a session left behind by another event loop."""
+        if session.closed:
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        # A stopped or closed loop: closing from here still marks the
+        # connector closed and closes whatever that loop can still release.
+        task = asyncio.ensure_future(session.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def request(self, client, endpoint, body=None, *, method="POST",
+                      timeout=30.0) -> PlatformResponse:
+        headers, body_data = prepare_request(client, endpoint, body)
+        session = self._get_session()
+
+        async with session.request(
+            method.upper(),
+            f"https://{client.host}{endpoint}",
+            data=body_data.encode(),
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as resp:
+            raw = await resp.read()
+            return PlatformResponse.from_parts(
+                raw, resp.status, resp.reason or "", CIMultiDict(resp.headers)
+            )
+
+    @asynccontextmanager
+    async def stream(self, client, endpoint, body=None, *, method="POST",
+                     timeout=30.0) -> AsyncIterator[PlatformStream]:
+        headers, body_data = prepare_request(client, endpoint, body)
+        session = self._get_session()
+
+        async with session.request(
+            method.upper(),
+            f"https://{client.host}{endpoint}",
+            data=body_data.encode(),
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=None, sock_read=timeout),
+        ) as resp:
+            yield PlatformStream(
+                resp.status, resp.reason or "", CIMultiDict(resp.headers),
+                resp.content.iter_chunked(self.chunk_size)
+            )
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+
+_default_transport: Optional[BaseTransport] = None
+
+
+def default_transport() -> BaseTransport:
+    """
+    Process-wide transport shared by clients created without an explicit one,
+    so short-lived clients still reuse the same connection pool.
+    """
+    global _default_transport
+    if _default_transport is None:
+        _default_transport = AiohttpTransport() if aiohttp is not None else ThreadTransport()
+    return _default_transport
@@ -1,13 +1,39 @@
 import http.client
 import json
 import re
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional
+
+from .codec import get_codec
+from .normalize import normalize
+from .types import SafeUUID
 
 if TYPE_CHECKING:
     from .client import PlatformClient
 
 
+_CHARSET = re.compile(r"charset=([^\s;]+)", re.I)
+_UTF8 = ("utf-8", "utf8")
+_MISSING = object()
+
+
+def response_encoding(headers: Mapping[str, str]) -> str:
+    ct = headers.get("Content-Type")
+    if ct is None:
+        # Plain dicts (http.client) keep the server's header case.
+        ct = next((v for k, v in headers.items() if k.lower() == "content-type"), "")
+    m = _CHARSET.search(ct)
+    return (m.group(1) if m else "utf-8").strip('"').strip()
+
+
 class PlatformResponse:
+    """
+    Buffered platform response. The charset and the decoded JSON are computed
+    once and memoized, so callers must treat ``json()`` results as read-only.
+
+    ``stale`` is set on last-good copies served while the platform is down.
+    """
+    stale: bool = False
+
     def __init__(self, resp: http.client.HTTPResponse):
         self._raw: bytes = resp.read()
         self.status: int = resp.status
@@ -15,33 +41,95 @@ class PlatformResponse:
         self.headers: dict[str, str] = {k: v for k, v in resp.getheaders()}
         self.ok: bool = 200 <= resp.status < 300
 
+    @classmethod
+    def from_parts(cls, raw: bytes, status: int, reason: str,
+                   headers: dict[str, str]) -> "PlatformResponse":
+        self = cls.__new__(cls)
+        self._raw = raw
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.ok = 200 <= status < 300
+        return self
+
+    @classmethod
+    def from_payload(cls, payload: Any, status: int = 200, reason: str = "OK",
+                     headers: dict[str, str] | None = None) -> "PlatformResponse":
+        """A response built locally from already-decoded data (json() is pre-set)."""
+        self = cls.from_parts(
+            get_codec().dumps(payload).encode(), status, reason,
+            {"Content-Type": "application/json; charset=utf-8", **(headers or {})}
+        )
+        self._json = payload
+        return self
+
     def _encoding(self) -> str:
-        ct = self.headers.get("Content-Type", "")
-        m = re.search(r"charset=([^\s;]+)", ct, re.I)
-        return (m.group(1) if m else "utf-8").strip('"').strip()
+        charset = self.__dict__.get("_charset")
+        if charset is None:
+            charset = self._charset = response_encoding(self.headers)
+        return charset
 
     def text(self, errors: str = "strict") -> str:
         return self._raw.decode(self._encoding(), errors=errors)
 
-    def json(self) -> dict:
+    def json(self) -> Any:
+        data = self.__dict__.get("_json", _MISSING)
+        if data is not _MISSING:
+            return data
+
+        codec = get_codec()
         try:
-            return json.loads(self.text())
-        except json.JSONDecodeError as e:
+            # UTF-8 bodies go to the codec as bytes and skip the str copy.
+            if self._encoding().lower() in _UTF8:
+                data = codec.loads(self._raw)
+            else:
+                data = codec.loads(self.text())
+        except codec.decode_errors as e:
             snippet = self._raw[:200].decode(self._encoding(), errors="replace")
             raise ValueError(f"Response is not valid JSON (status {self.status}): {snippet}") from e
 
+        self._json = data
+        return data
+
+    def data(self) -> Any:
+        """
+        The ``data`` member of the body with ``$values`` unwrapped and
+        ``$id``/``$ref`` resolved (see ``normalize``). Memoized like ``json()``.
+        """
+        data = self.__dict__.get("_data", _MISSING)
+        if data is _MISSING:
+            payload = self.json()
+            if isinstance(payload, dict) and "data" in payload:
+                payload = payload["data"]
+            data = self._data = normalize(payload)
+        return data
+
+    def parsed(self, parser: Callable[["PlatformResponse"], Any]) -> Any:
+        """
+        ``parser(self)``, memoized per parser, so typed views of a cached
+        response are built once and shared.
+        """
+        memo = self.__dict__.setdefault("_parsed", {})
+        if parser not in memo:
+            memo[parser] = parser(self)
+        return memo[parser]
+
     def bytes(self) -> bytes:
         return self._raw
 
+    def as_stale(self) -> "PlatformResponse":
+        """A copy marked ``stale`` that shares the body and memoized views."""
+        copy = PlatformResponse.__new__(PlatformResponse)
+        copy.__dict__.update(self.__dict__)
+        copy.stale = True
+        return copy
 
-def sync_request(
+
+def prepare_request(
     client: "PlatformClient",
     endpoint: str,
     body: dict | str | None = None,
-    *,
-    method: str = "POST",
-    timeout: Optional[float] = 30.0,
-) -> PlatformResponse:
+) -> tuple[dict[str, str], str]:
     headers = {
         "Content-Type": "application/json",
         "api_id": str(client.api_id),
@@ -49,19 +137,73 @@ def sync_request(
     }
 
     if isinstance(body, dict):
-        body_data = json.dumps(body)
+        body_data = get_codec().dumps(body)
     elif isinstance(body, str):
         body_data = body
     else:
         body_data = "{}"
 
+    if getattr(client, "debug_logs", False):
+        print(f"[⌛] {client.host}{endpoint} : {headers} : {body_data}")
+
+    return headers, body_data
+
+
+def sync_request(
+    client: "PlatformClient",
+    endpoint: str,
+    body: dict | str | None = None,
+    *,
+    method: str = "POST",
+    timeout: Optional[float] = 30.0,
+) -> PlatformResponse:
+    headers, body_data = prepare_request(client, endpoint, body)
+
     conn = http.client.HTTPSConnection(client.host, timeout=timeout)
     try:
-        if getattr(client, "debug_logs", False):
-            print(f"[⌛] {client.host}{endpoint} : {headers} : {body_data}")
-
         conn.request(method.upper(), endpoint, body=body_data, headers=headers)
         resp = conn.getresponse()
         return PlatformResponse(resp)
     finally:
         conn.close()
+
+
+def canonical_body(body: dict | str | None) -> str:
+    if isinstance(body, dict):
+        return json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+    if isinstance(body, str):
+        return body
+    return "{}"
+
+
+def request_key(client: "PlatformClient", endpoint: str,
+                body: dict | str | None = None) -> tuple[str, str, str]:
+    return str(client.api_id), endpoint, canonical_body(body)
+
+
+def endpoint_service(endpoint: str) -> str:
+    """``/CompanyBranchTeacher/GetContacts`` -> ``/CompanyBranchTeacher``"""
+    return endpoint.rsplit("/", 1)[0]
+
+
+def is_read_endpoint(endpoint: str) -> bool:
+    return endpoint.rsplit("/", 1)[-1].startswith("Get")
+
+
+def branch_key(branch_id) -> str:
+    """Canonical string form of a branch id (UUIDs normalized, anything else as is)."""
+    try:
+        return str(SafeUUID(branch_id))
+    except (TypeError, ValueError):
+        return str(branch_id)
+
+
+def body_field(body: dict | str | None, name: str):
+    """Case-insensitive top-level lookup (the models mix ``companyBranchId`` and ``CompanyBranchId``)."""
+    if not isinstance(body, dict):
+        return None
+    name = name.lower()
+    for key, value in body.items():
+        if key.lower() == name:
+            return value
+    return None
@@ -0,0 +1,136 @@
+"""
+Отдельный процесс для Telegram-ботов: python -m app.bot_runner
+
+Хостит BotManager без API, чтобы медленные хэндлеры и всплески апдейтов
+не влияли на задержки API (и наоборот). API управляет ботами через
+локальный HTTP-канал (RemoteBotManager, BOT_RUNNER_URL).
+"""
+import asyncio
+import hmac
+import json
+import logging
+import os
+import signal
+import sys
+from functools import partial
+
+from aiohttp import web
+from dotenv import load_dotenv
+
+from app.Infrastructure.Database import engine, Base
+
+from app.Services.BotManagerService import BotManager
+from app.Services.BotManagerService.Errors import BotTokenRequired
+from app.Services.BotManagerService.Lifecycle import start_bots, stop_bots
+from app.Services.BotManagerService.Remote import (
+    BOT_RUNNER_TOKEN,
+    BOT_RUNNER_TOKEN_HEADER
+)
+from app.Services.LeeearnService.PlatformClient import (
+    clients,
+    default_transport
+)
+
+load_dotenv()
+# Где слушает канал управления (только локально по умолчанию)
+BOT_RUNNER_HOST = os.getenv("BOT_RUNNER_HOST", "127.0.0.1")
+BOT_RUNNER_PORT = int(os.getenv("BOT_RUNNER_PORT", "8081"))
+
+
+def create_control_app(bot_manager: BotManager) -> web.Application:
+    """
+    Канал управления ботами для API (см. RemoteBotManager).
+    """
+    routes = web.RouteTableDef()
+    json_response = partial(web.json_response,
+                            dumps=partial(json.dumps, default=str))
+
+    async def read_config(request: web.Request) -> dict:
+        config = await request.json()
+        config["school_id"] = request.match_info.get("school_id",
+                                                     config.get("school_id"))
+        return config
+
+    @routes.get("/stats")
+    async def stats(request: web.Request):
+        return json_response(await bot_manager.stats())
+
+    @routes.get("/bots/{school_id}/status")
+    async def status(request: web.Request):
+        return json_response(await bot_manager.status(request.match_info["school_id"]))
+
+    @routes.post("/bots/start")
+    async def start(request: web.Request):
+        return json_response(await bot_manager.start_bot(await read_config(request)))
+
+    @routes.post("/bots/{school_id}/stop")
+    async def stop(request: web.Request):
+        return json_response(await bot_manager.stop_bot(request.match_info["school_id"]))
+
+    @routes.post("/bots/{school_id}/restart")
+    async def restart(request: web.Request):
+        return json_response(await bot_manager.restart_bot(await read_config(request)))
+
+    @routes.post("/bots/{school_id}/config")
+    async def apply_config(request: web.Request):
+        return json_response(await bot_manager.apply_config(await read_config(request)))
+
+    @routes.post("/bots/{school_id}/update")
+    async def update(request: web.Request):
+        # Апдейт вебхука, принятый API (режим BOT_UPDATES_MODE=webhook)
+        result = await bot_manager.feed_webhook_update(
+            request.match_info["school_id"],
+            request.headers.get("X-Telegram-Bot-Api-Secret-Token"),
+            await request.json()
+        )
+        return json_response({"status": result})
+
+    @web.middleware
+    async def check_token(request: web.Request, handler):
+        if BOT_RUNNER_TOKEN and not hmac.compare_digest(
+                request.headers.get(BOT_RUNNER_TOKEN_HEADER, ""), BOT_RUNNER_TOKEN):
+            return json_response({"detail": "Invalid bot runner token"}, status=403)
+        return await handler(request)
+
+    @web.middleware
+    async def domain_errors(request: web.Request, handler):
+        try:
+            return await handler(request)
+        except BotTokenRequired as e:
+            return json_response({"detail": str(e)}, status=422)
+
+    app = web.Application(middlewares=[check_token, domain_errors])
+    app.add_routes(routes)
+    return app
+
+
+async def run():
+    bot_manager = BotManager()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopping.set)
+
+    runner = web.AppRunner(create_control_app(bot_manager), access_log=None)
+    try:
+        await start_bots(bot_manager)
+        await runner.setup()
+        await web.TCPSite(runner, BOT_RUNNER_HOST, BOT_RUNNER_PORT).start()
+        logging.info(f"🤖 bot-runner слушает http://{BOT_RUNNER_HOST}:{BOT_RUNNER_PORT}")
+        await stopping.wait()
+    finally:
+        logging.info("👋 bot-runner останавливается...")
+        await runner.cleanup()
+        await stop_bots(bot_manager)
+        await clients.close_all()
+        await default_transport().close()
+        logging.info("👋 bot-runner остановлен")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+    asyncio.run(run())
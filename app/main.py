@@ -1,4 +1,3 @@
-import asyncio
 import logging
 import os
 import sys
@@ -11,61 +10,53 @@ from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 from app.API import api_router
-from app.Infrastructure.Database import engine, Base, async_session
+from app.Infrastructure.Database import engine, Base
 
 from app.Services.BotManagerService import BotManager
-from app.Services.BotManagerService.TelegramBotConfigService import (
-    TelegramBotConfigService
+from app.Services.BotManagerService.Lifecycle import start_bots, stop_bots
+from app.Services.BotManagerService.Remote import (
+    BOT_RUNNER_URL,
+    RemoteBotManager
+)
+from app.Services.LeeearnService.PlatformClient import (
+    clients,
+    default_transport
 )
-from app.Objects.TelegramBotConfigModel import TelegramBotConfig
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO, stream=sys.stdout)
 
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("🚀 Starting application...")
 
-    bot_manager = BotManager()
+    # С BOT_RUNNER_URL боты живут в отдельном процессе (python -m app.bot_runner),
+    # иначе - в этом, вместе с API
+    bot_manager = RemoteBotManager() if BOT_RUNNER_URL else BotManager()
     app.state.bot_manager = bot_manager
 
     try:
-        # await redis_client.connect()
-
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
-        logging.info("Загрузка и запуск активных ботов из БД...")
-        async with async_session() as session:
-            service = TelegramBotConfigService(session)
-            enabled_bots_configs = await service.GetAllEnabled()
-
-            tasks = []
-            for config_model in enabled_bots_configs:
-                # Конвертируем модель в dict
-                config_dict = {
-                    "school_id": str(config_model.school_id),
-                    "is_enabled": config_model.is_enabled,
-                    "bot_name": config_model.bot_name,
-                    "bot_token": config_model.bot_token,
-                    "welcome_message": config_model.welcome_message,
-                    "image_url": config_model.image_url
-                }
-                tasks.append(bot_manager.start_bot(config_dict))
-
-            await asyncio.gather(*tasks)
-            logging.info(
-                f"✅ Запущено {len(enabled_bots_configs)} ботов при старте.")
+        if isinstance(bot_manager, BotManager):
+            await start_bots(bot_manager)
+        else:
+            logging.info(f"🤖 Ботами управляет bot-runner: {BOT_RUNNER_URL}")
 
         yield
     except Exception as e:
         print(f"❌ Failed to start application: {e}")
         raise
     finally:
-        # await redis_client.disconnect()
         logging.info("👋 Application stopping...")
-        if app.state.bot_manager:
+        if isinstance(app.state.bot_manager, BotManager):
+            await stop_bots(app.state.bot_manager)
+        elif app.state.bot_manager:
             await app.state.bot_manager.stop_all_bots()
+        await clients.close_all()
+        await default_transport().close()
         print("👋 Application stopped")
 
 app = FastAPI(
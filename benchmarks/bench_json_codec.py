@@ -0,0 +1,96 @@
+"""
+Micro-benchmark for PlatformResponse decoding on schedule-sized payloads.
+
+Compares the previous per-call decode (charset regex + bytes -> str + json.loads
+on every ``.json()``) with the memoized response, and each installed codec for
+request encoding and response decoding.
+
+    python -m benchmarks.bench_json_codec [items] [json_calls]
+"""
+import json
+import re
+import sys
+import timeit
+import uuid
+from datetime import datetime, timedelta
+
+from app.Services.LeeearnService.PlatformClient.codec import (
+    available_codecs,
+    get_codec,
+    set_codec
+)
+from app.Services.LeeearnService.PlatformClient.utils import PlatformResponse
+
+HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
+
+def schedule_payload(items: int) -> bytes:
+    start = datetime(2025, 9, 1, 8, 0)
+    values = []
+    for i in range(items):
+        begin = start + timedelta(hours=3 * i)
+        values.append({
+            "$id": str(i + 3),
+            "id": str(uuid.uuid4()),
+            "date": begin.isoformat(),
+            "endDate": (begin + timedelta(minutes=90)).isoformat(),
+            "groupId": str(uuid.uuid4()),
+            "lessonId": str(uuid.uuid4()),
+            "lesson": {"$id": f"l{i}", "id": str(uuid.uuid4()),
+                       "name": f"Урок {i % 40}: Python Start"},
+            "teacher": {"id": str(uuid.uuid4()), "displayName": "Іван Петренко"},
+            "room": None,
+            "isOnline": i % 2 == 0,
+            "comment": "",
+        })
+    payload = {"$id": "1", "data": {"$id": "2", "count": items,
+                                    "data": {"$values": values}}}
+    return json.dumps(payload, ensure_ascii=False).encode()
+
+
+def legacy_json(response: PlatformResponse):
+    ct = response.headers.get("Content-Type", "")
+    m = re.search(r"charset=([^\s;]+)", ct, re.I)
+    encoding = (m.group(1) if m else "utf-8").strip('"').strip()
+    return json.loads(response.bytes().decode(encoding))
+
+
+def best(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main(items: int = 1000, json_calls: int = 3):
+    raw = schedule_payload(items)
+    body = {"companyBranchId": str(uuid.uuid4()), "teacherId": str(uuid.uuid4()),
+            "data": {"Offset": 0, "Count": 100, "Filters": [], "Orders": []}}
+    print(f"payload: {items} items, {len(raw) / 1024:.0f} KiB, "
+          f"{json_calls} .json() calls per response\n")
+
+    def legacy():
+        response = PlatformResponse.from_parts(raw, 200, "OK", HEADERS)
+        for _ in range(json_calls):
+            legacy_json(response)
+
+    baseline = best(legacy, 20)
+    print(f"{'legacy per-call decode':<28}{baseline:>10.0f} us")
+
+    previous = get_codec()
+    try:
+        for name in available_codecs():
+            codec = set_codec(name)
+
+            def memoized():
+                response = PlatformResponse.from_parts(raw, 200, "OK", HEADERS)
+                for _ in range(json_calls):
+                    response.json()
+
+            decode = best(memoized, 20)
+            encode = best(lambda: codec.dumps(body), 2000)
+            print(f"{'memoized + ' + name:<28}{decode:>10.0f} us  "
+                  f"x{baseline / decode:.1f}   request body {encode:.1f} us")
+    finally:
+        set_codec(previous)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,128 @@
+"""
+Free-slot computation over synthetic one-year teacher schedules.
+
+Compares the previous per-day loop (strptime for every slot x lesson pair and a
+scan of all lessons per day) with the interval engine in ``slots``.
+
+    python -m benchmarks.bench_slot_engine [teachers] [days]
+"""
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from app.Services.LeeearnService.PlatformClient.schedule import (
+    PLATFORM_UTC_OFFSET,
+    ScheduleItem,
+    local_epoch
+)
+from app.Services.LeeearnService.PlatformClient.schedule_index import ScheduleIndex
+from app.Services.LeeearnService.PlatformClient.slots import (
+    common_free,
+    free_slots_many
+)
+
+START = date(2025, 1, 1)
+
+
+def synthetic_teacher(rng: random.Random, days: int):
+    schedule_input = []
+    for weekday in rng.sample(range(7), 5):
+        schedule_input.append({"day": weekday, "from": "09:00:00", "to": "13:00:00"})
+        schedule_input.append({"day": weekday, "from": "14:00:00", "to": "20:00:00"})
+
+    items = []
+    for offset in range(days):
+        day = datetime.combine(START + timedelta(days=offset), datetime.min.time())
+        for _ in range(rng.randint(2, 7)):
+            start = day + timedelta(hours=rng.randint(9, 19), minutes=rng.choice((0, 15, 30, 45)))
+            begin = local_epoch(start)
+            items.append(ScheduleItem(str(len(items)), "g", "l", "Lesson",
+                                      begin, begin + rng.choice((45, 60, 90)) * 60))
+    return schedule_input, items
+
+
+def legacy_free_slots(schedule_input, items, days):
+    """The handler's original algorithm, on raw platform-style dicts."""
+    def parse_datetime(value):
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
+
+    schedule = {}
+    for entry in schedule_input:
+        schedule.setdefault(entry["day"], []).append((entry["from"][:5], entry["to"][:5]))
+
+    slots_by_date = []
+    for offset in range(days):
+        current = START + timedelta(days=offset)
+        if current.weekday() in schedule:
+            slots_by_date.append({"date": current.strftime("%Y-%m-%d"),
+                                  "slots": schedule[current.weekday()]})
+
+    result = []
+    for day_entry in slots_by_date:
+        slots = day_entry["slots"]
+        date_obj = datetime.strptime(day_entry["date"], "%Y-%m-%d").date()
+        day_lessons = []
+        for lesson in items:
+            lesson_start = parse_datetime(lesson["date"]) + PLATFORM_UTC_OFFSET
+            if lesson_start.date() == date_obj:
+                day_lessons.append((lesson_start,
+                                    parse_datetime(lesson["endDate"]) + PLATFORM_UTC_OFFSET))
+
+        for lesson_start, lesson_end in day_lessons:
+            new_slots = []
+            for free_from, free_to in slots:
+                slot_start = datetime.combine(date_obj, datetime.strptime(free_from, "%H:%M").time())
+                slot_end = datetime.combine(date_obj, datetime.strptime(free_to, "%H:%M").time())
+                if lesson_end <= slot_start or lesson_start >= slot_end:
+                    new_slots.append((free_from, free_to))
+                else:
+                    if lesson_start > slot_start:
+                        new_slots.append((free_from, lesson_start.strftime("%H:%M")))
+                    if lesson_end < slot_end:
+                        new_slots.append((lesson_end.strftime("%H:%M"), free_to))
+            slots = new_slots
+        result.append({"date": day_entry["date"], "slots": slots})
+    return result
+
+
+def as_platform_dict(item: ScheduleItem) -> dict:
+    def fmt(epoch):
+        return (datetime(1970, 1, 1) + timedelta(seconds=epoch)).strftime("%Y-%m-%dT%H:%M:%S")
+    return {"id": item.id, "date": fmt(item.start), "endDate": fmt(item.end)}
+
+
+def main(teachers: int = 20, days: int = 365):
+    rng = random.Random(42)
+    data = {f"t{i}": synthetic_teacher(rng, days) for i in range(teachers)}
+    lessons = sum(len(items) for _, items in data.values())
+    print(f"{teachers} teachers x {days} days, {lessons} lessons\n")
+
+    legacy_teachers = min(teachers, 2)
+    raw = {key: (schedule_input, [as_platform_dict(item) for item in items])
+           for key, (schedule_input, items) in list(data.items())[:legacy_teachers]}
+    started = time.perf_counter()
+    for schedule_input, items in raw.values():
+        legacy_free_slots(schedule_input, items, days)
+    legacy = (time.perf_counter() - started) / legacy_teachers
+    print(f"{'legacy loop':<22}{legacy * 1000:>10.1f} ms / teacher")
+
+    started = time.perf_counter()
+    free = free_slots_many(data, START, days)
+    engine = (time.perf_counter() - started) / teachers
+    print(f"{'interval engine':<22}{engine * 1000:>10.1f} ms / teacher   x{legacy / engine:.0f}")
+
+    started = time.perf_counter()
+    for _, items in data.values():
+        ScheduleIndex(items)
+    index = (time.perf_counter() - started) / teachers
+    print(f"{'ScheduleIndex build':<22}{index * 1000:>10.1f} ms / teacher")
+
+    started = time.perf_counter()
+    common = common_free(free.values())
+    print(f"{'common free (all)':<22}{(time.perf_counter() - started) * 1000:>10.1f} ms"
+          f"   {len(common)} intervals")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
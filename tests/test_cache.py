@@ -0,0 +1,59 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from uuid import UUID
+
+from app.Services.LeeearnService.PlatformClient.cache import ResponseCache
+from app.Services.LeeearnService.PlatformClient.utils import PlatformResponse
+
+CLIENT = SimpleNamespace(api_id="api")
+BRANCH = "0f8fad5b-d9cb-469f-a165-70867728950e"
+READ = "/CompanyBranchGroup/GetDetails"
+WRITE = "/CompanyBranchGroup/Update"
+
+
+def response(value) -> PlatformResponse:
+    return PlatformResponse.from_parts(
+        json.dumps({"data": value}).encode(), 200, "OK",
+        {"Content-Type": "application/json; charset=utf-8"}
+    )
+
+
+def test_branch_id_forms_share_one_scope():
+    async def run():
+        cache, sent = ResponseCache(), []
+
+        async def send(endpoint, body):
+            sent.append(endpoint)
+            return response(len(sent))
+
+        read = {"companyBranchId": BRANCH.upper(), "groupId": "g"}
+        await cache.fetch(CLIENT, READ, read, send)
+        await cache.fetch(CLIENT, WRITE, {"companyBranchId": UUID(BRANCH), "groupId": "g"}, send)
+        await cache.fetch(CLIENT, READ, read, send)
+        return sent
+
+    assert asyncio.run(run()) == [READ, WRITE, READ]
+
+
+def test_read_in_flight_during_a_mutation_is_not_cached():
+    async def run():
+        cache, sent = ResponseCache(), []
+        release = asyncio.Event()
+
+        async def send(endpoint, body):
+            sent.append(endpoint)
+            if endpoint == READ and len(sent) == 1:
+                await release.wait()
+            return response(len(sent))
+
+        body = {"companyBranchId": BRANCH, "groupId": "g"}
+        read = asyncio.ensure_future(cache.fetch(CLIENT, READ, body, send))
+        await asyncio.sleep(0)
+        await cache.fetch(CLIENT, WRITE, body, send)
+        release.set()
+        await read
+        await cache.fetch(CLIENT, READ, body, send)
+        return sent
+
+    assert asyncio.run(run()) == [READ, WRITE, READ]
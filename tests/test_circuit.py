@@ -0,0 +1,112 @@
+import asyncio
+import json
+
+from app.Services.LeeearnService.PlatformClient import PlatformClient
+from app.Services.LeeearnService.PlatformClient.cache import ResponseCache
+from app.Services.LeeearnService.PlatformClient.circuit import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+)
+from app.Services.LeeearnService.PlatformClient.transport import BaseTransport
+from app.Services.LeeearnService.PlatformClient.utils import PlatformResponse, request_key
+
+BRANCH = "0f8fad5b-d9cb-469f-a165-70867728950e"
+FAMILY = "/CompanyBranchGroup"
+READ = f"{FAMILY}/GetDetails"
+BODY = {"companyBranchId": BRANCH, "groupId": "g"}
+
+
+def open_breaker(open_seconds: float = 0.05) -> CircuitBreaker:
+    breaker = CircuitBreaker(min_requests=2, open_seconds=open_seconds)
+    breaker.record(FAMILY, False)
+    breaker.record(FAMILY, False)
+    assert breaker.state(FAMILY) == OPEN
+    return breaker
+
+
+def test_half_open_lets_exactly_one_probe_through():
+    async def run():
+        breaker = open_breaker()
+        assert not breaker.allow(FAMILY)
+
+        await asyncio.sleep(0.06)
+        admitted = [breaker.allow(FAMILY) for _ in range(3)]
+        assert breaker.state(FAMILY) == HALF_OPEN
+
+        # A probe that ended without an outcome frees the slot for another.
+        breaker.release(FAMILY)
+        assert breaker.allow(FAMILY)
+        assert not breaker.allow(FAMILY)
+
+        breaker.record(FAMILY, True)
+        return breaker, admitted
+
+    breaker, admitted = asyncio.run(run())
+    assert admitted == [True, False, False]
+    assert breaker.state(FAMILY) == CLOSED
+    assert breaker.allow(FAMILY)
+
+
+def test_failed_probe_reopens_the_circuit():
+    async def run():
+        breaker = open_breaker()
+        await asyncio.sleep(0.06)
+        assert breaker.allow(FAMILY)
+        breaker.record(FAMILY, False)
+        return breaker
+
+    breaker = asyncio.run(run())
+    assert breaker.state(FAMILY) == OPEN
+    assert not breaker.allow(FAMILY)
+    assert breaker.stats()["circuits"][FAMILY]["opened"] == 2
+
+
+class Platform(BaseTransport):
+    """Answers with ``status`` and the current ``version`` as the payload."""
+
+    def __init__(self):
+        self.status = 200
+        self.version = 1
+        self.calls = 0
+
+    async def request(self, client, endpoint, body=None, *, method="POST", timeout=30.0):
+        self.calls += 1
+        return PlatformResponse.from_parts(
+            json.dumps({"data": {"version": self.version}}).encode(), self.status, "",
+            {"Content-Type": "application/json; charset=utf-8"}
+        )
+
+
+def test_open_circuit_serves_stale_reads_and_probes_in_the_background():
+    async def run():
+        platform = Platform()
+        client = PlatformClient(
+            "https://platform.test", BRANCH, "token", transport=platform,
+            cache=ResponseCache(ttls={READ: 0}),
+            breaker=CircuitBreaker(min_requests=2, open_seconds=0.05)
+        )
+        assert (await client.send_request(READ, BODY)).data() == {"version": 1}
+
+        platform.status = 500
+        await client.send_request(READ, BODY)
+        assert client.breaker.state(FAMILY) == OPEN
+
+        # Refused without touching the network: the last good read, marked stale.
+        calls = platform.calls
+        stale = [await client.send_request(READ, BODY) for _ in range(3)]
+        assert platform.calls == calls
+
+        platform.status, platform.version = 200, 2
+        await asyncio.sleep(0.1)
+        fresh = client.cache.get_stale(request_key(client, READ, BODY))
+        await client.close()
+        return client, platform, calls, stale, fresh
+
+    client, platform, calls, stale, fresh = asyncio.run(run())
+    assert all(response.stale and response.data() == {"version": 1} for response in stale)
+    # One background revalidation was the half-open probe.
+    assert platform.calls == calls + 1
+    assert client.breaker.state(FAMILY) == CLOSED
+    assert fresh.data() == {"version": 2} and not fresh.stale
@@ -0,0 +1,104 @@
+import asyncio
+import json
+
+import pytest
+
+from app.Services.LeeearnService.PlatformClient.pagination import fetch_windows, iterate
+from app.Services.LeeearnService.PlatformClient.utils import PlatformResponse
+
+ITEMS = [{"id": i} for i in range(23)]
+
+
+class Listing:
+    """
+    A list endpoint returning at most ``cap`` items per request. ``count``
+    is what it reports as ``data.count``: "total", "page" (the page size
+    echoed back) or None. With ``later_first`` concurrent requests for later
+    offsets are answered first.
+    """
+
+    def __init__(self, cap: int = 100, count: str | None = "total",
+                 ignore_offset: bool = False, later_first: bool = False):
+        self.cap = cap
+        self.count = count
+        self.ignore_offset = ignore_offset
+        self.later_first = later_first
+        self.offsets = []
+
+    async def __call__(self, query: dict) -> PlatformResponse:
+        self.offsets.append(query["Offset"])
+        for _ in range(len(ITEMS) + 1 - query["Offset"] if self.later_first else 1):
+            await asyncio.sleep(0)
+        offset = 0 if self.ignore_offset else query["Offset"]
+        page = ITEMS[offset:offset + min(query["Count"], self.cap)]
+        data = {"data": page}
+        if self.count == "total":
+            data["count"] = len(ITEMS)
+        elif self.count == "page":
+            data["count"] = len(page)
+        return PlatformResponse.from_parts(
+            json.dumps({"data": data}).encode(), 200, "OK",
+            {"Content-Type": "application/json; charset=utf-8"}
+        )
+
+
+def collect(fetch, **options) -> list:
+    async def run():
+        return [item async for item in iterate(fetch, **options)]
+
+    return asyncio.run(run())
+
+
+def test_capped_pages_are_followed_up_to_the_total():
+    assert collect(Listing(cap=4), page_size=10) == ITEMS
+    assert asyncio.run(fetch_windows(Listing(cap=4), window=10)) == ITEMS
+
+
+def test_short_page_without_total_ends_the_listing():
+    uncounted = Listing(count=None)
+    assert collect(uncounted, page_size=10) == ITEMS
+    assert uncounted.offsets == [0, 10, 20]
+
+    windows = Listing(count=None)
+    assert asyncio.run(fetch_windows(windows, window=5, concurrency=2)) == ITEMS
+
+    assert collect(Listing(cap=4, count=None), page_size=10) == ITEMS[:4]
+
+
+def test_total_count_avoids_the_trailing_request():
+    counted = Listing()
+    assert collect(counted, page_size=10) == ITEMS
+    assert counted.offsets == [0, 10, 20]
+
+    windows = Listing()
+    assert asyncio.run(fetch_windows(windows, window=5, concurrency=1)) == ITEMS
+    assert max(windows.offsets) < len(ITEMS)
+
+
+def test_count_echoing_the_page_size_is_not_taken_as_the_total():
+    assert collect(Listing(count="page"), page_size=10) == ITEMS
+    assert asyncio.run(fetch_windows(Listing(count="page"), window=10)) == ITEMS
+
+
+def test_server_ignoring_offset_does_not_loop_forever():
+    for count in (None, "page"):
+        assert collect(Listing(count=count, ignore_offset=True), page_size=10) == ITEMS[:10]
+        for later_first in (False, True):
+            assert asyncio.run(fetch_windows(
+                Listing(count=count, ignore_offset=True, later_first=later_first),
+                window=10
+            )) == ITEMS[:10]
+
+
+def test_max_pages_is_a_hard_bound():
+    with pytest.raises(ValueError):
+        collect(Listing(), page_size=2, max_pages=3)
+    with pytest.raises(ValueError):
+        asyncio.run(fetch_windows(Listing(), window=2, max_pages=3))
+
+
+def test_limit_is_respected():
+    assert collect(Listing(cap=4), page_size=10, limit=7) == ITEMS[:7]
+    assert asyncio.run(
+        fetch_windows(Listing(cap=4), {"Offset": 5}, window=10, limit=9)
+    ) == ITEMS[5:14]
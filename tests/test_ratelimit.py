@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+from app.Services.LeeearnService.PlatformClient.ratelimit import Priority, RateLimiter
+
+
+def test_throttling_backs_off_multiplicatively_and_recovers_additively():
+    limiter = RateLimiter(rate=8.0, burst=4, min_rate=1.0, increase=4.0, decrease=0.5)
+
+    limiter.feedback(429)
+    assert limiter.rate == 4.0
+    limiter.feedback(503)
+    limiter.feedback(429)
+    limiter.feedback(429)
+    assert limiter.rate == 1.0
+    assert limiter.throttled == 4
+
+    rates = []
+    while limiter.rate < limiter.max_rate:
+        limiter.feedback(200)
+        rates.append(limiter.rate)
+    # Each success adds increase / rate: fast from the floor, slower near the top.
+    assert rates[:2] == [5.0, 5.8]
+    assert rates == sorted(rates)
+    assert limiter.rate == 8.0
+
+    limiter.feedback(200)
+    assert limiter.rate == 8.0
+
+
+def test_retry_after_blocks_until_it_passes():
+    async def run():
+        limiter = RateLimiter(rate=100.0, burst=10)
+        await limiter.acquire()
+
+        limiter.feedback(429, {"retry-after": "0.2"})
+        started = time.monotonic()
+        await limiter.acquire()
+        return limiter, time.monotonic() - started
+
+    limiter, waited = asyncio.run(run())
+    assert waited >= 0.2
+    assert limiter.rate == 50.0
+    assert limiter.waited == 1
+
+
+def test_interactive_goes_first_without_starving_background():
+    async def run():
+        limiter = RateLimiter(rate=200.0, burst=1, interactive_streak=2)
+        await limiter.acquire()
+        order = []
+
+        async def request(name, priority):
+            await limiter.acquire(priority)
+            order.append(name)
+
+        await asyncio.gather(
+            *(request(f"b{i}", Priority.BACKGROUND) for i in range(2)),
+            *(request(f"i{i}", Priority.INTERACTIVE) for i in range(5)),
+        )
+        return order
+
+    assert asyncio.run(run()) == ["i0", "i1", "b0", "i2", "i3", "b1", "i4"]
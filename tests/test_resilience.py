@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from app.Services.LeeearnService.PlatformClient.resilience import ResiliencePolicy
+from app.Services.LeeearnService.PlatformClient.utils import PlatformResponse
+
+READ = "/CompanyBranchGroup/GetDetails"
+WRITE = "/CompanyBranchGroup/Update"
+
+
+def response(status: int = 200) -> PlatformResponse:
+    return PlatformResponse.from_parts(b"{}", status, "", {})
+
+
+def hedging_policy() -> ResiliencePolicy:
+    policy = ResiliencePolicy(hedge=True, hedge_min_delay=0.05, hedge_min_samples=5)
+    for _ in range(5):
+        policy.record(READ, 0.01)
+    return policy
+
+
+class Attempts:
+    """Attempt factory answering after the n-th delay; records cancellations."""
+
+    def __init__(self, *delays: float):
+        self.delays = list(delays)
+        self.started = 0
+        self.cancelled = []
+
+    async def __call__(self, timeout: float) -> PlatformResponse:
+        number = self.started
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delays[number])
+        except asyncio.CancelledError:
+            self.cancelled.append(number)
+            raise
+        return PlatformResponse.from_parts(str(number).encode(), 200, "", {})
+
+
+async def settle():
+    # Let cancelled attempts run their except blocks.
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def test_hedge_wins_and_cancels_the_slow_primary():
+    async def run():
+        policy, attempts = hedging_policy(), Attempts(5.0, 0.01)
+        result = await policy.execute(READ, attempts)
+        await settle()
+        return policy, attempts, result
+
+    policy, attempts, result = asyncio.run(run())
+    assert result.bytes() == b"1"
+    assert attempts.cancelled == [0]
+    assert (policy.hedges, policy.hedges_won) == (1, 1)
+
+
+def test_primary_answering_first_cancels_the_hedge():
+    async def run():
+        policy, attempts = hedging_policy(), Attempts(0.1, 5.0)
+        result = await policy.execute(READ, attempts)
+        await settle()
+        return policy, attempts, result
+
+    policy, attempts, result = asyncio.run(run())
+    assert result.bytes() == b"0"
+    assert attempts.cancelled == [1]
+    assert (policy.hedges, policy.hedges_won) == (1, 0)
+
+
+def test_fast_reads_are_not_hedged():
+    async def run():
+        policy, attempts = hedging_policy(), Attempts(0.0)
+        return policy, attempts, await policy.execute(READ, attempts)
+
+    policy, attempts, result = asyncio.run(run())
+    assert result.bytes() == b"0"
+    assert attempts.started == 1
+    assert policy.hedges == 0
+
+
+def test_reads_retry_gateway_errors_and_mutations_do_not():
+    statuses = []
+
+    async def attempt(timeout):
+        statuses.append(502 if len(statuses) < 2 else 200)
+        return response(statuses[-1])
+
+    policy = ResiliencePolicy(base_delay=0.001, max_delay=0.002)
+    assert asyncio.run(policy.execute(READ, attempt)).status == 200
+    assert statuses == [502, 502, 200]
+
+    statuses.clear()
+    assert asyncio.run(policy.execute(WRITE, attempt)).status == 502
+    assert statuses == [502]
+
+
+def test_read_errors_surface_after_the_last_retry():
+    async def attempt(timeout):
+        raise asyncio.TimeoutError
+
+    policy = ResiliencePolicy(read_retries=1, base_delay=0.001, max_delay=0.002)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(policy.execute(READ, attempt))
+    assert (policy.retries, policy.failures) == (1, 1)
@@ -0,0 +1,86 @@
+import asyncio
+from datetime import date, datetime, timedelta
+
+from app.Services.LeeearnService.PlatformClient.schedule import (
+    ScheduleItem,
+    in_window,
+    local_epoch,
+)
+from app.Services.LeeearnService.PlatformClient.schedule_index import ScheduleIndexCache
+
+KEY = ("teacher", "branch", "teacher-1")
+
+
+def lesson(day: int, name: str = "Lesson") -> ScheduleItem:
+    start = local_epoch(datetime(2025, 1, 1, 10) + timedelta(days=day))
+    return ScheduleItem(str(day), "group", "lesson", name, start, start + 1800)
+
+
+class Schedule:
+    """One lesson a day through January; records every loaded window."""
+
+    def __init__(self):
+        self.items = [lesson(day) for day in range(31)]
+        self.loads = []
+
+    async def __call__(self, date_from, date_to):
+        self.loads.append((date_from, date_to))
+        return in_window(self.items, date_from, date_to)
+
+
+def ids(index) -> list[str]:
+    return [item.id for item in index]
+
+
+def test_one_index_per_owner_sliced_by_window():
+    async def run():
+        cache, schedule = ScheduleIndexCache(), Schedule()
+
+        week = await cache.get(KEY, schedule, date(2025, 1, 1), date(2025, 1, 8))
+        day = await cache.get(KEY, schedule, date(2025, 1, 3), date(2025, 1, 4))
+        # A window reaching past the loaded range only loads the missing part.
+        fortnight = await cache.get(KEY, schedule, date(2025, 1, 5), date(2025, 1, 15))
+        return cache, schedule, week, day, fortnight
+
+    cache, schedule, week, day, fortnight = asyncio.run(run())
+    assert ids(week) == [str(day) for day in range(7)]
+    assert ids(day) == ["2"]
+    assert ids(fortnight) == [str(day) for day in range(4, 14)]
+    assert schedule.loads == [
+        (datetime(2025, 1, 1), datetime(2025, 1, 8)),
+        (datetime(2025, 1, 8), datetime(2025, 1, 15)),
+    ]
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_stale_window_refreshes_only_itself():
+    async def run():
+        cache, schedule = ScheduleIndexCache(ttl=0), Schedule()
+        await cache.get(KEY, schedule, date(2025, 1, 1), date(2025, 1, 15))
+
+        schedule.items[2] = lesson(2, "Moved")
+        stale = await cache.get(KEY, schedule, date(2025, 1, 3), date(2025, 1, 4))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        fresh = await cache.get(KEY, schedule, date(2025, 1, 1), date(2025, 1, 15))
+        return cache, schedule, stale, fresh
+
+    cache, schedule, stale, fresh = asyncio.run(run())
+    assert stale.by_id("2").lesson_name == "Lesson"
+    assert fresh.by_id("2").lesson_name == "Moved"
+    assert ids(fresh) == [str(day) for day in range(14)]
+    assert schedule.loads[1] == (datetime(2025, 1, 3), datetime(2025, 1, 4))
+    assert cache.stats()["stale_hits"] == 2
+
+
+def test_invalidation_drops_the_owner_index():
+    async def run():
+        cache, schedule = ScheduleIndexCache(), Schedule()
+        await cache.get(KEY, schedule, date(2025, 1, 1), date(2025, 1, 8))
+        cache.invalidate("branch")
+        await cache.get(KEY, schedule, date(2025, 1, 1), date(2025, 1, 8))
+        return schedule
+
+    schedule = asyncio.run(run())
+    assert len(schedule.loads) == 2
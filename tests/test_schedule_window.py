@@ -0,0 +1,73 @@
+import asyncio
+import json
+from datetime import date
+
+from app.Services.LeeearnService.PlatformClient.schedule import (
+    WindowPushdown,
+    fetch_schedule_window,
+    scan_window,
+)
+from app.Services.LeeearnService.PlatformClient.utils import PlatformResponse
+
+# One lesson a day through 2025 (platform time, UTC).
+LESSONS = [{"id": str(day), "date": f"2025-{1 + day // 28:02d}-{1 + day % 28:02d}T08:00:00"}
+           for day in range(12 * 28)]
+ENDPOINT = "/CompanyBranchTeacher/GetScheduleItemList"
+
+
+class ScheduleList:
+    """GetScheduleItemList honouring date orders and, unless ``broken``, ranges."""
+
+    def __init__(self, broken: bool = False):
+        self.broken = broken
+        self.sent = 0
+        self.filtered = 0
+
+    async def __call__(self, query: dict) -> PlatformResponse:
+        filters = [prop for group in query.get("FilterQuery") or []
+                   for prop in group["Properties"]]
+        selected = LESSONS
+        if filters:
+            self.filtered += 1
+            selected = [] if self.broken else [
+                lesson for lesson in LESSONS
+                if all(lesson["date"] >= prop["Value"] if prop["CompareType"] == 3
+                       else lesson["date"] < prop["Value"] for prop in filters)
+            ]
+        for group in query.get("OrderQuery") or []:
+            for prop in group["Properties"]:
+                selected = sorted(selected, key=lambda lesson: lesson["date"],
+                                  reverse=not prop["Asc"])
+
+        page = selected[query["Offset"]:query["Offset"] + min(query["Count"], 50)]
+        self.sent += len(page)
+        return PlatformResponse.from_parts(
+            json.dumps({"data": {"data": page, "count": len(selected)}}).encode(),
+            200, "OK", {"Content-Type": "application/json; charset=utf-8"}
+        )
+
+
+def test_scan_stops_below_the_window_instead_of_reading_the_history():
+    fetch = ScheduleList()
+    items = asyncio.run(scan_window(fetch, date(2025, 11, 2), date(2025, 11, 5)))
+
+    assert [item.id for item in items] == ["281", "282", "283"]
+    assert fetch.sent < len(LESSONS) // 2
+
+
+def test_empty_windows_do_not_verify_a_broken_filter():
+    pushdown = WindowPushdown(enabled=True)
+    fetch = ScheduleList(broken=True)
+
+    async def window(day_from, day_to):
+        return await fetch_schedule_window(fetch, day_from, day_to,
+                                           pushdown=pushdown, endpoint=ENDPOINT)
+
+    # No lessons in 2026: both results are empty, which proves nothing.
+    assert asyncio.run(window(date(2026, 1, 2), date(2026, 1, 5))) == ()
+    assert pushdown.mode(ENDPOINT) is None
+
+    items = asyncio.run(window(date(2025, 11, 2), date(2025, 11, 5)))
+    assert [item.id for item in items] == ["281", "282", "283"]
+    assert pushdown.mode(ENDPOINT) is False
+    assert pushdown.mismatches == 1
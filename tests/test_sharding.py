@@ -0,0 +1,214 @@
+import asyncio
+import fnmatch
+
+import pytest
+
+from app.Services.BotManagerService import Sharding
+from app.Services.BotManagerService.Sharding import LEASE_KEY, BotShardCoordinator
+
+TTL = 1.0
+INTERVAL = 0.3
+CONFIGS = [{"school_id": f"school-{i}"} for i in range(24)]
+
+
+class Clock:
+    """Stands in for the ``time`` module of Sharding and for Redis expiry."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class FakeRedis:
+    """The part of redis.asyncio.Redis the coordinator uses, with PX expiry."""
+
+    def __init__(self, clock: Clock):
+        self.clock = clock
+        self.values: dict[str, tuple[str, float | None]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    def live(self, key: str):
+        value = self.values.get(key)
+        if value is not None and value[1] is not None and value[1] <= self.clock.now:
+            del self.values[key]
+            value = None
+        return None if value is None else value[0]
+
+    def set_now(self, key, value, nx=False, px=None):
+        if nx and self.live(key) is not None:
+            return None
+        self.values[key] = (value, None if px is None else self.clock.now + px / 1000)
+        return True
+
+    async def get(self, key):
+        return self.live(key)
+
+    async def mget(self, keys):
+        return [self.live(key) for key in keys]
+
+    async def scan_iter(self, match):
+        for key in list(self.values):
+            if fnmatch.fnmatch(key, match) and self.live(key) is not None:
+                yield key
+
+    async def zrem(self, key, member):
+        self.zsets.get(key, {}).pop(member, None)
+
+    def register_script(self, source: str):
+        renew = "pexpire" in source
+
+        def run_now(keys, args):
+            if self.live(keys[0]) != args[0]:
+                return 0
+            if renew:
+                self.values[keys[0]] = (args[0], self.clock.now + int(args[1]) / 1000)
+            else:
+                del self.values[keys[0]]
+            return 1
+
+        async def script(keys, args, client=None):
+            if client is not None:
+                client.ops.append(lambda: run_now(keys, args))
+                return client
+            return run_now(keys, args)
+
+        return script
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    def zadd(self, key, mapping):
+        self.ops.append(lambda: self.redis.zsets.setdefault(key, {}).update(mapping))
+
+    def zremrangebyscore(self, key, low, high):
+        def run():
+            members = self.redis.zsets.get(key, {})
+            for member in [m for m, score in members.items() if score <= high]:
+                del members[member]
+        self.ops.append(run)
+
+    def zrange(self, key, start, stop):
+        self.ops.append(lambda: sorted(self.redis.zsets.get(key, {})))
+
+    def set(self, key, value, nx=False, px=None):
+        self.ops.append(lambda: self.redis.set_now(key, value, nx=nx, px=px))
+
+    async def execute(self):
+        return [op() for op in self.ops]
+
+
+class FakeManager:
+    """Records every bot start so double starts across shards are visible."""
+
+    def __init__(self, starts: list):
+        self.running_bots = {}
+        self.starts = starts
+
+    async def start_bot(self, config):
+        self.starts.append(config["school_id"])
+        self.running_bots[config["school_id"]] = {
+            "task": asyncio.get_running_loop().create_future(), "config": config,
+        }
+
+    async def stop_bot(self, school_id):
+        self.running_bots.pop(school_id, None)
+
+    async def restart_bot(self, config):
+        await self.start_bot(config)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(Sharding, "time", clock)
+    return clock
+
+
+def coordinator(redis, starts, shard_id):
+    async def load_configs():
+        return [dict(config) for config in CONFIGS]
+
+    return BotShardCoordinator(FakeManager(starts), redis, load_configs,
+                               shard_id=shard_id, lease_ttl=TTL, interval=INTERVAL)
+
+
+async def steps(clock, shards, count):
+    for _ in range(count):
+        for shard in shards:
+            await shard.reconcile()
+        clock.now += INTERVAL
+
+
+def test_cold_start_claims_each_bot_once(clock):
+    async def run():
+        redis, starts = FakeRedis(clock), []
+        shards = [coordinator(redis, starts, f"w{i}") for i in range(3)]
+
+        await steps(clock, shards, 1)
+        assert not any(shard.leases for shard in shards)
+
+        await steps(clock, shards, 5)
+        return shards, starts
+
+    shards, starts = asyncio.run(run())
+    assert sorted(starts) == sorted(config["school_id"] for config in CONFIGS)
+    assert all(shard.leases for shard in shards)
+    assert sum(shard.released for shard in shards) == 0
+
+
+def test_leases_are_renewed_and_expire_with_their_shard(clock):
+    async def run():
+        redis, starts = FakeRedis(clock), []
+        first = coordinator(redis, starts, "w0")
+        await steps(clock, [first], 5)
+        assert len(first.leases) == len(CONFIGS)
+
+        # Renewed past several TTLs while the shard keeps running.
+        await steps(clock, [first], 10)
+        assert len(first.leases) == len(CONFIGS)
+        assert await redis.get(LEASE_KEY.format(school_id="school-0")) == "w0"
+
+        # The shard dies without releasing; its leases expire after one TTL
+        # and a new shard takes them once it has settled.
+        second = coordinator(redis, starts, "w1")
+        await steps(clock, [second], 1)
+        assert not second.leases
+        await steps(clock, [second], 5)
+        return second
+
+    second = asyncio.run(run())
+    assert len(second.leases) == len(CONFIGS)
+    assert second.claimed == len(CONFIGS)
+
+
+def test_lost_lease_stops_the_bot(clock):
+    async def run():
+        redis, starts = FakeRedis(clock), []
+        shard = coordinator(redis, starts, "w0")
+        await steps(clock, [shard], 5)
+
+        redis.set_now(LEASE_KEY.format(school_id="school-3"), "w9", px=int(TTL * 1000))
+        await shard.reconcile()
+        return shard
+
+    shard = asyncio.run(run())
+    assert shard.lost == 1
+    assert "school-3" not in shard.leases
+    assert "school-3" not in shard.manager.running_bots
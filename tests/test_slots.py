@@ -0,0 +1,46 @@
+from datetime import date
+
+from app.Services.LeeearnService.PlatformClient.slots import (
+    MINUTES_PER_DAY,
+    Intervals,
+    day_number,
+    parse_clock,
+    weekly_hours,
+)
+
+MONDAY = date(2025, 10, 6)
+
+
+def minutes(day: date, clock: str) -> int:
+    return day_number(day) * MINUTES_PER_DAY + parse_clock(clock)
+
+
+def test_interval_ending_at_midnight_is_24_00_and_round_trips():
+    tuesday = date(2025, 10, 7)
+    intervals = Intervals.from_pairs([(minutes(MONDAY, "22:00"), minutes(tuesday, "00:00")),
+                                      (minutes(tuesday, "23:30"), minutes(tuesday, "23:30") + 90)])
+
+    days = intervals.by_day()
+
+    assert days == {
+        MONDAY: [("22:00", "24:00")],
+        tuesday: [("23:30", "24:00")],
+        date(2025, 10, 8): [("00:00", "01:00")],
+    }
+    rebuilt = Intervals.from_pairs(
+        (day_number(day) * MINUTES_PER_DAY + parse_clock(start),
+         day_number(day) * MINUTES_PER_DAY + parse_clock(end))
+        for day, slots in days.items() for start, end in slots
+    )
+    assert rebuilt == intervals
+
+
+def test_hours_ending_at_00_00_run_to_midnight():
+    hours = weekly_hours([{"day": 0, "from": "22:00", "to": "00:00"},
+                          {"day": 1, "from": "00:00", "to": "00:00"}], MONDAY, 2)
+
+    assert hours.by_day() == {
+        MONDAY: [("22:00", "24:00")],
+        date(2025, 10, 7): [("00:00", "24:00")],
+    }
+    assert all(start != end for slots in hours.by_day().values() for start, end in slots)
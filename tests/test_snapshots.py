@@ -0,0 +1,96 @@
+import asyncio
+import itertools
+import json
+
+from app.Services.LeeearnService.PlatformClient import (
+    Client,
+    QueryBuilder,
+    SnapshotStore,
+    evaluate,
+)
+from app.Services.LeeearnService.PlatformClient.transport import BaseTransport
+from app.Services.LeeearnService.PlatformClient.utils import PlatformResponse
+
+BRANCH = "00000000-0000-0000-0000-000000000001"
+ENDPOINT = "/CompanyBranchCourse/Get"
+
+DIRECTIONS = [{"id": 1, "name": "Music"}, {"id": 2, "name": "Art"}]
+COURSES = [{"id": i, "name": name, "direction": DIRECTIONS[i % 2]}
+           for i, name in enumerate(["Piano", "guitar", "Drawing", "violin", "Clay"])]
+
+
+def encode(items: list, total: int) -> dict:
+    """Reference-preserving JSON as the platform sends it ($id/$values/$ref)."""
+    ids = {}
+    counter = itertools.count(1)
+
+    def walk(value):
+        if isinstance(value, dict):
+            if id(value) in ids:
+                return {"$ref": ids[id(value)]}
+            ids[id(value)] = str(next(counter))
+            return {"$id": ids[id(value)], **{k: walk(v) for k, v in value.items()}}
+        if isinstance(value, list):
+            return {"$id": str(next(counter)), "$values": [walk(v) for v in value]}
+        return value
+
+    return {"data": {"data": walk(items), "count": total}, "success": True}
+
+
+class PlatformStub(BaseTransport):
+    def __init__(self):
+        self.calls = 0
+
+    async def request(self, client, endpoint, body=None, *, method="POST", timeout=30.0):
+        self.calls += 1
+        page, total = evaluate(COURSES, body["data"])
+        return PlatformResponse.from_parts(
+            json.dumps(encode(page, total)).encode(), 200, "OK",
+            {"Content-Type": "application/json; charset=utf-8"}
+        )
+
+
+def query_body(query: QueryBuilder) -> dict:
+    return {"companyBranchId": BRANCH, "data": query.build()}
+
+
+def test_local_answer_matches_network_answer():
+    async def run():
+        network = Client("https://h", BRANCH, "t", transport=PlatformStub())
+        local = Client("https://h", BRANCH, "t", transport=PlatformStub(),
+                       snapshots=SnapshotStore())
+
+        # Windows of 2: the snapshot is assembled from several responses.
+        await local.snapshots.refresh(ENDPOINT, {"companyBranchId": BRANCH},
+                                      local._fetch, window=2)
+        calls = local.transport.calls
+
+        for query in (QueryBuilder().set_count(100),
+                      QueryBuilder().filter("name", value="violin"),
+                      QueryBuilder().order("name", False).set_offset(1).set_count(3)):
+            expected = await network.send_request(ENDPOINT, query_body(query))
+            answer = await local.send_request(ENDPOINT, query_body(query))
+
+            assert answer.headers.get("X-Local-Snapshot") == "1"
+            assert "$values" in answer.json()["data"]["data"]
+            assert answer.data() == expected.data()
+
+        assert local.transport.calls == calls
+
+    asyncio.run(run())
+
+
+def test_captured_snapshot_answers_identical_query_byte_for_byte():
+    async def run():
+        client = Client("https://h", BRANCH, "t", transport=PlatformStub(),
+                        snapshots=SnapshotStore())
+        body = query_body(QueryBuilder().set_count(100))
+
+        expected = await client.send_request(ENDPOINT, body)
+        answer = await client.send_request(ENDPOINT, body)
+
+        assert client.transport.calls == 1
+        assert answer.headers.get("X-Local-Snapshot") == "1"
+        assert answer.json() == expected.json()
+
+    asyncio.run(run())